@@ -0,0 +1,41 @@
+"""
+Peak memory of outer-product style operations between intervals of shape (n,1) and (1,m), 
+computed with broadcasting or after materialising both operands to the full shape (n,m).
+
+`python -m benchmarks.bench_broadcast`
+"""
+import tracemalloc
+
+import numpy
+
+from intervals.number import Interval
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of, report)
+
+def peak_memory(fn) -> int:
+    tracemalloc.start()
+    fn()
+    _,peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def materialise(x:Interval, shape:tuple) -> Interval:
+    return Interval(numpy.broadcast_to(x.lo,shape).copy(), numpy.broadcast_to(x.hi,shape).copy())
+
+def run(n:int=2_000, m:int=2_000):
+    x = uniform_endpoints(shape=(n,1),left_bound=-1,right_bound=1)
+    y = uniform_endpoints(shape=(1,m),left_bound=0.1,right_bound=1)
+    ops = {'+':lambda a,b: a+b, '*':lambda a,b: a*b, '/':lambda a,b: a/b}
+    print(f'-- x.shape={x.shape}, y.shape={y.shape}')
+    for name,op in ops.items():
+        broadcast = lambda: op(x,y)
+        copied = lambda: op(materialise(x,(n,m)),materialise(y,(n,m)))
+        mb_broadcast, mb_copied = peak_memory(broadcast)/2**20, peak_memory(copied)/2**20
+        print(f'x {name} y   peak memory: broadcast {mb_broadcast:8.1f} MB, materialised {mb_copied:8.1f} MB, saved {mb_copied-mb_broadcast:8.1f} MB')
+        t_broadcast = best_of(broadcast, repeat=3)
+        report(f'x {name} y broadcast', t_broadcast, t_broadcast)
+        report(f'x {name} y materialised', best_of(copied, repeat=3), t_broadcast)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,57 @@
+"""
+Arithmetic of arrays of complex intervals with `ComplexIntervalArray`, against a loop over the scalar `ComplexInterval`.
+Then the speed and the tightness of the division: the tight mode against the naive formula and the subinterval division of ComplexInterval.
+
+`python -m benchmarks.bench_complex`
+"""
+import numpy
+
+from intervals.complex import (ComplexIntervalArray,divide_parts)
+
+from benchmarks.timing import (best_of,report)
+
+OPERATIONS = {'add': lambda a,b: a+b, 'multiply': lambda a,b: a*b, 'divide': lambda a,b: a/b}
+
+def run(legacy_max:int=10**5):
+    for n in (10**3,10**5,10**6):
+        lo_ = numpy.random.rand(n) + 1j*numpy.random.rand(n)
+        x = ComplexIntervalArray(lo_, lo_ + numpy.random.rand(n) + 1j*numpy.random.rand(n))
+        y = ComplexIntervalArray(lo_ + 1+1j, lo_ + 2+2j)
+        xs, ys = (x.tolist(), y.tolist()) if n <= legacy_max else (None, None)
+        print(f'-- {n} complex intervals')
+        for name, op in OPERATIONS.items():
+            t_legacy = None
+            if xs is not None:
+                t_legacy = best_of(lambda: [op(a,b) for a,b in zip(xs,ys)], repeat=1)
+                report(f'{name}, loop of ComplexInterval', t_legacy)
+            report(f'{name}, ComplexIntervalArray', best_of(lambda: op(x,y), repeat=3), t_legacy)
+        t_legacy = best_of(lambda: [a.absolute() for a in xs], repeat=1) if xs is not None else None
+        if t_legacy is not None: report('absolute, loop of ComplexInterval', t_legacy)
+        report('absolute, ComplexIntervalArray', best_of(lambda: x.absolute(), repeat=3), t_legacy)
+
+def excess(z, reference): # mean excess of the widths of the parts over those of the reference, relative
+    w = lambda x: (x.real.hi-x.real.lo) + (x.imag.hi-x.imag.lo)
+    return numpy.mean(w(z)/w(reference)) - 1
+
+def run_division(n:int=10**5, legacy_n:int=200, subintervals:int=30):
+    lo_ = 4*(numpy.random.rand(n) + 1j*numpy.random.rand(n)) - 2-2j
+    x = ComplexIntervalArray(lo_, lo_ + numpy.random.rand(n) + 1j*numpy.random.rand(n))
+    y = ComplexIntervalArray(0.5+numpy.random.rand(n) - 1j*numpy.random.rand(n), 2 + 1j*numpy.random.rand(n)) # straddles the real axis
+    print(f'-- division of {n} complex intervals, excess width over the tight division')
+    tight = x/y
+    t_tight = best_of(lambda: x/y, repeat=3)
+    naive = lambda: ComplexIntervalArray.fromparts(*divide_parts(x.real,x.imag,y.real,y.imag,mode='naive'))
+    print(f'naive, excess {excess(naive(),tight):.3f}')
+    report('naive', best_of(naive, repeat=3), t_tight)
+    report('tight', t_tight)
+    xs, ys = x[:legacy_n].tolist(), y[:legacy_n].tolist()
+    for xi in xs: xi.set_N_subi(subintervals)
+    t_legacy = best_of(lambda: [a/b for a,b in zip(xs,ys)], repeat=1) * n/legacy_n
+    q = [a/b for a,b in zip(xs,ys)]
+    legacy = ComplexIntervalArray([qi.lo() for qi in q],[qi.hi() for qi in q])
+    print(f'ComplexInterval, {subintervals}x{subintervals} subintervals, excess {excess(legacy,tight[:legacy_n]):.3f}, time extrapolated from {legacy_n}')
+    report(f'ComplexInterval, subintervals', t_legacy, t_tight)
+
+if __name__ == '__main__':
+    run()
+    run_division()
@@ -0,0 +1,28 @@
+"""
+Latency of operations on scalar intervals, where the classification of the operands dominates the arithmetic.
+
+Run it before and after a change to the dispatch to compare.
+
+`python -m benchmarks.bench_dispatch`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (lo,hi,width,mid,exp,is_Interval)
+
+from benchmarks.timing import best_of
+
+def run(number:int=100_000):
+    x, y = Interval(1.,2.), Interval(-3.,4.)
+    f, n, a = 2.5, numpy.float64(2.5), numpy.ones(())
+    cases = {'x + y':lambda: x + y, 'x * y':lambda: x * y, 'x / f':lambda: x / f, 'f - x':lambda: f - x,
+             'x * numpy.float64':lambda: x * n, 'x + 0-d ndarray':lambda: x + a, 'x ** 2':lambda: x ** 2, 
+             'x < y':lambda: x < y, 'is_Interval(x)':lambda: is_Interval(x), 'lo(x)':lambda: lo(x), 
+             'width(x)':lambda: width(x), 'mid(f)':lambda: mid(f), 'exp(x)':lambda: exp(x)}
+    print(f'-- scalar intervals, best of 5 x {number} calls')
+    for name,fn in cases.items():
+        t = best_of(fn, repeat=5, number=number)
+        print(f'{name:<24} {t*1e6:10.3f} us')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,24 @@
+"""
+Memory and time of the large-matrix benchmark of the README with float64, float32 and float16 endpoints.
+
+`python -m benchmarks.bench_dtype`
+"""
+import numpy
+
+from intervals.random import create_two_large_interval_matrices
+
+from benchmarks.timing import (best_of,report)
+
+def run(shape:tuple=(4_000,4_000)):
+    print(f'-- two interval matrices of shape {shape}')
+    reference = {}
+    for dtype in (numpy.float64,numpy.float32,numpy.float16):
+        x,y = create_two_large_interval_matrices(shape,dtype=dtype)
+        name = numpy.dtype(dtype).name
+        print(f'{name}: {(x.lo.nbytes+x.hi.nbytes)/2**20:.0f} MB per interval matrix')
+        for op,fn in [('x + y',lambda: x + y),('x * y',lambda: x * y),('x / (y+1)',lambda: x / (y+1)),('x.lo * y.lo',lambda: x.lo * y.lo)]:
+            t = best_of(fn, repeat=3)
+            report(f'{name} {op}', t, reference.setdefault(op,t))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,50 @@
+"""
+Throughput of the elementary functions on arrays of intervals. 
+
+Each function is compared with the same ufunc applied to the two endpoint arrays, which is the least any 
+interval kernel has to do, and is also timed on 10^4 scalar intervals in a loop.
+
+`python -m benchmarks.bench_elementary`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (log,log10,pow,arcsin,arccos,arctan,sinh,cosh,tanh,sqrt,exp)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of,report)
+
+FUNCTIONS = [ # function, ufunc, bounds of the inputs
+    (log,numpy.log,(0,10)),
+    (log10,numpy.log10,(0,10)),
+    (arcsin,numpy.arcsin,(-1,1)),
+    (arccos,numpy.arccos,(-1,1)),
+    (arctan,numpy.arctan,(-10,10)),
+    (sinh,numpy.sinh,(-10,10)),
+    (cosh,numpy.cosh,(-10,10)),
+    (tanh,numpy.tanh,(-10,10)),
+    (sqrt,numpy.sqrt,(0,10)),
+    (exp,numpy.exp,(-10,10)),
+]
+
+def run(n:int=1_000_000):
+    print(f'-- {n} intervals, against the ufunc on both endpoints')
+    for f,ufunc,(a,b) in FUNCTIONS:
+        x = uniform_endpoints(shape=(n,),left_bound=a,right_bound=b)
+        t_ufunc = best_of(lambda: (ufunc(x.lo),ufunc(x.hi)))
+        t = best_of(lambda: f(x))
+        report(f'{f.__name__:<8} {n/t/1e6:8.1f} M intervals/s', t, t_ufunc)
+    x = uniform_endpoints(shape=(n,),left_bound=0,right_bound=10)
+    y = uniform_endpoints(shape=(n,),left_bound=-2,right_bound=2)
+    t_ufunc = best_of(lambda: numpy.power(x.lo,y.lo))
+    for label,fn in [('x**2',lambda: x**2),('x**-3',lambda: x**-3),('x**0.5',lambda: x**0.5),('pow(x,y)',lambda: pow(x,y))]:
+        t = best_of(fn)
+        report(f'{label:<8} {n/t/1e6:8.1f} M intervals/s', t, t_ufunc)
+    print('-- 10^4 scalar intervals in a loop')
+    for f,ufunc,(a,b) in FUNCTIONS:
+        x = uniform_endpoints(shape=(10_000,),left_bound=a,right_bound=b)
+        scalars = [Interval(float(l),float(h)) for l,h in zip(x.lo,x.hi)]
+        report(f.__name__, best_of(lambda: [f(s) for s in scalars], repeat=3))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,42 @@
+"""
+Streaming evaluation of a function over a fine subpaving with `evaluate_subpaving`, against building the whole subpaving
+with `subintervalise` and evaluating it at once. Reports time and peak resident set size.
+
+The function is a polynomial in 6 variables, the box is split `cuts` times in each dimension.
+
+`python -m benchmarks.bench_evaluate`, or `python -m benchmarks.bench_evaluate 20` for the 64M boxes of 20 cuts.
+"""
+import sys
+
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (subintervalise,evaluate_subpaving,peak_rss,reset_peak_rss)
+
+from benchmarks.timing import (best_of,report)
+
+def f(b:Interval) -> Interval:
+    return b[:,0]*b[:,1] - b[:,2]*b[:,3] + b[:,4]*b[:,4] - b[:,5]
+
+def materialised(x:Interval, n:int) -> Interval:
+    y = f(subintervalise(x,n))
+    return Interval(numpy.min(y.lo),numpy.max(y.hi))
+
+def run(cuts:tuple=(8,12)):
+    x = Interval([-1.,0,1,-2,-1,0],[2.,1,3,-1,1,1])
+    for n in cuts:
+        print(f'-- d=6, {n} cuts per dimension, {n**6} boxes')
+        if n**6 <= 3*10**6:
+            reset_peak_rss()
+            t = best_of(lambda: materialised(x,n), repeat=1)
+            report(f'subintervalise + f, peak {peak_rss()/2**20:.0f} MB', t)
+        else: t = None
+        for chunk in (2**14,2**16,2**18):
+            h, r = evaluate_subpaving(f,x,n,chunk=chunk,report=True)
+            report(f'chunk {chunk}, peak {r["peak_rss"]/2**20:.0f} MB', r['seconds'], t)
+        h, r = evaluate_subpaving(f,x,n,memory=64*2**20,report=True)
+        report(f'memory 64 MB: chunk {r["chunk"]}, peak {r["peak_rss"]/2**20:.0f} MB', r['seconds'], t)
+        print(h)
+
+if __name__ == '__main__':
+    run(tuple(int(a) for a in sys.argv[1:]) or (8,12))
@@ -0,0 +1,37 @@
+"""
+Time and memory of the update `x = x + dx` against the in-place operators and the functional forms with `out`.
+
+The memory is reported as the peak number of arrays of the size of x allocated during one update,
+as traced by tracemalloc.
+
+`python -m benchmarks.bench_inplace`
+"""
+import operator
+import tracemalloc
+
+from intervals.number import Interval
+from intervals.methods import (add,multiply)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import best_of
+
+def arrays_allocated(fn, nbytes:int) -> float:
+    tracemalloc.start()
+    fn()
+    _,peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak/nbytes
+
+def run(n:int=1_000_000):
+    x = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    dx = uniform_endpoints(shape=(n,),left_bound=-1e-3,right_bound=1e-3)
+    nbytes = x.lo.nbytes
+    cases = {'x + dx':lambda: x + dx, 'x += dx':lambda: operator.iadd(x,dx), 'add(x,dx,out=x)':lambda: add(x,dx,out=x),
+             'x * dx':lambda: x * dx, 'x *= dx':lambda: operator.imul(x,dx), 'multiply(x,dx,out=x)':lambda: multiply(x,dx,out=x)}
+    print(f'-- shape {(n,)}, {nbytes/2**20:.1f} MB per endpoint array')
+    for name,fn in cases.items():
+        t = best_of(fn, repeat=5, number=10)
+        print(f'{name:<24} {t*1e3:10.3f} ms   arrays allocated (peak): {arrays_allocated(fn,nbytes):4.1f}')
+
+if __name__ == '__main__':
+    run()
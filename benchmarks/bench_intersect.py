@@ -0,0 +1,38 @@
+"""
+Scaling of `intersect_vector` with the number of boxes, against the former loop over the boxes of y.
+
+The boxes are placed at random in the unit cube, with sides of about n^(-1/d), so each box intersects a few others.
+The former loop is O(n*m) and is only timed up to 10^4 boxes.
+
+`python -m benchmarks.bench_intersect`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import intersect_vector
+from benchmarks import legacy_intersect
+
+from benchmarks.timing import (best_of,report)
+
+def boxes(n:int, d:int, rng) -> Interval:
+    lo = rng.uniform(0,1,(n,d))
+    return Interval(lo, lo + rng.uniform(0,2*n**(-1/d),(n,d)))
+
+def run(sizes:tuple=(10**3,10**4,10**5,10**6), loop_max:int=10**4):
+    rng = numpy.random.default_rng(0)
+    for d in (1,2,3):
+        print(f'-- boxes of dimension {d}, n = m')
+        for n in sizes:
+            x, y = boxes(n,d,rng), boxes(n,d,rng)
+            repeat = 3 if n < 10**6 else 1
+            t = best_of(lambda: intersect_vector(x,y), repeat=repeat)
+            if n <= loop_max: 
+                t_loop = best_of(lambda: legacy_intersect.intersect_vector(x,y), repeat=1)
+                report(f'n={n:<8} loop', t_loop)
+                report(f'n={n:<8} sweep', t, t_loop)
+            else: report(f'n={n:<8} sweep', t)
+            j,i = intersect_vector(x,y,pairs=True)
+            report(f'n={n:<8} sweep, {len(j)} pairs', best_of(lambda: intersect_vector(x,y,pairs=True), repeat=repeat), t)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,32 @@
+"""
+The IntervalArray of intervals.complex as an adapter of intervals.number.Interval, against the former list-based class.
+
+`python -m benchmarks.bench_intervalarray`
+"""
+import numpy
+
+from intervals.complex import IntervalArray
+from benchmarks import legacy_intervalarray
+
+from benchmarks.timing import (best_of,report)
+
+def run():
+    for n in (10**3,10**5):
+        lo_ = numpy.random.rand(n)
+        lo_list, hi_list = lo_.tolist(), (lo_+1).tolist()
+        print(f'-- {n} intervals')
+        x_legacy, y_legacy = legacy_intervalarray.IntervalArray(lo_list,hi_list), legacy_intervalarray.IntervalArray(hi_list,[h+1 for h in hi_list])
+        x, y = IntervalArray(lo_list,hi_list), IntervalArray(hi_list,[h+1 for h in hi_list])
+        for label, fn, fn_legacy in (('construction from lists', lambda: IntervalArray(lo_list,hi_list), lambda: legacy_intervalarray.IntervalArray(lo_list,hi_list)),
+                                     ('len', lambda: len(x), lambda: len(x_legacy)),
+                                     ('add', lambda: x+y, lambda: x_legacy+y_legacy),
+                                     ('multiply', lambda: x*y, lambda: x_legacy*y_legacy),
+                                     ('divide', lambda: x/y, lambda: x_legacy/y_legacy),
+                                     ('toarray', lambda: x.toarray(), lambda: x_legacy.toarray()),
+                                     ('slider', lambda: x.slider(0.3), lambda: x_legacy.slider(0.3))):
+            t_legacy = best_of(fn_legacy, repeat=1 if n > 10**4 else 3)
+            report(f'{label}, list-based', t_legacy)
+            report(f'{label}, adapter', best_of(fn, repeat=5), t_legacy)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,35 @@
+"""
+Time of val, intervalise and element-wise operations under the storage layouts of Interval: 
+two separate arrays (default), one (2,...) buffer ('first') and one (...,2) buffer ('last').
+
+`python -m benchmarks.bench_layout`
+"""
+import operator
+
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (intervalise,exp,add)
+
+from benchmarks.timing import (best_of,report)
+
+def run(n:int=1_000_000):
+    data = numpy.sort(numpy.random.rand(n,2),axis=1) # (n,2) endpoints
+    x0 = Interval(data[:,0].copy(),data[:,1].copy())
+    y0 = Interval(data[:,0].copy()-1,data[:,1].copy()+1)
+    print(f'-- {n} intervals')
+    t = best_of(lambda: numpy.transpose(numpy.stack((data[:,0],data[:,1]))))
+    report('stack and transpose, as val did', t)
+    report('intervalise (n,2) + val', best_of(lambda: intervalise(data).val), t)
+    report('intervalise (2,n) + val', best_of(lambda: intervalise(data.T).val), t)
+    for layout in (None,'first','last'):
+        x, y = Interval(x0.lo,x0.hi,layout=layout), Interval(y0.lo,y0.hi,layout=layout)
+        print(f'-- layout {layout}')
+        report('val', best_of(lambda: x.val))
+        report('x + y', best_of(lambda: x + y))
+        report('x * y', best_of(lambda: x * y))
+        report('exp(x)', best_of(lambda: exp(x)))
+        report('x += y', best_of(lambda: operator.iadd(x,y)))
+
+if __name__ == '__main__':
+    run()
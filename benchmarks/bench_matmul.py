@@ -0,0 +1,28 @@
+"""
+Compares the exact and midpoint-radius interval matrix products against the ndarray matmul of the same size.
+
+`python -m benchmarks.bench_matmul`
+"""
+import numpy
+
+from intervals.arithmetic import matmul
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of, report)
+
+def run(sizes:tuple=(100,300,1_000)):
+    for n in sizes:
+        x = uniform_endpoints(shape=(n,n),left_bound=-1,right_bound=1)
+        y = uniform_endpoints(shape=(n,n),left_bound=-1,right_bound=1)
+        a = numpy.random.rand(n,n)
+        print(f'-- shape {(n,n)}')
+        t_ref = best_of(lambda: x.lo @ y.lo, repeat=3)
+        report('ndarray @ ndarray', t_ref, t_ref)
+        report('Interval @ Interval, midrad', best_of(lambda: matmul(x,y,mode='midrad'), repeat=3), t_ref)
+        report('Interval @ ndarray, exact', best_of(lambda: matmul(x,a,mode='exact'), repeat=3), t_ref)
+        report('Interval @ Interval, exact', best_of(lambda: matmul(x,y,mode='exact'), repeat=1), t_ref)
+        z_exact, z_midrad = matmul(x,y,mode='exact'), matmul(x,y,mode='midrad')
+        print(f'mean width midrad/exact: {numpy.mean(z_midrad[1]-z_midrad[0])/numpy.mean(z_exact[1]-z_exact[0]):.3f}')
+
+if __name__ == '__main__':
+    run()
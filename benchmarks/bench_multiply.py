@@ -0,0 +1,27 @@
+"""
+Compares the multiplication engines of `intervals.arithmetic` ('minmax' and 'mask'),
+using the ndarray product of the left endpoints as a reference.
+
+`python -m benchmarks.bench_multiply`
+"""
+from intervals.number import Interval
+from intervals.arithmetic import multiply
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of, report)
+
+def run(n:int=2_000):
+    a = uniform_endpoints(n=1,left_bound=-1,right_bound=1)
+    b = uniform_endpoints(n=1,left_bound=-1,right_bound=1)
+    x = uniform_endpoints(shape=(n,n),left_bound=-1,right_bound=1)
+    y = uniform_endpoints(shape=(n,n),left_bound=-1,right_bound=1)
+    cases = {'scalar/scalar':(a,b,100_000), 'array/array':(x,y,1), 'scalar/array':(a,y,1), 'array/scalar':(x,b,1)}
+    for name,(s,o,number) in cases.items():
+        print(f'-- {name} (array shape {(n,n)})')
+        t_ref = best_of(lambda: s.lo*o.lo, number=number)
+        report('ndarray lo*lo', t_ref, t_ref)
+        for engine in ('mask','minmax'):
+            report(f'multiply engine={engine}', best_of(lambda: multiply(s,o,engine=engine), number=number), t_ref)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,42 @@
+"""
+Range enclosure by branch and bound with `enclose_range`, against the hull over uniform grids with `evaluate_subpaving`.
+
+For each function the excess of the enclosure over the true range, (min-lo) + (hi-max), is reported with the time.
+The grids need about (1/excess)^d boxes, the branch and bound only refines the boxes near the extrema, 
+down to `ftol` from the incumbent or to the default `tol`.
+
+`python -m benchmarks.bench_optimize`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import evaluate_subpaving
+from intervals.optimize import enclose_range
+
+from benchmarks.timing import (best_of,report)
+
+def camel(b): # min -1.0316284534898774, max 162.9 on [-3,3]x[-2,2]
+    x, y = b[:,0], b[:,1]
+    return (4-2.1*x**2+x**4/3)*x**2 + x*y + (-4+4*y**2)*y**2
+
+def styblinski_tang(b): # separable, min -39.16616570377142*d at x = -2.903534, max 125*d at x = 5, on [-5,5]^d
+    s = 0.
+    for k in range(b.shape[1]): s = s + (b[:,k]**4 - 16*b[:,k]**2 + 5*b[:,k])/2
+    return s
+
+def run():
+    cases = [('six-hump camel, d=2', camel, Interval([-3.,-2],[3.,2]), (-1.0316284534898774, 162.9), (100,300,1000), (1e-1,1e-2,1e-3)),
+             ('Styblinski-Tang, d=4', styblinski_tang, Interval([-5.]*4,[5.]*4), (-39.16616570377142*4, 500.), (10,20,40), (30,10,3))]
+    for name, f, x, (f_min, f_max), cuts, ftols in cases:
+        print(f'-- {name}')
+        for n in cuts:
+            h = evaluate_subpaving(f,x,n)
+            t = best_of(lambda: evaluate_subpaving(f,x,n), repeat=1)
+            report(f'grid {n}^{len(x.lo)}, excess {(f_min-h.lo)+(h.hi-f_max):.1e}', t)
+        for ftol in ftols:
+            r = enclose_range(f,x,ftol=ftol)
+            t = best_of(lambda: enclose_range(f,x,ftol=ftol), repeat=1)
+            report(f'branch and bound ftol {ftol:.0e}, excess {(f_min-r.lo)+(r.hi-f_max):.1e}', t)
+
+if __name__ == '__main__':
+    run()
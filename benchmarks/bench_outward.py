@@ -0,0 +1,34 @@
+"""
+Overhead of the verified mode, which rounds the endpoints outward with numpy.nextafter, against the emulated mode.
+
+`python -m benchmarks.bench_outward`
+"""
+import numpy
+
+from intervals import arithmetic
+from intervals.number import Interval
+from intervals.methods import (sqrt,exp,sin,cos)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of,report)
+
+def run(n:int=1_000_000):
+    x = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    y = uniform_endpoints(shape=(n,),left_bound=0.5,right_bound=2)
+    a, b = uniform_endpoints(shape=(300,300)), uniform_endpoints(shape=(300,300))
+    s, t = Interval(1.,2.), Interval(0.5,3.)
+    cases = {'x + y':lambda: x + y, 'x * y':lambda: x * y, 'x / y':lambda: x / y, 'sqrt(y)':lambda: sqrt(y), 
+             'exp(x)':lambda: exp(x), 'sin(x)':lambda: sin(x), 'cos(x)':lambda: cos(x), 'a @ b (300,300)':lambda: a @ b,
+             'scalar s * t (x 1000)':lambda: [s * t for _ in range(1000)]}
+    print(f'-- {n} intervals, emulated vs verified (arithmetic.OUTWARD = True)')
+    for name,fn in cases.items():
+        arithmetic.OUTWARD = False
+        t_emulated = best_of(fn, repeat=5)
+        arithmetic.OUTWARD = True
+        t_verified = best_of(fn, repeat=5)
+        report(f'{name} emulated', t_emulated)
+        report(f'{name} verified', t_verified, t_emulated)
+    arithmetic.OUTWARD = False
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+"""
+Speed-up of `evaluate_parallel` with the number of worker processes, on a regular grid generated by the workers
+and on a subpaving passed through shared memory. The speed-up is against one worker, which evaluates in this process.
+
+`python -m benchmarks.bench_parallel`, or `python -m benchmarks.bench_parallel 20` for the 64M boxes of 20 cuts.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import subintervalise
+from intervals.parallel import evaluate_parallel
+
+from benchmarks.timing import (best_of,report)
+
+def f(b:Interval) -> Interval:
+    return b[:,0]*b[:,1] - b[:,2]*b[:,3] + b[:,4]*b[:,4] - b[:,5]
+
+def run(cuts:int=14, subpaving_cuts:int=10):
+    x = Interval([-1.,0,1,-2,-1,0],[2.,1,3,-1,1,1])
+    cpus = os.cpu_count() or 1
+    counts = sorted({1,2,4,cpus} | ({cpus//2} if cpus > 4 else set()))
+    s = subintervalise(x,subpaving_cuts)
+    for label, args in ((f'grid {cuts}^6, {cuts**6} boxes', (x,cuts)), (f'shared subpaving of {subpaving_cuts**6} boxes', (s,None))):
+        print(f'-- {label}, {cpus} CPUs')
+        t1 = None
+        for workers in counts:
+            if workers == 1: t = best_of(lambda: evaluate_parallel(f,*args,workers=1), repeat=1)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    evaluate_parallel(f,*args,executor=pool,workers=workers) # start the workers
+                    t = best_of(lambda: evaluate_parallel(f,*args,executor=pool,workers=workers), repeat=1)
+            t1 = t if t1 is None else t1
+            report(f'{workers} workers', t, t1)
+
+if __name__ == '__main__':
+    run(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,38 @@
+"""
+Overhead of the NumPy dispatch protocols: `numpy.exp(x)` and friends against the direct calls to the interval methods,
+and against a per-element loop over scalar intervals.
+
+`python -m benchmarks.bench_protocols`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (exp,sum,concatenate)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of,report)
+
+def run(n:int=1_000_000):
+    x = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    a = numpy.random.rand(n)
+    print(f'-- shape {(n,)}')
+    t = best_of(lambda: exp(x))
+    report('methods.exp(x)', t)
+    report('numpy.exp(x)', best_of(lambda: numpy.exp(x)), t)
+    t = best_of(lambda: x + a)
+    report('x + a', t)
+    report('a + x', best_of(lambda: a + x), t)
+    t = best_of(lambda: sum(x))
+    report('methods.sum(x)', t)
+    report('numpy.sum(x)', best_of(lambda: numpy.sum(x)), t)
+    t = best_of(lambda: concatenate([x,x]))
+    report('methods.concatenate([x,x])', t)
+    report('numpy.concatenate([x,x])', best_of(lambda: numpy.concatenate([x,x])), t)
+    m = 10_000
+    xs = [Interval(l,h) for l,h in zip(x.lo[:m],x.hi[:m])]
+    t = best_of(lambda: numpy.exp(x[:m]))
+    report(f'numpy.exp(x[:{m}])', t)
+    report(f'per-element exp over {m} objects', best_of(lambda: [exp(xi) for xi in xs]), t)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,45 @@
+"""
+Reductions of interval arrays: `sum` against numpy.sum on the two endpoint arrays, the pairwise-tree `prod` against 
+a loop of interval products, and the chunked reductions against the plain ones.
+
+`python -m benchmarks.bench_reductions`
+"""
+import functools
+import operator
+
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (sum,prod,dot,amin,amax)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of,report)
+
+def run(n:int=10_000_000):
+    x = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    y = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    print(f'-- {n} intervals')
+    t = best_of(lambda: (numpy.sum(x.lo),numpy.sum(x.hi)))
+    report('numpy.sum of both endpoints', t)
+    report('sum(x)', best_of(lambda: sum(x)), t)
+    report('sum(x,chunk=2**20)', best_of(lambda: sum(x,chunk=2**20)), t)
+    report('amin(x), amax(x)', best_of(lambda: (amin(x),amax(x))), t)
+    report('dot(x,y)', best_of(lambda: dot(x,y), repeat=3), t)
+    report('dot(x,y,chunk=2**20)', best_of(lambda: dot(x,y,chunk=2**20), repeat=3), t)
+    t = best_of(lambda: prod(x), repeat=3)
+    report('prod(x)', t)
+    report('prod(x,chunk=2**20)', best_of(lambda: prod(x,chunk=2**20), repeat=3), t)
+    m = 1000
+    a = uniform_endpoints(shape=(m,m),left_bound=0.5,right_bound=1.5)
+    print(f'-- {(m,m)} intervals, product along axis 0')
+    t = best_of(lambda: functools.reduce(operator.mul,[a[i] for i in range(m)]), repeat=3)
+    report('loop of row products', t)
+    report('prod(a,axis=0)', best_of(lambda: prod(a,axis=0), repeat=3), t)
+    v = a[0,:1000]
+    print('-- 1000 scalar intervals')
+    t = best_of(lambda: functools.reduce(operator.mul,[Interval(float(l),float(h)) for l,h in zip(v.lo,v.hi)]))
+    report('loop of scalar products', t)
+    report('prod(v)', best_of(lambda: prod(v)), t)
+
+if __name__ == '__main__':
+    run()
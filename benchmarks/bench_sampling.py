@@ -0,0 +1,44 @@
+"""
+Propagation by sampling with `sampling.sample_range`, against the legacy decorator `complex.BRUTEFORCE`,
+which takes one scalar Interval per argument, and the coverage of the sampling methods.
+
+`python -m benchmarks.bench_sampling`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals import complex as legacy
+from intervals.sampling import sample_range
+
+from benchmarks.timing import (best_of,report)
+
+def f(x, y): return x*y - x**2 # range [-2,1/4] over x in [0,1], y in [-1,1]
+
+def g(x, y): return x[:,0]*y - x[:,1] # range [-3,0] over x in [0,1]x[1,2], y in [-1,1]
+
+def h(x, y): return -((x[:,0]-0.3)**2 + (x[:,1]-1.7)**2 + (y-0.1)**2) # maximum 0 inside the box
+
+def run(n:int=10**4):
+    legacy_f = legacy.BRUTEFORCE(N=n)(f)
+    print(f'-- {n} samples of a scalar function of two intervals')
+    t_legacy = best_of(lambda: legacy_f(legacy.Interval(0,1),legacy.Interval(-1,1)), repeat=3)
+    report('complex.BRUTEFORCE', t_legacy)
+    report('sample_range', best_of(lambda: sample_range(f, Interval(0.,1.), Interval(-1.,1.), n=n), repeat=3), t_legacy)
+    m = 1000
+    x_lo = numpy.random.rand(m)
+    x, y = Interval(x_lo, x_lo+1), Interval(-numpy.ones(m), numpy.ones(m))
+    xs, ys = [legacy.Interval(a,a+1) for a in x_lo], [legacy.Interval(-1,1) for _ in range(m)]
+    print(f'-- {n} samples of an array of {m} intervals')
+    t_legacy = best_of(lambda: [legacy_f(a,b) for a,b in zip(xs,ys)], repeat=1)
+    report('complex.BRUTEFORCE, loop', t_legacy)
+    report('sample_range', best_of(lambda: sample_range(f, x, y, n=n), repeat=3), t_legacy)
+    report('sample_range, chunks of 1000', best_of(lambda: sample_range(f, x, y, n=n, chunk=1000), repeat=3), t_legacy)
+    x, y = Interval([0.,1],[1.,2]), Interval(-1.,1.)
+    for name, fn, excess in (('range [-3,0] at corners', g, lambda q: (q.lo+3) - q.hi), ('maximum 0 inside', h, lambda q: -q.hi)):
+        print(f'-- coverage, mean shortfall of the estimate of the {name}, over 20 seeds')
+        for k in (2**8,2**10,2**12,2**14):
+            shortfall = {method: numpy.mean([excess(sample_range(fn, x, y, n=k, method=method, seed=s)) for s in range(20)]) for method in ('uniform','lhs','halton')}
+            print(f'{k:>6} samples   ' + '   '.join(f'{method} {v:.2e}' for method,v in shortfall.items()))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,38 @@
+"""
+Latency of the operations and memory per object of the float-backed ScalarInterval, 
+against the array-backed Interval with 0-d endpoints.
+
+`python -m benchmarks.bench_scalar`
+"""
+import tracemalloc
+
+import numpy
+
+from intervals.number import (Interval,ScalarInterval)
+
+from benchmarks.timing import best_of
+
+def bytes_per_object(make, n:int=100_000) -> float:
+    tracemalloc.start()
+    objects = [make(i) for i in range(n)]
+    current,_ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current/n
+
+def run(number:int=100_000):
+    s, t = Interval(1.,2.), Interval(-3.,4.)
+    a, b = Interval(numpy.asarray(1.),numpy.asarray(2.)), Interval(numpy.asarray(-3.),numpy.asarray(4.))
+    assert isinstance(s,ScalarInterval) and not isinstance(a,ScalarInterval)
+    cases = {'x + y':lambda x,y: x + y, 'x - y':lambda x,y: x - y, 'x * y':lambda x,y: x * y, 'x / 2.5':lambda x,y: x / 2.5, 
+             'y / x':lambda x,y: y / x, 'x ** 2':lambda x,y: x ** 2, '2.5 - x':lambda x,y: 2.5 - x, 'x < y':lambda x,y: x < y}
+    print(f'-- best of 5 x {number} calls   {"array-backed":>14} {"ScalarInterval":>16}')
+    for name,fn in cases.items():
+        t_array = best_of(lambda: fn(a,b), repeat=5, number=number)
+        t_scalar = best_of(lambda: fn(s,t), repeat=5, number=number)
+        print(f'{name:<24} {t_array*1e6:12.3f} us {t_scalar*1e6:13.3f} us   x{t_array/t_scalar:5.1f}')
+    m_array = bytes_per_object(lambda i: Interval(numpy.asarray(float(i)),numpy.asarray(i+1.)))
+    m_scalar = bytes_per_object(lambda i: Interval(float(i),i+1.))
+    print(f'{"bytes per object":<24} {m_array:12.0f}    {m_scalar:13.0f}      x{m_array/m_scalar:5.1f}')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,32 @@
+"""
+Element-wise set operations on interval arrays against the pairwise methods `union` and `intersection` 
+of `intervals.complex.Interval`, called in a Python loop.
+
+`python -m benchmarks.bench_set`
+"""
+import numpy
+
+from intervals import complex as complex_intervals
+from intervals.methods import (hull,intersection,set_difference,is_empty,drop_empty)
+from intervals.random import uniform_endpoints
+
+from benchmarks.timing import (best_of,report)
+
+def run(n:int=1_000_000, n_loop:int=10_000):
+    x = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    y = uniform_endpoints(shape=(n,),left_bound=-1,right_bound=1)
+    pairs = [(complex_intervals.Interval(float(x.lo[i]),float(x.hi[i])),complex_intervals.Interval(float(y.lo[i]),float(y.hi[i]))) for i in range(n_loop)]
+    print(f'-- {n} intervals, the loops on {n_loop} pairs are scaled to {n}')
+    t = best_of(lambda: [a.union(b) for a,b in pairs], repeat=3) * n/n_loop
+    report('loop of complex.Interval.union', t)
+    report('hull(x,y)', best_of(lambda: hull(x,y)), t)
+    t = best_of(lambda: [a.intersection(b) for a,b in pairs], repeat=3) * n/n_loop
+    report('loop of complex.Interval.intersection', t)
+    report('intersection(x,y)', best_of(lambda: intersection(x,y)), t)
+    report('set_difference(x,y)', best_of(lambda: set_difference(x,y)))
+    d = set_difference(x,y)
+    report('drop_empty(set_difference(x,y))', best_of(lambda: drop_empty(d)))
+    print(f'{numpy.mean(is_empty(intersection(x,y))):.2f} of the intersections are empty')
+
+if __name__ == '__main__':
+    run()
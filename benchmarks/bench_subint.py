@@ -0,0 +1,40 @@
+"""
+Construction of regular subpavings with `subintervalise`, against the former recursion through `itertools.product`,
+and the streaming of a large grid in chunks.
+
+`python -m benchmarks.bench_subint`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import subintervalise
+from benchmarks import legacy_subint
+
+from benchmarks.timing import (best_of,report)
+
+def run(legacy_max:int=10**6):
+    x = Interval([0.,-1,2,0,0,0],[1.,3,4,1,1,1])
+    for n in ((100,100),(1000,1000),(20,20,20),(100,100,100),(10,)*6):
+        d = len(n)
+        N = int(numpy.prod(n))
+        xd = x[:d]
+        print(f'-- grid {n}, {N} boxes of dimension {d}')
+        t_legacy = None
+        if N <= legacy_max: 
+            t_legacy = best_of(lambda: legacy_subint.subintervalise(xd,n), repeat=1)
+            report('itertools.product', t_legacy)
+        report('subintervalise', best_of(lambda: subintervalise(xd,n), repeat=3), t_legacy)
+    m, n = 1000, (30,30)
+    boxes = Interval(numpy.random.rand(m,2), 1+numpy.random.rand(m,2))
+    print(f'-- batch of {m} boxes, grid {n}')
+    report('subintervalise, batch', best_of(lambda: subintervalise(boxes,n), repeat=3))
+    n, chunk = (1000,1000,10), 2**20
+    print(f'-- streaming grid {n} in chunks of {chunk}')
+    def stream():
+        s = 0.
+        for c in subintervalise(x[:3],n,chunk=chunk): s += numpy.sum(c.hi[:,0]-c.lo[:,0])
+        return s
+    report('subintervalise, chunks', best_of(stream, repeat=1))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,32 @@
+"""
+Subintervalisation of a function of intervals with the decorator `methods.SUBINTERVALIZE`, which evaluates the function once on the grid 
+of subboxes, against `complex.SUBINTERVALIZE`, which calls it once per subbox, and the gain of the cache of the grids.
+
+`python -m benchmarks.bench_subintervalize`
+"""
+from intervals.number import Interval
+from intervals import complex as legacy
+from intervals import methods
+
+from benchmarks.timing import (best_of,report)
+
+def f(x, y): return x*y - x**2
+
+def g(x, y, z): return x*y - z*x + y*z
+
+def run():
+    for fn, N, args in ((f, 20, 2), (f, 100, 2), (g, 20, 3)):
+        print(f'-- {args} intervals split {N} times, {N**args} subboxes')
+        box = [(0.,1.), (-1.,1.), (2.,3.)][:args]
+        t_legacy = None
+        if N**args <= 10**4:
+            legacy_fn = legacy.SUBINTERVALIZE(N=N)(fn)
+            t_legacy = best_of(lambda: legacy_fn(*[legacy.Interval(a,b) for a,b in box]), repeat=1)
+            report('complex.SUBINTERVALIZE', t_legacy)
+        x = [Interval(a,b) for a,b in box]
+        for label, kwargs in (('SUBINTERVALIZE, no cache', dict(cache=False)), ('SUBINTERVALIZE, cached grid', dict()), ('SUBINTERVALIZE, chunks of 1000', dict(chunk=1000))):
+            new_fn = methods.SUBINTERVALIZE(N=N, **kwargs)(fn)
+            report(label, best_of(lambda: new_fn(*x), repeat=5), t_legacy)
+
+if __name__ == '__main__':
+    run()
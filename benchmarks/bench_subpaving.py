@@ -0,0 +1,51 @@
+"""
+Throughput of the queries on a `Subpaving` index, built once, against brute force and against `intersect_vector`,
+which sorts the subpaving again on every call. Also times the build and the incremental bisection.
+
+The subpaving is a regular grid of n boxes in the unit cube, the queries are boxes of about the same size placed at random.
+The brute force compares each query with every box, it runs on a slice of the queries and is scaled up.
+
+`python -m benchmarks.bench_subpaving`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import intersect_vector
+from intervals.subpaving import Subpaving
+
+from benchmarks.timing import (best_of,report)
+
+def grid(k:int, d:int) -> Interval:
+    g = numpy.linspace(0,1,k+1)
+    lo = numpy.stack([a.ravel() for a in numpy.meshgrid(*[g[:-1]]*d, indexing='ij')],axis=1)
+    return Interval(lo, lo + 1/k)
+
+def brute_force(x:Interval, y:Interval):
+    return [numpy.flatnonzero(numpy.all((x.lo <= y.hi[j]) & (y.lo[j] <= x.hi), axis=1)) for j in range(len(y.lo))]
+
+def run(m:int=10_000, m_brute:int=200, batches:int=10):
+    rng = numpy.random.default_rng(0)
+    for d, k in ((2,316),(3,46),(2,1000)):
+        x = grid(k,d)
+        n = len(x.lo)
+        lo = rng.uniform(0,1,(m,d))
+        y = Interval(lo, lo + rng.uniform(0,2/k,(m,d)))
+        p = rng.uniform(0,1,(m,d))
+        print(f'-- subpaving of {n} boxes of dimension {d}, batches of {m} queries')
+        report('build', best_of(lambda: Subpaving(x), repeat=3))
+        sp = Subpaving(x)
+        t = best_of(lambda: brute_force(x, Interval(y.lo[:m_brute], y.hi[:m_brute])), repeat=1) * m/m_brute
+        report('brute force, scaled', t)
+        report('intersect_vector', best_of(lambda: intersect_vector(x,y,pairs=True), repeat=3), t)
+        report('query_intersect', best_of(lambda: sp.query_intersect(y,pairs=True), repeat=3), t)
+        report('query_contain', best_of(lambda: sp.query_contain(y,pairs=True), repeat=3), t)
+        report('query_point', best_of(lambda: sp.query_point(p), repeat=3), t)
+        t = best_of(lambda: [intersect_vector(x,y) for _ in range(batches)], repeat=1)
+        report(f'{batches} batches, intersect_vector', t)
+        report(f'{batches} batches, build + query_intersect', best_of(lambda: [s.query_intersect(y) for s in [Subpaving(x)] for _ in range(batches)], repeat=1), t)
+        index = rng.choice(n, n//10, replace=False)
+        report(f'bisect {n//10} boxes', best_of(lambda: sp.bisect(index), repeat=3)) # the same boxes on each trial, no rebuild
+        report('query_intersect after bisect', best_of(lambda: sp.query_intersect(y,pairs=True), repeat=3))
+
+if __name__ == '__main__':
+    run()
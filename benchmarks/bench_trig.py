@@ -0,0 +1,49 @@
+"""
+The quadrant-index trig kernels against the former implementations, on arrays of 10^7 intervals.
+
+The former vectorised sin and cos fail on intervals that cross an extremum, so they are compared on intervals 
+that stay within one monotone piece of the function. The new kernels are also timed on arbitrary intervals, 
+and with different chunk sizes.
+
+`python -m benchmarks.bench_trig`
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (sin,cos,tan)
+from benchmarks import legacy_trig
+
+from benchmarks.timing import (best_of,report)
+
+def monotone_pieces(n:int, offset:float, rng) -> Interval:
+    """ Intervals within the pieces (offset+k*pi, offset+(k+1)*pi), on which sin (offset=-pi/2) or cos (offset=0) is monotonic. """
+    k = rng.integers(-10,10,n)
+    a = offset + k*numpy.pi + rng.uniform(0.01,1.5,n)
+    b = a + rng.uniform(0,1.5,n)
+    return Interval(a,numpy.minimum(b,offset+(k+1)*numpy.pi-0.01))
+
+def run(n:int=10_000_000):
+    rng = numpy.random.default_rng(0)
+    x = Interval(*numpy.sort(rng.uniform(-50,50,(2,n)),axis=0))
+    print(f'-- {n} intervals')
+    for name,new,old,offset in [('sin',sin,legacy_trig.sin,-numpy.pi/2),('cos',cos,legacy_trig.cos,0.)]:
+        y = monotone_pieces(n,offset,rng)
+        t_old = best_of(lambda: old(y), repeat=3)
+        report(f'{name} former, monotone pieces', t_old)
+        report(f'{name} new, monotone pieces', best_of(lambda: new(y), repeat=3), t_old)
+        report(f'{name} new, arbitrary', best_of(lambda: new(x), repeat=3), t_old)
+    t_old = best_of(lambda: legacy_trig.tan(x), repeat=3)
+    report('tan former, arbitrary', t_old)
+    report('tan new, arbitrary', best_of(lambda: tan(x), repeat=3), t_old)
+    print('-- chunk size, sin on arbitrary intervals')
+    for chunk in (2**12,2**16,2**20,n):
+        report(f'chunk {chunk}', best_of(lambda: sin(x,chunk=chunk), repeat=3))
+    print('-- 10^4 scalar intervals in a loop')
+    scalars = [Interval(float(l),float(h)) for l,h in zip(x.lo[:10_000],x.hi[:10_000])]
+    for name,new,old in [('sin',sin,legacy_trig.sin),('cos',cos,legacy_trig.cos),('tan',tan,legacy_trig.tan)]:
+        t_old = best_of(lambda: [old(s) for s in scalars], repeat=3)
+        report(f'{name} former', t_old)
+        report(f'{name} new', best_of(lambda: [new(s) for s in scalars], repeat=3), t_old)
+
+if __name__ == '__main__':
+    run()
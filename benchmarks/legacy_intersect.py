@@ -0,0 +1,27 @@
+"""
+The loop-based intersect_vector of intervals.methods before the sweep-and-prune engine, kept as the reference of `bench_intersect`.
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (intervalise,lo,hi,tolist)
+
+def intersect_vector(x_:Interval,y_:Interval):
+    '''
+    This function checks if the focal elements x, intersect the subpaving y.
+
+    x: A n-list of d-boxes or d-intervals, e.g. a subpaving. x.shape=(r,d)
+    y: A m-list of d-boxes or d-intervals, e.g. a focal element. y.shape=(p,d)
+
+    out: A (rp)-list of d-arrays of booleans
+    '''
+    x = intervalise(x_)
+    y = intervalise(y_)
+    # n,d = x.shape
+    m,d = y.shape
+    x_lo = lo(x)# x_lo = numpy.array([xi.lo for xi in x])
+    x_hi = hi(x)# x_hi = numpy.array([xi.hi for xi in x])
+    where_intersect = numpy.zeros((m,),dtype=bool)# inter = []
+    for i, yi in enumerate(tolist(y)): # a focal elem
+        where_intersect[i] = any(numpy.all(~((x_hi < lo(yi)) | (hi(yi) < x_lo)), axis=1))
+    return where_intersect
@@ -0,0 +1,107 @@
+"""
+The list-based IntervalArray of intervals.complex before the adapter of intervals.number.Interval, kept as the reference of `bench_intervalarray`.
+Plotting is left out.
+"""
+import numpy
+
+from intervals.complex import (Interval, NUMERIC_TYPES)
+
+class IntervalArray(): # wrapper class of the scalar class interval
+    """
+    ∞ --------------------------- ∞
+    Created Mon Jul 24 2020
+    University of Liverpool
+    github.com/marcodeangelis
+    MIT License
+    ∞ --------------------------- ∞
+    """
+    def __repr__(self): # return
+        if len(self)>10:
+            a = [str(i) for i in self]
+            s = '\n'.join(a[:5]+['...']+a[-5:-1])
+        else:
+            s = '\n'.join([str(i) for i in self])
+        return s
+    def __str__(self): # print
+        s = '\n'.join([str(i) for i in self])
+        return s
+    def __len__(self):
+        return len([i for i in self])
+    def __init__(self,*args,notation='infsup',axis=0,name=''):
+        self.name = name # initialise this with an empty string
+        if len(args)==0:  # what should an empty IntervalArray(object) look like?
+            self.__lo = [-1]
+            self.__hi = [1]
+        elif len(args)==1:   # this must be a list, tuple (array?) of intervals
+            assert args[0].__class__.__name__ in ['list', 'tuple','IntervalArray'], 'single input must be list or a tuple of intervals.'
+            if args[0][0].__class__.__name__ in ['Interval','ComplexInterval']:
+                self.__lo = [x.lo() for x in args[0]]
+                self.__hi = [x.hi() for x in args[0]]
+            elif args[0][0].__class__.__name__ in NUMERIC_TYPES:
+                self.__lo, self.__hi = args[0], args[0]
+            elif args[0][0].__class__.__name__ in ['list','tuple']:
+                if axis == 0:
+                    if len(args[0])==1:
+                        self.__lo, self.__hi = args[0][0], args[0][0]
+                    if len(args[0])==2:
+                        # assert len(args[0]) == 2, 'a list or tuple is needed.'
+                        self.__lo, self.__hi = args[0][0], args[0][1]
+                elif axis == 1:
+                    self.__lo = list([x for x in zip(*args[0])][0])
+                    self.__hi = list([x for x in zip(*args[0])][1])
+        elif len(args)==2:
+            if args[0].__class__.__name__ == 'list':
+                self.__lo, self.__hi = args[0], args[1]
+            else:
+                self.__lo = list()
+                self.__hi = list()
+                for a in args:
+                    if a.__class__.__name__ == 'tuple':
+                        self.__lo.append(a[0]) 
+                        self.__hi.append(a[1])
+                    elif a.__class__.__name__ == 'Interval':
+                        self.__lo.append(a.lo()) 
+                        self.__hi.append(a.hi())
+                    else:
+                        raise TypeError('multiple arguments must be a tuple or an interval.')
+    def __iter__(self): # make class iterable
+        for l,u in zip(self.__lo,self.__hi):
+            yield Interval(l,u)
+    def __getitem__(self,index): # make class subscrictable
+        if index.__class__.__name__ in ['list','tuple']:
+            if len(index)>0:
+                return IntervalArray([Interval(self.__lo[i],self.__hi[i]) for i in index])
+            else:
+                return IntervalArray([]) # todo: create empty dataset
+        else:
+            return Interval(self.__lo[index],self.__hi[index])
+    def inf(self):
+        return self.__lo
+    def lo(self):
+        return self.__lo
+    def sup(self):
+        return self.__hi
+    def hi(self):
+        return self.__hi
+    def tolist(self):
+        return [Interval(l,h) for l,h in zip(self.__lo,self.__hi)]
+    def toarray(self, order='F'):
+        if order=='F':
+            return numpy.array([self.__lo, self.__hi])
+        elif order=='C':
+            return numpy.array([self.__lo, self.__hi]).T
+    def slider(self,p=0.5):  
+        if p.__class__.__name__ in ['list','tuple']:
+            assert len(self)==len(p), f'p must be of length {len(self)}'
+            return [si.slider(pi) for si,pi in zip(self,p)]
+        else:
+            return [si.slider(p) for si in self] # p = list(repeat(.5, times=len(self)))
+    # Magic methods
+    def __add__(self,other):
+        return IntervalArray([a+b for a,b in zip(self,other)])
+    def __sub__(self,other):
+        return IntervalArray([a-b for a,b in zip(self,other)])
+    def __mul__(self,other):
+        return IntervalArray([a*b for a,b in zip(self,other)])
+    def __truediv__(self,other):
+        return IntervalArray([a/b for a,b in zip(self,other)])
@@ -0,0 +1,28 @@
+"""
+The recursive subintervalise of intervals.methods before the broadcast construction, kept as the reference of `bench_subint`.
+"""
+from itertools import product
+
+from numpy import (asarray,vstack,linspace)
+
+from intervals.number import Interval
+from intervals.methods import (intervalise,sizeit)
+
+def subintervalise(x_:Interval, n=0):
+    x = intervalise(x_)
+    d = len(x.shape) # dimension of the array
+    if n==0: return x
+    elif n==1: return x # should return a subtiling (sized interval)
+    if x.scalar:  # or x.scalar == True
+        xx = linspace(x.lo,x.hi,num=n+1)
+        return intervalise(vstack([xx[:-1], xx[1:]]))
+    elif d==1: ## x.shape = (m,)
+        m = x.shape[0] # size of 1d array
+        if type(n)==int: n=m*[n] # differential split number 
+        X_sub = []
+        for i,xi in enumerate(x):
+            xxi = subintervalise(xi,n=n[i]) # recursion
+            X_sub.append(sizeit(xxi).val)
+        return intervalise(asarray(list(product(*X_sub)),dtype=float))
+    else: print('!! Subtiling not yet supported for interval arrays of dimension 2 or larger. Input will be returned.')
+    return x
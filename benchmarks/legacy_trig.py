@@ -0,0 +1,286 @@
+"""
+The trig functions of intervals.methods before the quadrant-index kernels, kept as the reference of `bench_trig`.
+
+The vectorised versions index their masks inconsistently, so they only run on inputs where every interval 
+stays within one monotone piece of the function, e.g. the inputs built by `bench_trig`.
+"""
+import numpy
+
+from intervals.number import Interval
+from intervals.methods import (contain,width,is_Interval)
+
+numpy_sin = numpy.sin
+numpy_cos = numpy.cos
+numpy_tan = numpy.tan
+numpy_pi  = numpy.pi
+numpy_inf = numpy.inf
+
+def sin(x:Interval): 
+    '''
+    Implementation of Interval Arithmetic in CORA 2016
+
+    Matthias Althoff and Dmitry Grebenyuk
+    
+    EPiC Series in Computing Volume 43, 2017, Pages 91-105
+
+    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
+    '''
+    if not(is_Interval(x)): return numpy_sin(x) # int, float, ndarray
+
+    if not(x.scalar): return sin_vector(x) 
+
+    twopi = 2*numpy_pi
+    pihalf = numpy_pi/2
+
+    if width(x)>=twopi: return Interval(-1,1)
+
+    domain1 = Interval(0, pihalf)
+    domain2 = Interval(pihalf, 3*pihalf)
+    domain3 = Interval(3*pihalf, twopi)
+
+    yl = x.lo%twopi
+    yh = x.hi%twopi
+    y = Interval(lo=yl,hi=yh)
+
+    sin_l = numpy_sin(yl)
+    sin_h = numpy_sin(yh)
+
+    if contain(domain1,y) & (yl<=yh): return Interval(sin_l,sin_h)
+    if contain(domain2,y) & (yl<=yh): return Interval(sin_h,sin_l)
+    if contain(domain3,y) & (yl<=yh): return Interval(sin_l,sin_h)
+
+    case1a = contain(domain1,yl) & contain(domain1,yh) & (yl>yh)
+    case1b = contain(domain1,yl) & contain(domain3,yh) 
+    case1c = contain(domain2,yl) & contain(domain2,yh) & (yl>yh)
+    case1d = contain(domain3,yl) & contain(domain3,yh) & (yl>yh) 
+
+    case2a = contain(domain1,yl) & contain(domain1,yh) & (yl<=yh)
+    case2b = contain(domain3,yl) & contain(domain1,yh) 
+    case2c = contain(domain3,yl) & contain(domain3,yh) & (yl<=yh)
+
+    case3a = contain(domain1,yl) & contain(domain2,yh) 
+    case3b = contain(domain3,yl) & contain(domain2,yh) 
+
+    case4a = contain(domain2,yl) & contain(domain1,yh) 
+    case4b = contain(domain2,yl) & contain(domain3,yh) 
+
+    case5 = contain(domain2,yl) & contain(domain2,yh) & (yl<=yh) 
+
+    if case1a | case1b | case1c | case1d : return Interval(-1,1)
+    if case2a | case2b | case2c : return Interval(sin_l,sin_h)
+    if case3a | case3b : return Interval(min(sin_l,sin_h),1)
+    if case4a | case4b : return Interval(-1,max(sin_l,sin_h))
+    if case5: return Interval(sin_h,sin_l)
+
+    pass
+
+def sin_vector(x:Interval): # vectorised version of sin().
+
+    if x.unsized: return sin(x)
+
+    twopi = 2*numpy_pi
+    pihalf = numpy_pi/2
+    
+    mask1a = width(x)>=twopi
+
+    domain1 = Interval(0, pihalf)
+    domain2 = Interval(pihalf, 3*pihalf)
+    domain3 = Interval(3*pihalf, twopi)
+
+    yl = x.lo%twopi
+    yh = x.hi%twopi
+    y = Interval(yl,yh)
+
+    sin_l = numpy_sin(yl)
+    sin_h = numpy_sin(yh)
+
+    # [l,h] all else
+    a = sin_l.copy()
+    b = sin_h.copy()
+
+    # [-1,1]
+    mask3a = contain(domain1,yl) & contain(domain1,yh) & (yl>yh) 
+    mask3b = contain(domain1,yl) & contain(domain3,yh) 
+    mask3c = contain(domain2,yl) & contain(domain2,yh) & (yl>yh) 
+    mask3d = contain(domain3,yl) & contain(domain3,yh) & (yl>yh) 
+    case1 = mask1a|mask3a|mask3b|mask3c|mask3d
+    a[case1] = -1
+    b[case1] =  1
+    if all(case1): return Interval(lo=a,hi=b)
+    # [h,l]
+    mask2b = contain(domain2,yl[~case1]) & contain(domain2,yh[~case1]) & (yl[~case1]<=yh[~case1])  #return Interval(sin_h,sin_l)
+    case2 = mask2b 
+    a[case2] = sin_h[case2]
+    b[case2] = sin_l[case2]
+    # [min, 1]
+    mask5a = contain(domain1,yl[~case1]) & contain(domain2,yh[~case1]) 
+    mask5b = contain(domain3,yl[~case1]) & contain(domain2,yh[~case1])
+    case3 = mask5a|mask5b
+    a[case3] = min(sin_l[case3],sin_h[case3]) 
+    b[case3] = 1
+    # [-1, max]
+    mask6a = contain(domain2,yl[~case1]) & contain(domain1,yh[~case1]) 
+    mask6b = contain(domain2,yl[~case1]) & contain(domain3,yh[~case1]) 
+    case4 = mask6a|mask6b
+    a[case4] = -1
+    b[case4] = max(sin_l[case4],sin_h[case4])
+    return Interval(lo=a,hi=b)
+
+def cos(x:Interval): 
+    '''
+    Implementation of Interval Arithmetic in CORA 2016
+
+    Matthias Althoff and Dmitry Grebenyuk
+    
+    EPiC Series in Computing Volume 43, 2017, Pages 91-105
+
+    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
+    '''
+    if not(is_Interval(x)): return numpy_cos(x) # int, float, ndarray
+
+    if not(x.scalar): return cos_vector(x) 
+
+    twopi = 2*numpy_pi
+
+    # [-1,1] aka case 0
+    if width(x)>=twopi: return Interval(-1,1)
+
+    domain1 = Interval(0, numpy_pi)
+    domain2 = Interval(numpy_pi, 2*numpy_pi)
+
+    yl = x.lo%twopi
+    yh = x.hi%twopi
+    y = Interval(lo=yl,hi=yh)
+
+    cos_l = numpy_cos(yl)
+    cos_h = numpy_cos(yh)
+
+    # [-1,1]
+    case1a = (yh<yl) & contain(domain1,yl) & contain(domain1,yh)
+    case1b = (yh<yl) & contain(domain2,yl) & contain(domain2,yh)
+    # [cos_l, cos_h]
+    case2a = (yl<=yh) & contain(domain2,yl) & contain(domain2,yh)
+    # [min(cos_l, cos_h), 1]
+    case3a = contain(domain2,yl) & contain(domain1,yh)
+    # [-1, max(cos_l, cos_h)] 
+    case4a = contain(domain1,yl) & contain(domain2,yh)
+    # [cos_h, cos_l]
+    case5a = (yl<=yh) & contain(domain1,yl) & contain(domain1,yh)
+
+    if case1a | case1b: return Interval(-1,1)
+    if case2a: return Interval(cos_l, cos_h)
+    if case3a: return Interval(min(cos_l,cos_h), 1)
+    if case4a: return Interval(-1, max(cos_l,cos_h))
+    if case5a: return Interval(cos_h, cos_l)
+
+
+def cos_vector(x:Interval): # vectorised version of cos()
+    if x.unsized: return sin(x)
+
+    twopi = 2*numpy_pi
+
+    case0 = width(x)>=twopi
+
+    domain1 = Interval(0, numpy_pi)
+    domain2 = Interval(numpy_pi, 2*numpy_pi)
+
+    yl = x.lo%twopi
+    yh = x.hi%twopi
+
+    cos_l = numpy_cos(yl)
+    cos_h = numpy_cos(yh)
+
+    a = cos_l.copy()
+    b = cos_h.copy()
+
+    # [-1,1]
+    case1a = (yh<yl) & contain(domain1,yl) & contain(domain1,yh)
+    case1b = (yh<yl) & contain(domain2,yl) & contain(domain2,yh)
+    case1 = case0 | case1a | case1b 
+    a[case1] = -1
+    b[case1] =  1
+    # [cos_l, cos_h]
+    # case2 = (yl<=yh) & contain(domain2,yl) & contain(domain2,yh)
+    # a[case2] = cos_l[case2]
+    # b[case2] = cos_h[case2]
+    # [min(cos_l, cos_h), 1]
+    case3 = contain(domain2,yl) & contain(domain1,yh)
+    a[case3] = min(cos_l[case3],cos_h[case3])
+    b[case3] = 1
+    # [-1, max(cos_l, cos_h)] 
+    case4 = contain(domain1,yl) & contain(domain2,yh)
+    a[case4] = -1
+    b[case4] = max(cos_l[case4], cos_h[case4])
+    # [cos_h, cos_l]
+    case5 = (yl<=yh) & contain(domain1,yl) & contain(domain1,yh)
+    a[case5] = cos_h[case5]
+    b[case5] = cos_l[case5]
+    return Interval(lo=a, hi=b)
+
+def tan(x:Interval):
+    '''
+    Implementation of Interval Arithmetic in CORA 2016
+
+    Matthias Althoff and Dmitry Grebenyuk
+    
+    EPiC Series in Computing Volume 43, 2017, Pages 91-105
+
+    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
+    '''
+
+    if not(is_Interval(x)): return numpy_tan(x) # int, float, ndarray
+
+    if not(x.scalar): return tan_vector(x) 
+
+    pihalf = numpy_pi/2
+
+    domain1 = Interval(0, pihalf)
+    domain2 = Interval(pihalf, numpy_pi)
+
+    zl = x.lo%numpy_pi
+    zh = x.hi%numpy_pi
+
+    #[-∞, ∞] 
+    case1a = width(x)>numpy_pi
+    case1b = (zh<zl) & contain(domain1,zl) & contain(domain1,zh)
+    case1c = (zh<zl) & contain(domain2,zl) & contain(domain2,zh)
+    case1d = contain(domain1,zl) & contain(domain2,zh)
+
+    #[tan_l, tan_h]
+    case2a = (zl<=zh) & contain(domain1,zl) & contain(domain1,zh)
+    case2b = (zl<=zh) & contain(domain2,zl) & contain(domain2,zh)
+    
+    if case1a | case1b | case1c | case1d: return Interval(-numpy_inf, numpy_inf)
+    if case2a | case2b: return Interval(tan(zl), tan(zh))
+    else: return Interval(tan(zl), tan(zh))
+
+def tan_vector(x:Interval): # Vectorised version of tan().
+    if x.unsized: return tan(x)
+
+    pihalf = numpy_pi/2
+
+    domain1 = Interval(0, pihalf)
+    domain2 = Interval(pihalf, numpy_pi)
+
+    zl = x.lo%numpy_pi
+    zh = x.hi%numpy_pi
+
+    tan_l = tan(zl)
+    tan_h = tan(zh)
+
+    a = tan_l.copy()
+    b = tan_h.copy()
+
+     #[-∞, ∞] 
+    case1a = width(x)>numpy_pi
+    case1b = (zh<zl) & contain(domain1,zl) & contain(domain1,zh)
+    case1c = (zh<zl) & contain(domain2,zl) & contain(domain2,zh)
+    case1d = contain(domain1,zl) & contain(domain2,zh)
+    case1 = case1a | case1b | case1c | case1d
+    a[case1] = -numpy_inf
+    b[case1] = numpy_inf
+
+    # #[tan_l, tan_h]
+    # case2a = (zl<=zh) & contain(domain1,zl) & contain(domain1,zh)
+    # case2b = (zl<=zh) & contain(domain2,zl) & contain(domain2,zh)
+    return Interval(lo=a, hi=b)
@@ -0,0 +1,24 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Run a benchmark from the root folder of the repository, e.g.:
+
+`python -m benchmarks.bench_multiply`
+"""
+import time
+
+def best_of(fn, repeat:int=5, number:int=1) -> float:
+    """
+    Return the best time in seconds of `number` calls to `fn`, over `repeat` trials.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number): fn()
+        t1 = time.perf_counter()
+        best = min(best, (t1-t0)/number)
+    return best
+
+def report(label:str, seconds:float, reference:float=None) -> None:
+    if reference is None: print(f'{label:<40} {seconds*1e3:12.4f} ms')
+    else: print(f'{label:<40} {seconds*1e3:12.4f} ms   x{seconds/reference:6.2f}')
@@ -4,4 +4,5 @@ from .methods import (lo,hi,mid,rad,width,\
                       split_interval,subintervalise,\
                       intervalise,\
                       sizeit)
-from .random import uniform_endpoints
\ No newline at end of file
+from .random import uniform_endpoints
+from .subpaving import Subpaving
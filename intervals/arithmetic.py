@@ -6,10 +6,156 @@ github.com/marcodeangelis
 MIT License
 --------------------------
 """
+import math
+
 import numpy
 
-def multiply(s,o):
+OUTWARD = False # verified mode: if True the endpoints of every result are rounded outward by one ulp, see `round_outward`
+MULTIPLY_ENGINE = 'minmax' # kernel used by `multiply`: 'minmax' (branch-free) or 'mask' (sign masks)
+DIVIDE_ENGINE = 'minmax' # kernel used by `divide`: 'minmax' (branch-free) or 'mask' (sign masks)
+MATMUL_MODE = 'exact' # mode used by `matmul`: 'exact' (blocked endpoints) or 'midrad' (midpoint-radius)
+MATMUL_BLOCK_SIZE = 2**22 # largest number of elements of the (n,block,m) product tensor built at each step of the exact matmul
+
+def round_outward(l, h, out:tuple=None, lower:float=None, upper:float=None):
+    """
+    Round the endpoints (l,h) outward by one ulp, i.e. to the next float towards -inf and +inf respectively.
+
+    If `out=(lo,hi)` is given the endpoints are written into these arrays, which can be l and h themselves.
+    `lower` and `upper` clip the endpoints to the range of a function, e.g. [-1,1] for sin and cos.
+
+    Python floats, e.g. the endpoints of a ScalarInterval, are rounded with `numpy.nextafter` and stay floats.
+    """
+    if (type(l) is float) & (type(h) is float): 
+        l,h = float(numpy.nextafter(l,-math.inf)), float(numpy.nextafter(h,math.inf)) # math.nextafter needs Python 3.9
+        if lower is not None: l = max(l,lower)
+        if upper is not None: h = min(h,upper)
+        return float(l),float(h)
+    if out is None: out = (None,None)
+    l = numpy.nextafter(l,-numpy.inf,out=out[0])
+    h = numpy.nextafter(h,numpy.inf,out=out[1])
+    if lower is not None: l = numpy.maximum(l,lower,out=out[0])
+    if upper is not None: h = numpy.minimum(h,upper,out=out[1])
+    return l,h
+
+def verify(l, h, outward:bool=None):
+    """
+    Return the endpoints (l,h) of a result rounded outward if `outward` is True, or if None and the module-level `OUTWARD` is True.
+
+    Arrays are rounded in place, so l and h must be owned by the result, i.e. not be views of the operands.
+    """
+    if outward is None: outward = OUTWARD
+    if not outward: return l,h
+    if isinstance(l,numpy.ndarray) & isinstance(h,numpy.ndarray): return round_outward(l,h,out=(l,h))
+    return round_outward(l,h)
+
+def verify_sum(l, h, k, magnitude, outward:bool=None, factor:int=1):
+    """
+    Return the endpoints (l,h) of a sum of k terms, widened by a bound of its rounding errors if `outward` is True, 
+    or if None and `OUTWARD` is True. One ulp is not enough, the rounding errors of a sum of k terms add up.
+
+    The bound is factor*(k+2)*eps*magnitude + k*tiny per endpoint, where `magnitude` is the sum of the magnitudes of the terms,
+    and k can be an array broadcast against the endpoints, e.g. the number of terms of each partial sum of a cumulative sum.
+    """
+    if outward is None: outward = OUTWARD
+    if not outward: return l,h
+    dtype = numpy.result_type(l,h)
+    if not numpy.issubdtype(dtype,numpy.floating): return l,h # integer sums are exact
+    info = numpy.finfo(dtype)
+    error = factor * (numpy.asarray(k)+2) * info.eps * magnitude + numpy.asarray(k)*info.tiny
+    return round_outward(l-error,h+error)
+
+def add(s,o,out:tuple=None,outward:bool=None):
+    """
+    Addition between interval-like objects, i.e. objects with the attributes `lo` and `hi`, or ndarrays and numbers.
+
+    Returns the endpoints (lo,hi) of the sum. If `out=(lo,hi)` is given the endpoints are written into these arrays.
+
+    :outward: if True the endpoints are rounded outward by one ulp. If None the module-level `OUTWARD` is used.
+    """
+    s_lo,s_hi,_ = endpoints(s)
+    o_lo,o_hi,_ = endpoints(o)
+    if out is None: return verify(s_lo + o_lo, s_hi + o_hi, outward)
+    return verify(numpy.add(s_lo,o_lo,out=out[0]), numpy.add(s_hi,o_hi,out=out[1]), outward)
+
+def subtract(s,o,out:tuple=None,outward:bool=None):
+    """
+    Subtraction between interval-like objects, or ndarrays and numbers.
+
+    Returns the endpoints (lo,hi) of the difference. If `out=(lo,hi)` is given the endpoints are written into these arrays.
+    """
+    s_lo,s_hi,_ = endpoints(s)
+    o_lo,o_hi,_ = endpoints(o)
+    if out is None: return verify(s_lo - o_hi, s_hi - o_lo, outward)
+    if numpy.may_share_memory(out[0],o_lo): # e.g. x -= x, the left endpoint of o would be overwritten before it is used
+        h = s_hi - o_lo
+        l = numpy.subtract(s_lo,o_hi,out=out[0])
+        numpy.copyto(out[1],h)
+        return verify(l,out[1],outward)
+    return verify(numpy.subtract(s_lo,o_hi,out=out[0]), numpy.subtract(s_hi,o_lo,out=out[1]), outward)
+
+def multiply(s,o,engine:str=None,out:tuple=None,outward:bool=None):
+    """
+    Multiplication between two interval-like objects, i.e. objects with the attributes `lo` and `hi`.
+
+    Returns the endpoints (lo,hi) of the product. If `out=(lo,hi)` is given the endpoints are written into these arrays.
+
+    :engine: 'minmax' or 'mask'. If None the module-level `MULTIPLY_ENGINE` is used. 
+    The 'minmax' engine also accepts ndarrays and numbers as operands.
+    """
+    if engine is None: engine = MULTIPLY_ENGINE
+    if engine == 'minmax': return verify(*multiply_minmax(s,o,out=out), outward)
+    elif engine == 'mask': return verify(*copy_into(out,*multiply_mask(s,o)), outward)
+    raise ValueError(f"Unknown multiply engine '{engine}', choose between 'minmax' and 'mask'.")
+
+def multiply_minmax(s,o,out:tuple=None):
+    """
+    Branch-free multiplication. 
+    
+    The four endpoint products are computed once and reduced with fmin/fmax, 
+    so no masks or fancy indexing are needed and all four shape cases (scalar/scalar, 
+    array/array, scalar/array and array/scalar) go through the same few ufunc calls.
+
+    fmin/fmax ignore the NaN of 0*inf, so [0,1]*[-inf,inf] = [-inf,inf].
+    """
+    s_lo,s_hi,_ = endpoints(s)
+    o_lo,o_hi,_ = endpoints(o)
+    return multiply_endpoints(s_lo,s_hi,o_lo,o_hi,out=out)
+
+def multiply_endpoints(s_lo,s_hi,o_lo,o_hi,out:tuple=None):
+    """
+    The minmax kernel acting directly on the endpoint arrays of the two operands.
+    """
+    with numpy.errstate(invalid='ignore'): # 0*inf
+        if o_lo is o_hi: products = (s_lo*o_lo, s_hi*o_lo) # o is a point
+        elif s_lo is s_hi: products = (s_lo*o_lo, s_lo*o_hi) # s is a point
+        else: products = (s_lo*o_lo, s_lo*o_hi, s_hi*o_lo, s_hi*o_hi)
+    return minmax(products,out=out)
+
+def minmax(endpoints:tuple,out:tuple=None):
+    """
+    Element-wise minimum and maximum of a tuple of arrays of candidate endpoints, written into `out=(lo,hi)` if given.
+
+    Without `out` the buffer of the first candidate is reused for the maximum, so only one array is allocated.
+    """
+    a,b,*rest = endpoints
+    inplace = (out is not None) | (numpy.ndim(a)>0)
+    if out is None: out = (None, a if inplace else None) 
+    l = numpy.fmin(a,b,out=out[0])
+    h = numpy.fmax(a,b,out=out[1])
+    for c in rest:
+        l = numpy.fmin(l,c,out=l if inplace else None)
+        h = numpy.fmax(h,c,out=h if inplace else None)
+    return l,h
+
+def copy_into(out:tuple,l,h):
+    if out is None: return l,h
+    numpy.copyto(out[0],l)
+    numpy.copyto(out[1],h)
+    return out
+
+def multiply_mask(s,o):
     s_lo,s_hi,o_lo,o_hi=s.lo,s.hi,o.lo,o.hi
+    dtype = numpy.result_type(s_lo,o_lo) # numpy promotion, e.g. float32 with float32 stays float32
     if s.scalar & o.scalar:
         if (s_lo >= 0) & (o_lo >= 0): # A+ B+
             l,h = s_lo * o_lo, s_hi * o_hi
@@ -30,8 +176,9 @@ def multiply(s,o):
             l,h = s_lo * o_hi, s_lo * o_lo
         if (s_hi<=0) & (o_hi<=0): # A- B-
             l,h = s_hi * o_hi, s_lo * o_lo
-    elif s_lo.shape==o_lo.shape:
-        l,h = numpy.empty(s_lo.shape),numpy.empty(s_lo.shape)
+    elif not(s.scalar | o.scalar): # same or broadcastable shapes
+        s_lo,s_hi,o_lo,o_hi = numpy.broadcast_arrays(s_lo,s_hi,o_lo,o_hi) # read-only views, nothing is copied
+        l,h = numpy.empty(s_lo.shape,dtype=dtype),numpy.empty(s_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo >= 0) # A+ B+
         l[pp] = s_lo[pp] * o_lo[pp]
         h[pp] = s_hi[pp] * o_hi[pp]
@@ -60,7 +207,7 @@ def multiply(s,o):
         l[nn] = s_hi[nn] * o_hi[nn]
         h[nn] = s_lo[nn] * o_lo[nn]
     elif s.scalar:
-        l,h = numpy.empty(o_lo.shape),numpy.empty(o_lo.shape)
+        l,h = numpy.empty(o_lo.shape,dtype=dtype),numpy.empty(o_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo >= 0) # A+ B+
         l[pp] = s_lo * o_lo[pp]
         h[pp] = s_hi * o_hi[pp]
@@ -89,7 +236,7 @@ def multiply(s,o):
         l[nn] = s_hi * o_hi[nn]
         h[nn] = s_lo * o_lo[nn]
     elif o.scalar:
-        l,h = numpy.empty(s_lo.shape),numpy.empty(s_lo.shape)
+        l,h = numpy.empty(s_lo.shape,dtype=dtype),numpy.empty(s_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo >= 0) # A+ B+
         l[pp] = s_lo[pp] * o_lo
         h[pp] = s_hi[pp] * o_hi
@@ -120,9 +267,40 @@ def multiply(s,o):
     return l,h
 
 
-def divide(s,o):
+def divide(s,o,engine:str=None,out:tuple=None,outward:bool=None):
+    """
+    Division between two interval-like objects, i.e. objects with the attributes `lo` and `hi`.
+
+    Returns the endpoints (lo,hi) of the quotient. If `out=(lo,hi)` is given the endpoints are written into these arrays.
+
+    Raises ZeroDivisionError if the divisor contains zero.
+
+    :engine: 'minmax' or 'mask'. If None the module-level `DIVIDE_ENGINE` is used. 
+    The 'minmax' engine also accepts ndarrays and numbers as operands.
+    """
+    if engine is None: engine = DIVIDE_ENGINE
+    if engine == 'minmax': return verify(*divide_minmax(s,o,out=out), outward)
+    elif engine == 'mask': return verify(*copy_into(out,*divide_mask(s,o)), outward)
+    raise ValueError(f"Unknown divide engine '{engine}', choose between 'minmax' and 'mask'.")
+
+def divide_minmax(s,o,out:tuple=None):
+    """
+    Branch-free division. The divisor does not contain zero, so the quotient is monotonic 
+    in each operand and its endpoints are the extremes of the four endpoint quotients.
+    """
+    s_lo,s_hi,_ = endpoints(s)
+    o_lo,o_hi,_ = endpoints(o)
+    if numpy.any((o_lo<=0) & (o_hi>=0)): raise ZeroDivisionError
+    with numpy.errstate(invalid='ignore'): # inf/inf
+        if o_lo is o_hi: quotients = (s_lo/o_lo, s_hi/o_lo) # o is a point
+        elif s_lo is s_hi: quotients = (s_lo/o_lo, s_lo/o_hi) # s is a point
+        else: quotients = (s_lo/o_lo, s_lo/o_hi, s_hi/o_lo, s_hi/o_hi)
+    return minmax(quotients,out=out)
+
+def divide_mask(s,o):
     s_lo,s_hi,o_lo,o_hi=s.lo,s.hi,o.lo,o.hi
-    other_straddle_zero = numpy.any((o_lo.flatten()<=0) & (o_hi.flatten()>=0))
+    dtype = numpy.result_type(s_lo,o_lo) # numpy promotion, e.g. float32 with float32 stays float32
+    other_straddle_zero = numpy.any((o_lo<=0) & (o_hi>=0))
     if other_straddle_zero: raise ZeroDivisionError
     if s.scalar & o.scalar:
         if (s_lo >= 0) & (o_lo > 0): # A+ B+
@@ -137,8 +315,9 @@ def divide(s,o):
             l,h = s_hi / o_hi, s_lo / o_hi
         if (s_hi<=0) & (o_hi<=0): # A- B-
             l,h = s_hi / o_lo, s_lo / o_hi
-    elif s_lo.shape==o_lo.shape:
-        l,h = numpy.empty(s_lo.shape),numpy.empty(s_lo.shape)
+    elif not(s.scalar | o.scalar): # same or broadcastable shapes
+        s_lo,s_hi,o_lo,o_hi = numpy.broadcast_arrays(s_lo,s_hi,o_lo,o_hi) # read-only views, nothing is copied
+        l,h = numpy.empty(s_lo.shape,dtype=dtype),numpy.empty(s_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo > 0) # A+ B+
         l[pp] = s_lo[pp] / o_hi[pp]
         h[pp] = s_hi[pp] / o_lo[pp]
@@ -158,7 +337,7 @@ def divide(s,o):
         l[nn] = s_hi[nn] / o_lo[nn]
         h[nn] = s_lo[nn] / o_hi[nn]
     elif s.scalar:
-        l,h = numpy.empty(o_lo.shape),numpy.empty(o_lo.shape)
+        l,h = numpy.empty(o_lo.shape,dtype=dtype),numpy.empty(o_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo > 0) # A+ B+
         l[pp] = s_lo / o_hi[pp]
         h[pp] = s_hi / o_lo[pp]
@@ -178,7 +357,7 @@ def divide(s,o):
         l[nn] = s_hi / o_lo[nn]
         h[nn] = s_lo / o_hi[nn]
     elif o.scalar:
-        l,h = numpy.empty(s_lo.shape),numpy.empty(s_lo.shape)
+        l,h = numpy.empty(s_lo.shape,dtype=dtype),numpy.empty(s_lo.shape,dtype=dtype)
         pp=(s_lo >= 0) & (o_lo > 0) # A+ B+
         l[pp] = s_lo[pp] / o_hi
         h[pp] = s_hi[pp] / o_lo
@@ -197,4 +376,107 @@ def divide(s,o):
         nn=(s_hi<=0) & (o_hi<=0) # A- B-
         l[nn] = s_hi[nn] / o_lo
         h[nn] = s_lo[nn] / o_hi
-    return l,h
\ No newline at end of file
+    return l,h
+
+
+def power(s,o,out:tuple=None,outward:bool=None):
+    """
+    Real power s**o of interval-like objects, ndarrays or numbers, with the exponent o not restricted to integers.
+
+    The base must lie in [0,inf), where s**o is real: a base with a part below zero raises ValueError, use an integer power instead.
+    There s**o = exp(o*log(s)), where o*log(s) is monotonic in each operand, so the endpoints 
+    are the extremes of the four endpoint powers. E.g. [0,1]**[-1,1] = [0,inf].
+
+    Returns the endpoints (lo,hi) of the power. If `out=(lo,hi)` is given the endpoints are written into these arrays.
+    """
+    s_lo,s_hi,_ = endpoints(s)
+    o_lo,o_hi,_ = endpoints(o)
+    if numpy.any(s_lo<0): raise ValueError('power: a real exponent needs a base in [0,inf), the power of a negative base is not real.')
+    with numpy.errstate(divide='ignore'): # 0**-1
+        if o_lo is o_hi: powers = (s_lo**o_lo, s_hi**o_lo) # o is a point
+        else: powers = (s_lo**o_lo, s_lo**o_hi, s_hi**o_lo, s_hi**o_hi)
+    l,h = minmax(powers,out=out)
+    return verify(l,h,outward)
+
+def matmul(s,o,mode:str=None,block:int=None,outward:bool=None):
+    """
+    Matrix product between two interval-like objects, or between an interval-like object and an ndarray.
+
+    Operands of dimension 1 are treated as in `numpy.matmul`, so vector-matrix, matrix-vector and inner products are allowed.
+
+    Returns the endpoints (lo,hi) of the product.
+
+    :mode: 'exact' or 'midrad'. If None the module-level `MATMUL_MODE` is used.
+
+    'exact' sums the products of the endpoints in blocks of `block` inner indices, so the (n,k,m) tensor 
+    of all the products is never built. When one operand is an ndarray the product is reduced to four ndarray matmuls.
+
+    'midrad' is the midpoint-radius product of Rump (1999), which costs at most four ndarray matmuls. 
+    The result encloses the exact product and is at most 1.5 times wider.
+
+    :block: number of inner indices processed at once in the exact mode. By default it is chosen so that 
+    each step builds at most `MATMUL_BLOCK_SIZE` products.
+
+    :outward: if True, or None and `OUTWARD` is True, the result is widened by a bound of the rounding errors of the 
+    sums of k products, (k+2)*eps*(|s|@|o|) per endpoint (twice as much in the midrad mode), then rounded outward.
+    """
+    if mode is None: mode = MATMUL_MODE
+    s_lo,s_hi,s_point = endpoints(s)
+    o_lo,o_hi,o_point = endpoints(o)
+    if (s_lo.ndim==0) | (o_lo.ndim==0): raise ValueError('matmul: input operands cannot be scalars.')
+    if (s_lo.ndim>2) | (o_lo.ndim>2): raise ValueError('matmul: input operands of dimension larger than 2 are not supported.')
+    s_vector, o_vector = s_lo.ndim==1, o_lo.ndim==1
+    if s_vector: s_lo,s_hi = s_lo[None,:], s_hi[None,:] # (k,) -> (1,k)
+    if o_vector: o_lo,o_hi = o_lo[:,None], o_hi[:,None] # (k,) -> (k,1)
+    if s_lo.shape[1]!=o_lo.shape[0]: raise ValueError(f'matmul: mismatch in the inner dimension, {s_lo.shape[1]} is different from {o_lo.shape[0]}.')
+    if mode == 'exact': l,h = matmul_exact(s_lo,s_hi,s_point,o_lo,o_hi,o_point,block=block)
+    elif mode == 'midrad': l,h = matmul_midrad(s_lo,s_hi,s_point,o_lo,o_hi,o_point)
+    else: raise ValueError(f"Unknown matmul mode '{mode}', choose between 'exact' and 'midrad'.")
+    if outward is None: outward = OUTWARD
+    if outward: 
+        magnitude = numpy.maximum(numpy.abs(s_lo),numpy.abs(s_hi)) @ numpy.maximum(numpy.abs(o_lo),numpy.abs(o_hi))
+        l,h = verify_sum(l,h,s_lo.shape[1],magnitude,outward=True,factor=2 if mode == 'midrad' else 1)
+    if s_vector: l,h = l[0], h[0]
+    if o_vector: l,h = l[...,0], h[...,0]
+    return l,h
+
+def matmul_exact(s_lo,s_hi,s_point,o_lo,o_hi,o_point,block:int=None):
+    if s_point & o_point: 
+        l = s_lo @ o_lo
+        return l, l.copy()
+    if s_point: # a*[b_lo,b_hi] is [a*b_lo,a*b_hi] if a>=0, [a*b_hi,a*b_lo] otherwise
+        s_pos, s_neg = numpy.maximum(s_lo,0), numpy.minimum(s_lo,0)
+        return s_pos @ o_lo + s_neg @ o_hi, s_pos @ o_hi + s_neg @ o_lo
+    if o_point:
+        o_pos, o_neg = numpy.maximum(o_lo,0), numpy.minimum(o_lo,0)
+        return s_lo @ o_pos + s_hi @ o_neg, s_hi @ o_pos + s_lo @ o_neg
+    n,k = s_lo.shape
+    m = o_lo.shape[1]
+    if block is None: block = int(numpy.clip(MATMUL_BLOCK_SIZE//max(n*m,1),1,max(k,1)))
+    dtype = numpy.result_type(s_lo,o_lo)
+    l,h = numpy.zeros((n,m),dtype=dtype),numpy.zeros((n,m),dtype=dtype)
+    for k0 in range(0,k,block):
+        k1 = k0+block
+        pl,ph = multiply_endpoints(s_lo[:,k0:k1,None],s_hi[:,k0:k1,None],o_lo[None,k0:k1,:],o_hi[None,k0:k1,:]) # (n,block,m)
+        l += pl.sum(axis=1)
+        h += ph.sum(axis=1)
+    return l,h
+
+def matmul_midrad(s_lo,s_hi,s_point,o_lo,o_hi,o_point):
+    s_mid, o_mid = (s_lo+s_hi)/2, (o_lo+o_hi)/2
+    mid = s_mid @ o_mid
+    if s_point & o_point: rad = numpy.zeros_like(mid)
+    elif s_point: rad = numpy.abs(s_mid) @ ((o_hi-o_lo)/2)
+    elif o_point: rad = ((s_hi-s_lo)/2) @ numpy.abs(o_mid)
+    else:
+        s_rad, o_rad = (s_hi-s_lo)/2, (o_hi-o_lo)/2
+        rad = numpy.abs(s_mid) @ o_rad + s_rad @ (numpy.abs(o_mid) + o_rad)
+    return mid-rad, mid+rad
+
+def endpoints(x):
+    """
+    Return the endpoints of x as ndarrays, and whether x is a point (non-interval) operand.
+    """
+    if hasattr(x,'lo'): return numpy.asarray(x.lo), numpy.asarray(x.hi), False
+    x = numpy.asarray(x)
+    return x, x, True
@@ -11,6 +11,10 @@ import matplotlib.pyplot as pyplot
 
 from itertools import repeat
 
+from intervals import (number, arithmetic)
+from intervals.methods import sqrt
+from intervals.arithmetic import minmax
+
 INTERVAL_TYPES=     {'Interval','ComplexInterval','IntervalArray','IntervalDataset'} # for compatibility with other types in this module. Data types sharing same public methods, like lo(), hi(), mid(), etc...
 
 NUMERIC_TYPES =     {'int','float','complex',                   # Python numbers     
@@ -21,6 +25,9 @@ NUMERIC_TYPES =     {'int','float','complex',                   # Python numbers
 
 machine_eps = 7./3 - 4./3 - 1
 
+COMPLEX_DIVIDE_MODE = 'tight' # mode of the division of ComplexIntervalArray: 'tight' (hull of the quotients) or 'naive' (formula of ComplexInterval), see `divide_parts`
+COMPLEX_DIVIDE_BLOCK_SIZE = 2**14 # elements divided at once in the tight mode
+
 
 # a = 1+1j
 # b = 2+3*1j
@@ -298,7 +305,186 @@ class ComplexInterval():
     # Override arithmetical operations END
     #------------------------------------------------------------------------------------------------------
 
+class ComplexIntervalArray():
+    """
+    Array of complex intervals, i.e. of rectangles of the complex plane, on top of the vectorised `intervals.number.Interval`.
+
+    The real and imaginary parts are two Intervals of the same shape, so the arithmetic runs on their lo/hi ndarrays
+    and one operation on n complex intervals costs a few numpy calls, instead of n ComplexInterval objects.
+
+    ComplexIntervalArray(lo, hi) takes the complex corners lo and hi, as for ComplexInterval. 
+    Use `fromparts` to build it from the real and imaginary parts.
+    """
+    __array_ufunc__ = None # ndarray + ComplexIntervalArray is left to __radd__
+    def __repr__(self): # return
+        lo, hi = self.lo.ravel(), self.hi.ravel()
+        show = lambda i: "【%g%+gi, %g%+gi】"%(lo[i].real,lo[i].imag,hi[i].real,hi[i].imag)
+        if len(lo)>10: return '\n'.join([show(i) for i in range(5)]+['...']+[show(i) for i in range(len(lo)-5,len(lo))])
+        return '\n'.join([show(i) for i in range(len(lo))])
+    def __str__(self): # print
+        return self.__repr__()
+    def __init__(self, lo, hi=None):
+        lo = numpy.asarray(lo, dtype=complex)
+        hi = lo if hi is None else numpy.asarray(hi, dtype=complex)
+        self.__real = number.Interval(numpy.ascontiguousarray(lo.real), numpy.ascontiguousarray(hi.real))
+        self.__imag = number.Interval(numpy.ascontiguousarray(lo.imag), numpy.ascontiguousarray(hi.imag))
+    @classmethod
+    def fromparts(cls, real, imag=None):
+        """
+        Build a ComplexIntervalArray from its real and imaginary parts, Intervals or real arrays, broadcast to one shape. 
+        The Intervals are not copied unless broadcast.
+        """
+        real = real if isinstance(real, number.Interval) else number.Interval(numpy.asarray(real, dtype=float))
+        imag = number.Interval(numpy.zeros(real.shape)) if imag is None else imag
+        imag = imag if isinstance(imag, number.Interval) else number.Interval(numpy.asarray(imag, dtype=float))
+        if real.shape != imag.shape:
+            shape = numpy.broadcast_shapes(real.shape, imag.shape)
+            real, imag = [x if x.shape == shape else number.Interval(numpy.broadcast_to(x.lo,shape).copy(),numpy.broadcast_to(x.hi,shape).copy()) for x in (real,imag)]
+        x = object.__new__(cls)
+        x.__real, x.__imag = real, imag
+        return x
+    def __len__(self): return len(self.__real)
+    def __getitem__(self, i): return ComplexIntervalArray.fromparts(self.__real[i], self.__imag[i])
+    @property
+    def real(self): return self.__real
+    @property
+    def imag(self): return self.__imag
+    @property
+    def lo(self): return self.__real.lo + 1j*self.__imag.lo
+    @property
+    def hi(self): return self.__real.hi + 1j*self.__imag.hi
+    @property
+    def mid(self): return (self.lo + self.hi)/2
+    @property
+    def shape(self): return self.__real.shape
+    def conjugate(self): return ComplexIntervalArray.fromparts(self.__real, -self.__imag)
+    def absolute(self):
+        """
+        The modulus, an Interval. Each part appears once, so the enclosure is exact.
+        """
+        return sqrt(self.__real**2 + self.__imag**2)
+    def tolist(self):
+        """
+        The list of the ComplexInterval scalars, in C order.
+        """
+        return [ComplexInterval(l,h) for l,h in zip(self.lo.ravel().tolist(),self.hi.ravel().tolist())]
+
+    #----------------------------------------#
+    # Override arithmetical operations START #
+    #----------------------------------------#
+    # The other operand is split into its real and imaginary parts by `complex_parts`, the imaginary part of a real operand is None.
+    def __neg__(self): return ComplexIntervalArray.fromparts(-self.__real, -self.__imag)
+    def __pos__(self): return self
+    def __add__(self, other):
+        c, d = complex_parts(other)
+        if c is None: return NotImplemented
+        return ComplexIntervalArray.fromparts(self.__real + c, self.__imag if d is None else self.__imag + d)
+    def __radd__(self, left): return self.__add__(left)
+    def __sub__(self, other):
+        c, d = complex_parts(other)
+        if c is None: return NotImplemented
+        return ComplexIntervalArray.fromparts(self.__real - c, self.__imag if d is None else self.__imag - d)
+    def __rsub__(self, left): return (-self).__add__(left)
+    def __mul__(self, other):
+        a, b = self.__real, self.__imag
+        c, d = complex_parts(other)
+        if c is None: return NotImplemented
+        if d is None: return ComplexIntervalArray.fromparts(a*c, b*c)
+        return ComplexIntervalArray.fromparts(a*c - b*d, a*d + b*c) # each part appears once in each product, so the hull of the products is exact
+    def __rmul__(self, left): return self.__mul__(left)
+    def __truediv__(self, other):
+        a, b = self.__real, self.__imag
+        c, d = complex_parts(other)
+        if c is None: return NotImplemented
+        if d is None: return ComplexIntervalArray.fromparts(a/c, b/c) # exact, as each part appears once
+        return ComplexIntervalArray.fromparts(*divide_parts(a, b, c, d))
+    def __rtruediv__(self, left):
+        c, d = complex_parts(left)
+        if c is None: return NotImplemented
+        return ComplexIntervalArray.fromparts(*divide_parts(c, numpy.zeros(numpy.shape(c)) if d is None else d, self.__real, self.__imag))
+    #------------------------------------------------------------------------------------------------------
+    # Override arithmetical operations END
+    #------------------------------------------------------------------------------------------------------
+
+def complex_parts(x):
+    """
+    The real and imaginary parts of a complex interval or number, as Intervals or real arrays. 
+    The imaginary part of a real operand is None, and both are None if x is not a number.
+    """
+    if isinstance(x, ComplexIntervalArray): return x.real, x.imag
+    if isinstance(x, ComplexInterval): 
+        return number.Interval(numpy.asarray(x.lo().real),numpy.asarray(x.hi().real)), number.Interval(numpy.asarray(x.lo().imag),numpy.asarray(x.hi().imag))
+    if isinstance(x, number.Interval): return x, None
+    if isinstance(x, Interval): return number.Interval(numpy.asarray(x.lo(),dtype=float),numpy.asarray(x.hi(),dtype=float)), None # the legacy scalar Interval
+    if x.__class__.__name__ not in NUMERIC_TYPES|{'ndarray'}: return None, None
+    x = numpy.asarray(x)
+    if x.dtype.kind == 'c': return x.real, x.imag
+    if x.dtype.kind in 'iuf': return x, None
+    return None, None
+
+def divide_parts(a, b, c, d, mode:str=None, outward:bool=None):
+    """
+    The real and imaginary parts, two Intervals, of the quotient of the complex intervals a+ib and c+id, 
+    whose parts are Intervals or real arrays of broadcastable shapes.
+
+    'tight' returns the rectangular hull of the quotients p/q. Re(p/q) and Im(p/q) are linear in p and harmonic in q away from zero, 
+    so their extrema are at a corner of a+ib and on an edge of c+id, where they are found analytically, see `edge_extrema`.
+    'naive' evaluates (ac+bd)/(c²+d²) and (bc-ad)/(c²+d²) with interval arithmetic, as ComplexInterval does, 
+    which is wider as c and d appear more than once. Default is `COMPLEX_DIVIDE_MODE`.
 
+    :outward: if True, or None and `arithmetic.OUTWARD` is True, the tight parts are widened by a bound of the rounding errors, 
+    16 ulps of |a+ib|/|c+id|, then rounded outward.
+
+    Raises ZeroDivisionError if c+id contains zero.
+    """
+    if mode is None: mode = COMPLEX_DIVIDE_MODE
+    if mode == 'naive':
+        den = c**2 + d**2 # raises ZeroDivisionError if it contains zero
+        return (a*c + b*d)/den, (b*c - a*d)/den
+    if mode != 'tight': raise ValueError(f"Unknown divide mode '{mode}', choose between 'tight' and 'naive'.")
+    a_lo,a_hi,b_lo,b_hi,c_lo,c_hi,d_lo,d_hi = numpy.broadcast_arrays(*[numpy.asarray(e(x),dtype=float) for x in (a,b,c,d) for e in (number.lo,number.hi)])
+    if numpy.any((c_lo<=0) & (c_hi>=0) & (d_lo<=0) & (d_hi>=0)): raise ZeroDivisionError
+    shape = a_lo.shape
+    re_lo, re_hi, im_lo, im_hi = [numpy.empty(shape) for _ in range(4)]
+    flat = [x.reshape(-1) for x in (a_lo,a_hi,b_lo,b_hi,c_lo,c_hi,d_lo,d_hi,re_lo,re_hi,im_lo,im_hi)]
+    n = flat[0].shape[0]
+    for i in range(0, n, COMPLEX_DIVIDE_BLOCK_SIZE): # blocks bound the (8,block) temporaries
+        j = min(i + COMPLEX_DIVIDE_BLOCK_SIZE, n)
+        a_lo,a_hi,b_lo,b_hi,c_lo,c_hi,d_lo,d_hi,r_lo,r_hi,i_lo,i_hi = [x[i:j] for x in flat]
+        # u+iv runs over the corners p of a+ib for the real part, and over -ip = b-ia for the imaginary part
+        u = numpy.stack((a_lo,a_lo,a_hi,a_hi, b_lo,b_hi,b_lo,b_hi))
+        v = numpy.stack((b_lo,b_hi,b_lo,b_hi, -a_lo,-a_lo,-a_hi,-a_hi))
+        r = numpy.hypot(u, v)
+        values = (edge_extrema(u, v, c_lo, d_lo, d_hi, r, ends=True) + edge_extrema(u, v, c_hi, d_lo, d_hi, r, ends=True) + # q = s+it
+                  edge_extrema(v, u, d_lo, c_lo, c_hi, r) + edge_extrema(v, u, d_hi, c_lo, c_hi, r)) # q = t+is, its ends are corners
+        l, h = minmax(values)
+        numpy.fmin.reduce(l[:4], axis=0, out=r_lo); numpy.fmax.reduce(h[:4], axis=0, out=r_hi)
+        numpy.fmin.reduce(l[4:], axis=0, out=i_lo); numpy.fmax.reduce(h[4:], axis=0, out=i_hi)
+    if outward is None: outward = arithmetic.OUTWARD
+    if outward:
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            p_mag = numpy.hypot(numpy.maximum(numpy.abs(a_lo),numpy.abs(a_hi)), numpy.maximum(numpy.abs(b_lo),numpy.abs(b_hi)))
+            q_mig = numpy.hypot(numpy.where(c_lo > 0, c_lo, numpy.where(c_hi < 0, -c_hi, 0)), numpy.where(d_lo > 0, d_lo, numpy.where(d_hi < 0, -d_hi, 0)))
+            error = 16 * numpy.finfo(float).eps * p_mag / q_mig
+        re_lo, re_hi = arithmetic.round_outward(re_lo-error, re_hi+error)
+        im_lo, im_hi = arithmetic.round_outward(im_lo-error, im_hi+error)
+    return number.Interval(re_lo, re_hi), number.Interval(im_lo, im_hi)
+
+def edge_extrema(u, v, s, t0, t1, r, ends:bool=False):
+    """
+    The candidate extrema over t in [t0,t1] of (u*s + v*t)/(s**2 + t**2), i.e. of Re((u+iv)/q) on the edge q = s+it of the divisor, 
+    or on q = t+is with u and v swapped. r is |u+iv|. The ends are included only if `ends` is True.
+
+    The extrema are at the ends, or at the roots of v*t**2 + 2*u*s*t - v*s**2, which are σsv/w and -σsw/v with w = r+|u|
+    and σ the sign of u. This form has no cancellation. The roots are clipped to the edge, where the ends are candidates anyway.
+    """
+    f = lambda t: (u*s + v*t)/(s*s + t*t)
+    w = r + numpy.abs(u)
+    s_sign = numpy.where(u < 0, -s, s)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        values = [f(numpy.clip(s_sign*v/w, t0, t1)), f(numpy.clip(-s_sign*w/v, t0, t1))] # inf is clipped to an end, nan if u+iv is 0
+        if ends: values += [f(t0), f(t1)]
+    return values
 
 class Interval(): 
     '''
@@ -725,7 +911,7 @@ class Interval():
     # Override arithmetic operators END
     #------------------------------------------------------------------------------------------------------
 
-def BRUTEFORCE(N=100):  # DECORATOR for "over the top" non-intrusive propagation of intervals
+def BRUTEFORCE(N=100):  # DECORATOR for "over the top" non-intrusive propagation of intervals. For intervals.number.Interval arrays see intervals.sampling
     def decorator(fn):
         def wrapper(*argv):
             u = numpy.random.random_sample((len(argv),N))
@@ -744,7 +930,7 @@ def BRUTEFORCE(N=100):  # DECORATOR for "over the top" non-intrusive propagation
         return wrapper
     return decorator
 
-def SUBINTERVALIZE(N=20): # DECORATOR for "over the top" subintervalization (intrusive propagation)
+def SUBINTERVALIZE(N=20): # DECORATOR for "over the top" subintervalization (intrusive propagation). For intervals.number.Interval arrays see intervals.methods
     def decorator(fn):
         def wrapper(*argv):
             indices = range(len(argv)) # this will be implementated but not essential at the moment.
@@ -793,7 +979,7 @@ class interval(Interval):
         return self.__class__.__bases__[0].__name__
 
 
-class IntervalArray(): # wrapper class of the scalar class interval with some plotting facilities
+class IntervalArray(): # adapter of the vectorised intervals.number.Interval, with the interface of the former list-based class and some plotting facilities
     """
     ∞ --------------------------- ∞
     Created Mon Jul 24 2020
@@ -801,108 +987,112 @@ class IntervalArray(): # wrapper class of the scalar class interval with some pl
     github.com/marcodeangelis
     MIT License
     ∞ --------------------------- ∞
+
+    The endpoints are held by an intervals.number.Interval, see `interval`, which is wrapped without copying,
+    so the arithmetic is vectorised. Built from lists, the endpoints are stored with layout 'first', so that `toarray()` is a view of them.
+    As in the former class, `lo()`, `hi()` and `slider()` return lists, while `interval.lo` and `interval.hi` are the arrays themselves.
+    Built from a list of ComplexIntervals, the endpoints are complex and are held by a `ComplexIntervalArray` instead.
+
+    Indexing with an int and iterating give scalar Intervals of this module, or ComplexIntervals, as `tolist`.
     """
     def __repr__(self): # return
-        if len(self)>10:
-            a = [str(i) for i in self]
-            s = '\n'.join(a[:5]+['...']+a[-5:-1])
-        else:
-            s = '\n'.join([str(i) for i in self])
-        return s
+        if len(self)>10: return '\n'.join([str(self[i]) for i in range(5)]+['...']+[str(self[i]) for i in range(len(self)-5,len(self))])
+        return '\n'.join([str(i) for i in self])
     def __str__(self): # print
-        s = '\n'.join([str(i) for i in self])
-        return s
+        return '\n'.join([str(i) for i in self])
     def __len__(self):
-        return len([i for i in self])
+        return len(self.__x)
     def __init__(self,*args,notation='infsup',axis=0,name=''):
         self.name = name # initialise this with an empty string
+        if len(args)==1 and isinstance(args[0], (number.Interval, ComplexIntervalArray, IntervalArray)): # wrapped, not copied
+            self.__x = args[0].interval if isinstance(args[0], IntervalArray) else args[0]
+            return
         if len(args)==0:  # what should an empty IntervalArray(object) look like?
-            self.__lo = [-1]
-            self.__hi = [1]
-        elif len(args)==1:   # this must be a list, tuple (array?) of intervals
-            assert args[0].__class__.__name__ in ['list', 'tuple','IntervalArray'], 'single input must be list or a tuple of intervals.'
-            if args[0][0].__class__.__name__ in ['Interval','ComplexInterval']:
-                self.__lo = [x.lo() for x in args[0]]
-                self.__hi = [x.hi() for x in args[0]]
-            elif args[0][0].__class__.__name__ in NUMERIC_TYPES:
-                self.__lo, self.__hi = args[0], args[0]
-            elif args[0][0].__class__.__name__ in ['list','tuple']:
+            lo, hi = [-1], [1]
+        elif len(args)==1:   # this must be a list, tuple or array of intervals
+            assert args[0].__class__.__name__ in ['list','tuple','ndarray'], 'single input must be list or a tuple of intervals.'
+            first = args[0][0] if len(args[0])>0 else None
+            if first.__class__.__name__ == 'ComplexInterval': # complex endpoints, as in the former class
+                self.__x = ComplexIntervalArray(numpy.asarray([x.lo() for x in args[0]],dtype=complex), numpy.asarray([x.hi() for x in args[0]],dtype=complex))
+                return
+            if len(args[0])==0: lo, hi = [], []
+            elif first.__class__.__name__ in ['Interval','I','interval']:
+                lo, hi = [x.lo() for x in args[0]], [x.hi() for x in args[0]]
+            elif first.__class__.__name__ in NUMERIC_TYPES:
+                lo, hi = args[0], args[0]
+            elif first.__class__.__name__ in ['list','tuple','ndarray']:
                 if axis == 0:
-                    if len(args[0])==1:
-                        self.__lo, self.__hi = args[0][0], args[0][0]
-                    if len(args[0])==2:
-                        # assert len(args[0]) == 2, 'a list or tuple is needed.'
-                        self.__lo, self.__hi = args[0][0], args[0][1]
+                    if len(args[0]) not in (1,2): raise ValueError(f'with axis=0 the rows are [lo,hi] or [values], got {len(args[0])} rows.')
+                    lo, hi = args[0][0], args[0][-1] # [lo,hi], or [values]
                 elif axis == 1:
-                    self.__lo = list([x for x in zip(*args[0])][0])
-                    self.__hi = list([x for x in zip(*args[0])][1])
-        elif len(args)==2:
-            if args[0].__class__.__name__ == 'list':
-                self.__lo, self.__hi = args[0], args[1]
-            else:
-                self.__lo = list()
-                self.__hi = list()
-                for a in args:
-                    if a.__class__.__name__ == 'tuple':
-                        self.__lo.append(a[0]) 
-                        self.__hi.append(a[1])
-                    elif a.__class__.__name__ == 'Interval':
-                        self.__lo.append(a.lo()) 
-                        self.__hi.append(a.hi())
-                    else:
-                        raise TypeError('multiple arguments must be a tuple or an interval.')
+                    lo, hi = [x[0] for x in args[0]], [x[1] for x in args[0]]
+                else: raise ValueError(f'axis must be 0 or 1, got {axis}.')
+            else: raise TypeError(f'cannot build an IntervalArray from a sequence of {first.__class__.__name__}.')
+        elif len(args)==2 and args[0].__class__.__name__ in ['list','ndarray']:
+            lo, hi = args[0], args[1]
+        else:
+            lo, hi = list(), list()
+            for a in args:
+                if a.__class__.__name__ == 'tuple': lo.append(a[0]); hi.append(a[1])
+                elif a.__class__.__name__ in ['Interval','I','interval']: lo.append(a.lo()); hi.append(a.hi())
+                else: raise TypeError('multiple arguments must be a tuple or an interval.')
+        self.__x = number.Interval(numpy.asarray(lo,dtype=float), numpy.asarray(hi,dtype=float), layout='first')
     def __iter__(self): # make class iterable
-        for l,u in zip(self.__lo,self.__hi):
-            yield Interval(l,u)
+        scalar = ComplexInterval if isinstance(self.__x, ComplexIntervalArray) else Interval
+        for l,u in zip(self.__x.lo.tolist(),self.__x.hi.tolist()):
+            yield scalar(l,u)
     def __getitem__(self,index): # make class subscrictable
-        if index.__class__.__name__ in ['list','tuple']:
-            if len(index)>0:
-                return IntervalArray([Interval(self.__lo[i],self.__hi[i]) for i in index])
-            else:
-                return IntervalArray([]) # todo: create empty dataset
-        else:
-            return Interval(self.__lo[index],self.__hi[index])
+        scalar = ComplexInterval if isinstance(self.__x, ComplexIntervalArray) else Interval
+        if isinstance(index, (int, numpy.integer)): return scalar(self.__x.lo[index].item(), self.__x.hi[index].item())
+        if index.__class__.__name__ in ['list','tuple']: index = numpy.asarray(index, dtype=int)
+        return IntervalArray(self.__x[index])
+    @property
+    def interval(self):
+        return self.__x
     def inf(self):
-        return self.__lo
-    def lo(self):
-        return self.__lo
+        return self.__x.lo.tolist()
+    def lo(self): # a list as in the former class, `interval.lo` is the array
+        return self.__x.lo.tolist()
     def sup(self):
-        return self.__hi
+        return self.__x.hi.tolist()
     def hi(self):
-        return self.__hi
+        return self.__x.hi.tolist()
     def tolist(self):
-        return [Interval(l,h) for l,h in zip(self.__lo,self.__hi)]
+        return list(self)
     def toarray(self, order='F'):
+        """
+        The endpoints as an array of shape (2,n) with order 'F', or (n,2) with order 'C'. A view where the layout of the endpoints allows it.
+        """
         if order=='F':
-            return numpy.array([self.__lo, self.__hi])
+            if getattr(self.__x, 'layout', None) == 'first': return self.__x.buffer
+            return numpy.stack((self.__x.lo, self.__x.hi))
         elif order=='C':
-            return numpy.array([self.__lo, self.__hi]).T
-    def slider(self,p=0.5):  
+            if getattr(self.__x, 'layout', None) == 'last': return self.__x.buffer
+            return numpy.stack((self.__x.lo, self.__x.hi), axis=-1)
+    def slider(self,p=0.5):
         if p.__class__.__name__ in ['list','tuple']:
             assert len(self)==len(p), f'p must be of length {len(self)}'
-            return [si.slider(pi) for si,pi in zip(self,p)]
-        else:
-            return [si.slider(p) for si in self] # p = list(repeat(.5, times=len(self)))
+        return (self.__x.lo + numpy.asarray(p) * (self.__x.hi - self.__x.lo)).tolist()
     # Magic methods
+    # The other operand is an IntervalArray, an intervals.number.Interval, a number or an array, broadcast against self.
     def __add__(self,other):
-        return IntervalArray([a+b for a,b in zip(self,other)])
+        return IntervalArray(self.__x + operand(other))
     def __sub__(self,other):
-        return IntervalArray([a-b for a,b in zip(self,other)])
+        return IntervalArray(self.__x - operand(other))
     def __mul__(self,other):
-        return IntervalArray([a*b for a,b in zip(self,other)])
+        return IntervalArray(self.__x * operand(other))
     def __truediv__(self,other):
-        return IntervalArray([a/b for a,b in zip(self,other)])
+        return IntervalArray(self.__x / operand(other))
     
     def plot(self,marker='_',size=20,xlabel='x',ylabel='y',title='',save=None):
         N = len(self)
         fig = pyplot.figure(figsize=(18,6))
         ax = fig.subplots()
-        x = list(range(0,N))
-        ax.plot(x,self.lo())
-        ax.plot(x,self.hi())
-        ax.fill_between(x=x, y1=self.hi(), y2=self.lo(), alpha=0.3)
-        for i in range(0,N):
-            ax.scatter([i,i],[self.lo()[i],self.hi()[i]],s=size,marker=marker)
+        x = numpy.arange(N)
+        ax.plot(x,self.__x.lo)
+        ax.plot(x,self.__x.hi)
+        ax.fill_between(x=x, y1=self.__x.hi, y2=self.__x.lo, alpha=0.3)
+        ax.scatter(numpy.repeat(x,2),self.toarray(order='C').reshape(-1),s=size,marker=marker)
         ax.set_xlabel(xlabel,fontsize=20)
         ax.set_ylabel(ylabel,fontsize=20)
         ax.tick_params(direction='out', length=6, width=2, labelsize=14) #https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.axes.Axes.tick_params.html
@@ -911,3 +1101,14 @@ class IntervalArray(): # wrapper class of the scalar class interval with some pl
         if save is not None:
             pyplot.savefig(save)
         pyplot.show()
+
+def operand(x):
+    """
+    The intervals.number.Interval, or the array, for an operand of IntervalArray. Lists of scalar Intervals are converted.
+    Complex operands are left to ComplexIntervalArray.
+    """
+    if isinstance(x, IntervalArray): return x.interval
+    if isinstance(x, (number.Interval, ComplexIntervalArray, ComplexInterval)): return x
+    if isinstance(x, Interval): return number.Interval(numpy.asarray(x.lo(),dtype=float), numpy.asarray(x.hi(),dtype=float)) # broadcast
+    if x.__class__.__name__ in ['list','tuple']: return IntervalArray(x).interval
+    return x
@@ -27,12 +27,19 @@ Subintervalisation methods, IR -> IR^n.
 from __future__ import annotations
 from typing import (Sequence, Sized, Iterable, Optional, Any, Tuple, Union)
 
+import sys
+import time
+import math
+import functools
 from itertools import product
+from collections import OrderedDict
+from functools import wraps
 
 import numpy
-from numpy import (ndarray,asarray,transpose,vstack,linspace,zeros,argmax)
+from numpy import (ndarray,asarray,vstack,linspace,zeros,argmax)
 
-from intervals.number import (Interval, MACHINE_EPS)
+from intervals.number import (Interval, ScalarInterval, MACHINE_EPS, implements)
+import intervals.arithmetic as arithmetic
 
 numpy_min = numpy.min
 numpy_max = numpy.max
@@ -45,7 +52,8 @@ numpy_cos = numpy.cos
 numpy_tan = numpy.tan
 # numpy_cot = numpy.cotang
 numpy_pi  = numpy.pi
-numpy_inf = numpy.Inf
+numpy_pihalf = numpy.pi/2
+numpy_inf = numpy.inf
 
 # Properties or maybe attributes of the interval class. These apply to all interval-like objects.
 
@@ -109,7 +117,25 @@ def mag(x): return numpy_min(numpy_abs(x.lo),numpy_abs(x.hi)) # magnitude
 #####################################################################################
 # unary.py
 #####################################################################################
+def verified(lower:float=None, upper:float=None):
+    """
+    Add the keyword `outward` to a function of one interval. 
+    
+    If `outward` is True, or None and the verified mode `arithmetic.OUTWARD` is on, the endpoints of the result 
+    are rounded outward by one ulp, and clipped to the range [lower,upper] of the function.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(x, *args, outward:bool=None, **kwargs):
+            y = fn(x, *args, **kwargs)
+            if outward is None: outward = arithmetic.OUTWARD
+            if outward and is_Interval(y): return Interval(*arithmetic.round_outward(y.lo,y.hi,lower=lower,upper=upper))
+            return y
+        return wrapper
+    return decorator
+
 # Interval to interval methods. Unary.
+@implements(numpy.absolute)
 def abs(x:Interval):
     """
     Return the absolute value of an Interval.
@@ -128,9 +154,11 @@ def abs(x:Interval):
             if zero_in_x: a = 0
         else: a[zero_in_x] = 0
         b = numpy.max((x_lo_abs, x_hi_abs),axis=0)
-        return Interval(a,b)
+        return endpoints_like(x,a,b)
     return x_lo_abs
 
+@implements(numpy.sqrt)
+@verified(lower=0)
 def sqrt(x:Interval):
     """
     Return the square root of an Interval.
@@ -140,317 +168,282 @@ def sqrt(x:Interval):
     If x is neither a number (neither Interval not numeric), numpy will throw an exception.
     
     """
-    x_lo_sqrt =  numpy.sqrt(lo(x))
-    if is_Interval(x):
-        x_hi_sqrt = numpy.sqrt(hi(x))
-        return Interval(x_lo_sqrt,x_hi_sqrt)
-    return x_lo_sqrt
+    if is_not_Interval(x): return numpy_sqrt(x)
+    return monotonic(numpy_sqrt,math.sqrt,x,domain=(0,numpy_inf)) # restricted to the domain, as the elementary functions below
 
+@implements(numpy.exp)
+@verified(lower=0)
 def exp(x:Interval):
     if is_not_Interval(x): return numpy_exp(x)
-    return Interval(numpy_exp(lo(x)),numpy_exp(hi(x)))
+    return monotonic(numpy_exp,math.exp,x)
+
+# Elementary functions. Each is a kernel on the endpoint arrays, so a single pass of ufuncs covers any shape.
+# The monotonic functions map the endpoints, the even ones (cosh) use the mignitude for the minimum. 
+# Inputs are restricted to the domain of the function, e.g. log([-1,1]) = [-inf,0], and an input outside the domain gives [nan,nan].
+@implements(numpy.log)
+@verified()
+def log(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.log(x)
+    return monotonic(numpy.log,math.log,x,domain=(0,numpy_inf))
+
+@implements(numpy.log10)
+@verified()
+def log10(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.log10(x)
+    return monotonic(numpy.log10,math.log10,x,domain=(0,numpy_inf))
+
+@implements(numpy.arcsin)
+@verified()
+def arcsin(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.arcsin(x)
+    return monotonic(numpy.arcsin,math.asin,x,domain=(-1,1))
+
+@implements(numpy.arccos)
+@verified(lower=0)
+def arccos(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.arccos(x)
+    return monotonic(numpy.arccos,math.acos,x,domain=(-1,1),decreasing=True)
+
+@implements(numpy.arctan)
+@verified()
+def arctan(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.arctan(x)
+    return monotonic(numpy.arctan,math.atan,x)
+
+@implements(numpy.sinh)
+@verified()
+def sinh(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.sinh(x)
+    return monotonic(numpy.sinh,math.sinh,x)
+
+@implements(numpy.cosh)
+@verified(lower=1)
+def cosh(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.cosh(x)
+    l,h = x.lo,x.hi
+    if type(x) is ScalarInterval:
+        try: return Interval(math.cosh(l if l>0 else h if h<0 else 0.), math.cosh(-l if -l>h else h))
+        except OverflowError: pass
+    with numpy.errstate(over='ignore'):
+        a = numpy.cosh(numpy.where(l>0, l, numpy.where(h<0, h, 0))) # the point of x closest to zero
+        b = numpy.cosh(numpy.fmax(numpy_abs(l),numpy_abs(h)))
+    return endpoints_like(x,a,b)
+
+@implements(numpy.tanh)
+@verified(lower=-1,upper=1)
+def tanh(x:Interval) -> Interval:
+    if is_not_Interval(x): return numpy.tanh(x)
+    return monotonic(numpy.tanh,math.tanh,x)
+
+def monotonic(f, f_scalar, x:Interval, domain:tuple=None, decreasing:bool=False) -> Interval:
+    """
+    Return the image of x through the monotonic ufunc f, with x restricted to the `domain=(lower,upper)` of f.
+
+    The endpoints of a ScalarInterval go through `f_scalar`, the same function from the math module, 
+    unless it raises at the boundary of the domain or on overflow, e.g. math.log(0).
+    """
+    l,h = x.lo,x.hi
+    if type(x) is ScalarInterval:
+        if domain is not None: l,h = (l if l>domain[0] else domain[0]), (h if h<domain[1] else domain[1]) # max and min here are the interval ones
+        if l > h: return Interval(numpy.nan,numpy.nan)
+        try: a,b = f_scalar(l),f_scalar(h)
+        except (ValueError,OverflowError): pass
+        else: return Interval(b,a) if decreasing else Interval(a,b)
+    if domain is not None: 
+        l,h = numpy.maximum(l,domain[0]), numpy.minimum(h,domain[1])
+        empty = l>h
+        if numpy.any(empty): l,h = numpy.where(empty,numpy.nan,l), numpy.where(empty,numpy.nan,h)
+    with numpy.errstate(divide='ignore',over='ignore'): # log(0), sinh(1000)
+        a,b = f(l),f(h)
+    if decreasing: a,b = b,a
+    return endpoints_like(x,a,b)
+
+def endpoints_like(x:Interval, a, b) -> Interval:
+    """
+    Return the Interval [a,b], a ScalarInterval if x is one.
+    """
+    if (type(x) is ScalarInterval) & (numpy.ndim(a)==0): return Interval(float(a),float(b))
+    return Interval(a,b)
     
 #####################################################################################
 # binary.py
 #####################################################################################
 # Binary methods between two intervals
 # 2-interval to interval. Bianry.
+@implements(numpy.maximum)
 def max(x:Interval, y:Interval):
     if all([is_not_Interval(x),is_not_Interval(y)]):
         return numpy.max((x,y), axis=0)
-    a = numpy.max((lo(x),lo(y)), axis=0)
-    b = numpy.max((hi(x),hi(y)), axis=0)
+    a = numpy.maximum(lo(x),lo(y))
+    b = numpy.maximum(hi(x),hi(y))
     return Interval(a,b)
+@implements(numpy.minimum)
 def min(x:Interval, y:Interval): 
     if all([is_not_Interval(x),is_not_Interval(y)]):
         return numpy.min((x,y), axis=0)
-    a = numpy.min((lo(x),lo(y)), axis=0)
-    b = numpy.min((hi(x),hi(y)), axis=0)
+    a = numpy.minimum(lo(x),lo(y))
+    b = numpy.minimum(hi(x),hi(y))
     return Interval(a,b)
 
+
+# Arithmetic in functional form. If `out` is given the result is written into the endpoint arrays of `out`, 
+# which must be writeable and have the shape of the result, and `out` is returned. So no new arrays are allocated
+# for the result, e.g. `add(x,dx,out=x)` updates x in place.
+# If `outward` is True the endpoints are rounded outward by one ulp, if None the verified mode `arithmetic.OUTWARD` decides.
+@implements(numpy.add)
+def add(x:Interval, y:Interval, out:Interval=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.add(x,y)
+    l,h = arithmetic.add(x,y,out=None if out is None else (out.lo,out.hi),outward=outward)
+    if out is None: return Interval(l,h)
+    return out
+@implements(numpy.subtract)
+def subtract(x:Interval, y:Interval, out:Interval=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.subtract(x,y)
+    l,h = arithmetic.subtract(x,y,out=None if out is None else (out.lo,out.hi),outward=outward)
+    if out is None: return Interval(l,h)
+    return out
+@implements(numpy.multiply)
+def multiply(x:Interval, y:Interval, out:Interval=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.multiply(x,y)
+    engine = 'minmax' if is_not_Interval(x) | is_not_Interval(y) else None # only the minmax engine takes non-interval operands
+    l,h = arithmetic.multiply(x,y,engine=engine,out=None if out is None else (out.lo,out.hi),outward=outward)
+    if out is None: return Interval(l,h)
+    return out
+@implements(numpy.divide)
+def divide(x:Interval, y:Interval, out:Interval=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.divide(x,y)
+    engine = 'minmax' if is_not_Interval(x) | is_not_Interval(y) else None
+    l,h = arithmetic.divide(x,y,engine=engine,out=None if out is None else (out.lo,out.hi),outward=outward)
+    if out is None: return Interval(l,h)
+    return out
+
+@implements(numpy.matmul)
+def matmul(x:Interval, y:Interval, outward:bool=None) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.matmul(x,y)
+    return Interval(*arithmetic.matmul(x,y,outward=outward))
+@implements(numpy.power)
+def power(x:Interval, y:Union[int,float,Interval]) -> Interval:
+    """
+    Return x**y. For non-integer exponents the base must lie in [0,inf), and y can be an Interval, see `arithmetic.power`.
+    """
+    if is_not_Interval(x): 
+        if is_not_Interval(y): return numpy.power(x,y)
+        return Interval(*arithmetic.power(x,y))
+    return x**y
+pow = power
+@implements(numpy.square)
+def square(x:Interval) -> Interval: 
+    if is_not_Interval(x): return numpy.square(x)
+    return x**2
+
 #####################################################################################
 # trig.py
 #####################################################################################
-def sin(x:Interval): 
-    '''
-    Implementation of Interval Arithmetic in CORA 2016
-
-    Matthias Althoff and Dmitry Grebenyuk
-    
-    EPiC Series in Computing Volume 43, 2017, Pages 91-105
+TRIG_CHUNK_SIZE = 2**16 # number of elements processed at once by the trig kernels, so the temporaries of a chunk stay in cache
 
-    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
-    '''
-    if not(is_Interval(x)): return numpy_sin(x) # int, float, ndarray
-
-    if not(x.scalar): return sin_vector(x) 
-
-    twopi = 2*numpy_pi
-    pihalf = numpy_pi/2
-
-    if width(x)>=twopi: return Interval(-1,1)
-
-    domain1 = Interval(0, pihalf)
-    domain2 = Interval(pihalf, 3*pihalf)
-    domain3 = Interval(3*pihalf, twopi)
-
-    yl = x.lo%twopi
-    yh = x.hi%twopi
-    y = Interval(lo=yl,hi=yh)
-
-    sin_l = numpy_sin(yl)
-    sin_h = numpy_sin(yh)
-
-    if contain(domain1,y) & (yl<=yh): return Interval(sin_l,sin_h)
-    if contain(domain2,y) & (yl<=yh): return Interval(sin_h,sin_l)
-    if contain(domain3,y) & (yl<=yh): return Interval(sin_l,sin_h)
-
-    case1a = contain(domain1,yl) & contain(domain1,yh) & (yl>yh)
-    case1b = contain(domain1,yl) & contain(domain3,yh) 
-    case1c = contain(domain2,yl) & contain(domain2,yh) & (yl>yh)
-    case1d = contain(domain3,yl) & contain(domain3,yh) & (yl>yh) 
-
-    case2a = contain(domain1,yl) & contain(domain1,yh) & (yl<=yh)
-    case2b = contain(domain3,yl) & contain(domain1,yh) 
-    case2c = contain(domain3,yl) & contain(domain3,yh) & (yl<=yh)
-
-    case3a = contain(domain1,yl) & contain(domain2,yh) 
-    case3b = contain(domain3,yl) & contain(domain2,yh) 
-
-    case4a = contain(domain2,yl) & contain(domain1,yh) 
-    case4b = contain(domain2,yl) & contain(domain3,yh) 
-
-    case5 = contain(domain2,yl) & contain(domain2,yh) & (yl<=yh) 
-
-    if case1a | case1b | case1c | case1d : return Interval(-1,1)
-    if case2a | case2b | case2c : return Interval(sin_l,sin_h)
-    if case3a | case3b : return Interval(min(sin_l,sin_h),1)
-    if case4a | case4b : return Interval(-1,max(sin_l,sin_h))
-    if case5: return Interval(sin_h,sin_l)
-
-    pass
-
-def sin_vector(x:Interval): # vectorised version of sin().
-
-    if x.unsized: return sin(x)
-
-    twopi = 2*numpy_pi
-    pihalf = numpy_pi/2
-    
-    mask1a = width(x)>=twopi
-
-    domain1 = Interval(0, pihalf)
-    domain2 = Interval(pihalf, 3*pihalf)
-    domain3 = Interval(3*pihalf, twopi)
-
-    yl = x.lo%twopi
-    yh = x.hi%twopi
-    y = Interval(yl,yh)
-
-    sin_l = numpy_sin(yl)
-    sin_h = numpy_sin(yh)
-
-    # [l,h] all else
-    a = sin_l.copy()
-    b = sin_h.copy()
-
-    # [-1,1]
-    mask3a = contain(domain1,yl) & contain(domain1,yh) & (yl>yh) 
-    mask3b = contain(domain1,yl) & contain(domain3,yh) 
-    mask3c = contain(domain2,yl) & contain(domain2,yh) & (yl>yh) 
-    mask3d = contain(domain3,yl) & contain(domain3,yh) & (yl>yh) 
-    case1 = mask1a|mask3a|mask3b|mask3c|mask3d
-    a[case1] = -1
-    b[case1] =  1
-    if all(case1): return Interval(lo=a,hi=b)
-    # [h,l]
-    mask2b = contain(domain2,yl[~case1]) & contain(domain2,yh[~case1]) & (yl[~case1]<=yh[~case1])  #return Interval(sin_h,sin_l)
-    case2 = mask2b 
-    a[case2] = sin_h[case2]
-    b[case2] = sin_l[case2]
-    # [min, 1]
-    mask5a = contain(domain1,yl[~case1]) & contain(domain2,yh[~case1]) 
-    mask5b = contain(domain3,yl[~case1]) & contain(domain2,yh[~case1])
-    case3 = mask5a|mask5b
-    a[case3] = min(sin_l[case3],sin_h[case3]) 
-    b[case3] = 1
-    # [-1, max]
-    mask6a = contain(domain2,yl[~case1]) & contain(domain1,yh[~case1]) 
-    mask6b = contain(domain2,yl[~case1]) & contain(domain3,yh[~case1]) 
-    case4 = mask6a|mask6b
-    a[case4] = -1
-    b[case4] = max(sin_l[case4],sin_h[case4])
-    return Interval(lo=a,hi=b)
-
-def cos(x:Interval): 
-    '''
-    Implementation of Interval Arithmetic in CORA 2016
-
-    Matthias Althoff and Dmitry Grebenyuk
-    
-    EPiC Series in Computing Volume 43, 2017, Pages 91-105
-
-    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
-    '''
-    if not(is_Interval(x)): return numpy_cos(x) # int, float, ndarray
-
-    if not(x.scalar): return cos_vector(x) 
-
-    twopi = 2*numpy_pi
-
-    # [-1,1] aka case 0
-    if width(x)>=twopi: return Interval(-1,1)
-
-    domain1 = Interval(0, numpy_pi)
-    domain2 = Interval(numpy_pi, 2*numpy_pi)
-
-    yl = x.lo%twopi
-    yh = x.hi%twopi
-    y = Interval(lo=yl,hi=yh)
-
-    cos_l = numpy_cos(yl)
-    cos_h = numpy_cos(yh)
-
-    # [-1,1]
-    case1a = (yh<yl) & contain(domain1,yl) & contain(domain1,yh)
-    case1b = (yh<yl) & contain(domain2,yl) & contain(domain2,yh)
-    # [cos_l, cos_h]
-    case2a = (yl<=yh) & contain(domain2,yl) & contain(domain2,yh)
-    # [min(cos_l, cos_h), 1]
-    case3a = contain(domain2,yl) & contain(domain1,yh)
-    # [-1, max(cos_l, cos_h)] 
-    case4a = contain(domain1,yl) & contain(domain2,yh)
-    # [cos_h, cos_l]
-    case5a = (yl<=yh) & contain(domain1,yl) & contain(domain1,yh)
-
-    if case1a | case1b: return Interval(-1,1)
-    if case2a: return Interval(cos_l, cos_h)
-    if case3a: return Interval(min(cos_l,cos_h), 1)
-    if case4a: return Interval(-1, max(cos_l,cos_h))
-    if case5a: return Interval(cos_h, cos_l)
-
-
-def cos_vector(x:Interval): # vectorised version of cos()
-    if x.unsized: return sin(x)
-
-    twopi = 2*numpy_pi
-
-    case0 = width(x)>=twopi
-
-    domain1 = Interval(0, numpy_pi)
-    domain2 = Interval(numpy_pi, 2*numpy_pi)
-
-    yl = x.lo%twopi
-    yh = x.hi%twopi
-
-    cos_l = numpy_cos(yl)
-    cos_h = numpy_cos(yh)
-
-    a = cos_l.copy()
-    b = cos_h.copy()
-
-    # [-1,1]
-    case1a = (yh<yl) & contain(domain1,yl) & contain(domain1,yh)
-    case1b = (yh<yl) & contain(domain2,yl) & contain(domain2,yh)
-    case1 = case0 | case1a | case1b 
-    a[case1] = -1
-    b[case1] =  1
-    # [cos_l, cos_h]
-    # case2 = (yl<=yh) & contain(domain2,yl) & contain(domain2,yh)
-    # a[case2] = cos_l[case2]
-    # b[case2] = cos_h[case2]
-    # [min(cos_l, cos_h), 1]
-    case3 = contain(domain2,yl) & contain(domain1,yh)
-    a[case3] = min(cos_l[case3],cos_h[case3])
-    b[case3] = 1
-    # [-1, max(cos_l, cos_h)] 
-    case4 = contain(domain1,yl) & contain(domain2,yh)
-    a[case4] = -1
-    b[case4] = max(cos_l[case4], cos_h[case4])
-    # [cos_h, cos_l]
-    case5 = (yl<=yh) & contain(domain1,yl) & contain(domain1,yh)
-    a[case5] = cos_h[case5]
-    b[case5] = cos_l[case5]
-    return Interval(lo=a, hi=b)
-
-def tan(x:Interval):
-    '''
-    Implementation of Interval Arithmetic in CORA 2016
-
-    Matthias Althoff and Dmitry Grebenyuk
-    
-    EPiC Series in Computing Volume 43, 2017, Pages 91-105
-
-    ARCH16. 3rd International Workshop on Applied Verification for Continuous and Hybrid Systems
-    '''
-
-    if not(is_Interval(x)): return numpy_tan(x) # int, float, ndarray
-
-    if not(x.scalar): return tan_vector(x) 
-
-    pihalf = numpy_pi/2
-
-    domain1 = Interval(0, pihalf)
-    domain2 = Interval(pihalf, numpy_pi)
-
-    zl = x.lo%numpy_pi
-    zh = x.hi%numpy_pi
-
-    #[-∞, ∞] 
-    case1a = width(x)>numpy_pi
-    case1b = (zh<zl) & contain(domain1,zl) & contain(domain1,zh)
-    case1c = (zh<zl) & contain(domain2,zl) & contain(domain2,zh)
-    case1d = contain(domain1,zl) & contain(domain2,zh)
-
-    #[tan_l, tan_h]
-    case2a = (zl<=zh) & contain(domain1,zl) & contain(domain1,zh)
-    case2b = (zl<=zh) & contain(domain2,zl) & contain(domain2,zh)
-    
-    if case1a | case1b | case1c | case1d: return Interval(-numpy_inf, numpy_inf)
-    if case2a | case2b: return Interval(tan(zl), tan(zh))
-    else: return Interval(tan(zl), tan(zh))
-
-def tan_vector(x:Interval): # Vectorised version of tan().
-    if x.unsized: return tan(x)
-
-    pihalf = numpy_pi/2
-
-    domain1 = Interval(0, pihalf)
-    domain2 = Interval(pihalf, numpy_pi)
+@implements(numpy.sin)
+@verified(lower=-1,upper=1)
+def sin(x:Interval, chunk:int=None) -> Interval: 
+    """
+    Return the sine of an Interval. 
 
-    zl = x.lo%numpy_pi
-    zh = x.hi%numpy_pi
+    Each element is classified once by the quadrant indices of its endpoints, see `quadrant_extrema`.
+    The sine attains its maximum at the quadrants 1 mod 4 and its minimum at the quadrants 3 mod 4.
 
-    tan_l = tan(zl)
-    tan_h = tan(zh)
+    :chunk: number of elements processed at once, default is `TRIG_CHUNK_SIZE`.
+    """
+    if is_not_Interval(x): return numpy_sin(x) # int, float, ndarray
+    if type(x) is ScalarInterval: return Interval(*quadrant_extrema_scalar(math.sin,x.lo,x.hi,1,3))
+    return Interval(*chunked(lambda l,h,out: quadrant_extrema(numpy_sin,l,h,1,3,out),x,chunk))
 
-    a = tan_l.copy()
-    b = tan_h.copy()
+@implements(numpy.cos)
+@verified(lower=-1,upper=1)
+def cos(x:Interval, chunk:int=None) -> Interval: 
+    """
+    Return the cosine of an Interval. The cosine attains its maximum at the quadrants 0 mod 4 and its minimum at the quadrants 2 mod 4.
+    """
+    if is_not_Interval(x): return numpy_cos(x) # int, float, ndarray
+    if type(x) is ScalarInterval: return Interval(*quadrant_extrema_scalar(math.cos,x.lo,x.hi,0,2))
+    return Interval(*chunked(lambda l,h,out: quadrant_extrema(numpy_cos,l,h,0,2,out),x,chunk))
 
-     #[-∞, ∞] 
-    case1a = width(x)>numpy_pi
-    case1b = (zh<zl) & contain(domain1,zl) & contain(domain1,zh)
-    case1c = (zh<zl) & contain(domain2,zl) & contain(domain2,zh)
-    case1d = contain(domain1,zl) & contain(domain2,zh)
-    case1 = case1a | case1b | case1c | case1d
-    a[case1] = -numpy_inf
-    b[case1] = numpy_inf
+@implements(numpy.tan)
+@verified()
+def tan(x:Interval, chunk:int=None) -> Interval:
+    """
+    Return the tangent of an Interval, which is [-inf,inf] if the interval contains a pole, i.e. an odd multiple of pi/2.
+    """
+    if is_not_Interval(x): return numpy_tan(x) # int, float, ndarray
+    if type(x) is ScalarInterval: 
+        l,h = x.lo,x.hi
+        if h-l >= numpy_pi: return Interval(-numpy_inf,numpy_inf) # also an infinite endpoint
+        if not (math.isfinite(l) and math.isfinite(h)): return Interval(numpy.nan,numpy.nan) # empty, as the array kernel
+        q_lo, q_hi = math.ceil(l/numpy_pihalf), math.floor(h/numpy_pihalf)
+        if q_hi - (q_hi-1)%2 >= q_lo: return Interval(-numpy_inf,numpy_inf)
+        return Interval(math.tan(l),math.tan(h))
+    return Interval(*chunked(tan_kernel,x,chunk))
+
+def quadrant_extrema(f, lo:ndarray, hi:ndarray, r_max:int, r_min:int, out:tuple) -> tuple:
+    """
+    Write into `out` the range of the 2pi-periodic function f over [lo,hi], where f is sin or cos.
 
-    # #[tan_l, tan_h]
-    # case2a = (zl<=zh) & contain(domain1,zl) & contain(domain1,zh)
-    # case2b = (zl<=zh) & contain(domain2,zl) & contain(domain2,zh)
-    return Interval(lo=a, hi=b)
+    The interval [lo,hi] contains a maximum of f iff it contains a point q*pi/2, with q an integer equal to r_max mod 4.
+    The largest such q not above hi is q_hi - mod(q_hi-r_max,4), with q_hi = floor(hi/(pi/2)), and it is contained iff 
+    it is not below q_lo = ceil(lo/(pi/2)). Likewise for the minimum. Otherwise f is monotonic on [lo,hi].
+    """
+    out_lo, out_hi = out
+    with numpy.errstate(invalid='ignore'): # infinite endpoints
+        q_lo, q_hi = numpy.ceil(lo/numpy_pihalf), numpy.floor(hi/numpy_pihalf)
+        wide = (hi-lo) >= 2*numpy_pi
+        has_max = wide | (q_hi - numpy.mod(q_hi-r_max,4) >= q_lo)
+        has_min = wide | (q_hi - numpy.mod(q_hi-r_min,4) >= q_lo)
+        f_lo, f_hi = f(lo), f(hi)
+    numpy.fmin(f_lo,f_hi,out=out_lo)
+    numpy.fmax(f_lo,f_hi,out=out_hi)
+    numpy.copyto(out_lo,-1,where=has_min)
+    numpy.copyto(out_hi,1,where=has_max)
+    return out
+
+def quadrant_extrema_scalar(f, l:float, h:float, r_max:int, r_min:int) -> tuple:
+    """
+    Same as `quadrant_extrema` for float endpoints, with the functions of the math module.
+    """
+    if h-l >= 2*numpy_pi: return -1.,1. # also an infinite endpoint
+    if not (math.isfinite(l) and math.isfinite(h)): return numpy.nan,numpy.nan # empty (NaN), or [inf,inf], as the array kernel
+    q_lo, q_hi = math.ceil(l/numpy_pihalf), math.floor(h/numpy_pihalf)
+    f_l, f_h = f(l), f(h)
+    a = -1. if q_hi - (q_hi-r_min)%4 >= q_lo else (f_l if f_l<f_h else f_h)
+    b = 1. if q_hi - (q_hi-r_max)%4 >= q_lo else (f_h if f_l<f_h else f_l)
+    return a,b
+
+def tan_kernel(lo:ndarray, hi:ndarray, out:tuple) -> tuple:
+    out_lo, out_hi = out
+    with numpy.errstate(invalid='ignore'):
+        q_lo, q_hi = numpy.ceil(lo/numpy_pihalf), numpy.floor(hi/numpy_pihalf)
+        pole = ((hi-lo) >= numpy_pi) | (q_hi - numpy.mod(q_hi-1,2) >= q_lo)
+        numpy_tan(lo,out=out_lo)
+        numpy_tan(hi,out=out_hi)
+    numpy.copyto(out_lo,-numpy_inf,where=pole)
+    numpy.copyto(out_hi,numpy_inf,where=pole)
+    return out
+
+def chunked(kernel, x:Interval, chunk:int=None) -> tuple:
+    """
+    Apply `kernel(lo,hi,out)` to the endpoints of x, in chunks of `chunk` elements. Returns the endpoints of the result.
+    """
+    if chunk is None: chunk = TRIG_CHUNK_SIZE
+    lo, hi = numpy.broadcast_arrays(asarray(x.lo),asarray(x.hi))
+    out_lo, out_hi = numpy.empty(lo.shape,dtype=x.dtype), numpy.empty(lo.shape,dtype=x.dtype)
+    if lo.size <= chunk: return kernel(lo,hi,(out_lo,out_hi))
+    lo, hi = lo.reshape(-1), hi.reshape(-1) # a copy only if the endpoints are not contiguous
+    flat_lo, flat_hi = out_lo.reshape(-1), out_hi.reshape(-1) # views
+    for i in range(0,lo.size,chunk): kernel(lo[i:i+chunk],hi[i:i+chunk],(flat_lo[i:i+chunk],flat_hi[i:i+chunk]))
+    return out_lo, out_hi
 
 
 # Interval to ndarray[float]
 # def linspace(): 
 
 
-# def union(): pass # spell the difference between union and subpaving.
-# def intersection():  
-# def difference():  
-# def set_difference(x:Interval,y:Interval):  
-
 #####################################################################################
 # set.py
 #####################################################################################
@@ -462,25 +455,184 @@ def straddle_zero(x: Interval) -> bool:
 def intersect(x:Interval, y:Interval): return ~((x<y) | (y<x)) # commutative 
 def contain(x:Interval, y:Interval):  return (lo(x)<=lo(y)) & (hi(x)>=hi(y)) # x contain y
 def almost_contain(x:Interval, y:Interval, tol=1e-9):  return (lo(y)-lo(x)>-tol) & (hi(x)-hi(y)>-tol) # x contain y
-def intersect_vector(x_:Interval,y_:Interval):
+
+# Set operations, element-wise over arrays of intervals. An empty interval is represented by NaN endpoints, 
+# which is also what the unary functions return outside their domain. 
+def is_empty(x:Interval) -> Union[bool,ndarray]: return numpy.isnan(lo(x)) | numpy.isnan(hi(x))
+def hull(x:Interval, y:Interval) -> Interval: 
+    """
+    Return the smallest interval enclosing x and y, i.e. the hull of their union. The hull of x and an empty interval is x.
+    """
+    return endpoints_like(x,numpy.fmin(lo(x),lo(y)),numpy.fmax(hi(x),hi(y)))
+def intersection(x:Interval, y:Interval) -> Interval:
+    """
+    Return the intersection of x and y, which is empty, i.e. [nan,nan], where x and y do not intersect.
+    """
+    l,h = numpy.maximum(lo(x),lo(y)), numpy.minimum(hi(x),hi(y)) # maximum and minimum propagate nan
+    empty = l > h
+    if numpy.any(empty): l,h = numpy.where(empty,numpy.nan,l), numpy.where(empty,numpy.nan,h)
+    return endpoints_like(x,l,h)
+def set_difference(x:Interval, y:Interval) -> Interval:
+    """
+    Return the closure of x minus y as two pieces, stacked along a new first axis: 
+    the part of x left of y, and the part of x right of y. Pieces that do not exist are empty.
+
+    E.g. set_difference([0,3],[1,2]) = [[0,1],[2,3]], and set_difference([0,3],[1,4]) = [[0,1],[nan,nan]].
+    """
+    x_lo,x_hi,y_lo,y_hi = lo(x),hi(x),lo(y),hi(y)
+    y_empty = is_empty(y)
+    y_lo,y_hi = numpy.where(y_empty,numpy_inf,y_lo), numpy.where(y_empty,numpy_inf,y_hi) # x minus the empty set is x, all on the left
+    has_left, has_right = x_lo < y_lo, y_hi < x_hi
+    left = numpy.where(has_left,x_lo,numpy.nan), numpy.where(has_left,numpy.minimum(x_hi,y_lo),numpy.nan)
+    right = numpy.where(has_right,numpy.maximum(x_lo,y_hi),numpy.nan), numpy.where(has_right,x_hi,numpy.nan)
+    return Interval(numpy.stack((left[0],right[0])),numpy.stack((left[1],right[1])))
+def drop_empty(x:Interval) -> Interval: 
+    """
+    Return the non-empty elements of x as a 1-d Interval, e.g. the pieces of a set difference.
+    """
+    keep = ~is_empty(x)
+    return Interval(numpy.broadcast_to(lo(x),keep.shape)[keep],numpy.broadcast_to(hi(x),keep.shape)[keep])
+SWEEP_BLOCK_SIZE = 2**22 # largest number of candidate pairs checked at once by `intersect_vector`
+
+def intersect_vector(x_:Interval, y_:Interval, pairs:bool=False):
     '''
-    This function checks if the focal elements x, intersect the subpaving y.
+    This function checks which boxes of y intersect the subpaving x.
+
+    x: A n-list of d-boxes or d-intervals, e.g. a subpaving. x.shape=(n,d)
+    y: A m-list of d-boxes or d-intervals, e.g. focal elements. y.shape=(m,d)
 
-    x: A n-list of d-boxes or d-intervals, e.g. a subpaving. x.shape=(r,d)
-    y: A m-list of d-boxes or d-intervals, e.g. a focal element. y.shape=(p,d)
+    out: A m-array of booleans, True where the box of y intersects at least one box of x.
+    If `pairs` is True, the indices (j,i) of all pairs of intersecting boxes y[j] and x[i] instead, sorted by j then i.
 
-    out: A (rp)-list of d-arrays of booleans
+    The candidate pairs are found by sweep and prune on one axis: with the boxes sorted by their left endpoint on that axis,
+    the boxes of x that start within a box of y, and the boxes of y that start within a box of x, are contiguous 
+    ranges found by binary search, see `sweep_ranges`. The axis with the fewest candidates is chosen. 
+    In two or more dimensions the other axes are cut into a grid of cells and the sweep runs separately in each cell, see `grid_cells`.
+    The candidates are then checked on the other axes, `SWEEP_BLOCK_SIZE` at a time. Boxes with empty (NaN) endpoints intersect nothing.
     '''
     x = intervalise(x_)
     y = intervalise(y_)
-    # n,d = x.shape
-    m,d = y.shape
-    x_lo = lo(x)# x_lo = numpy.array([xi.lo for xi in x])
-    x_hi = hi(x)# x_hi = numpy.array([xi.hi for xi in x])
-    where_intersect = numpy.zeros((m,),dtype=bool)# inter = []
-    for i, yi in enumerate(tolist(y)): # a focal elem
-        where_intersect[i] = any(numpy.all(~((x_hi < lo(yi)) | (hi(yi) < x_lo)), axis=1))
-    return where_intersect
+    x_lo, x_hi, y_lo, y_hi = [numpy.asarray(e) if numpy.ndim(e)==2 else numpy.asarray(e)[:,None] for e in (lo(x),hi(x),lo(y),hi(y))] # 1-d inputs are boxes of dimension 1
+    m, d = len(y_lo), x_lo.shape[1]
+    x_keep = ~numpy.any(numpy.isnan(x_lo) | numpy.isnan(x_hi),axis=1)
+    y_keep = ~numpy.any(numpy.isnan(y_lo) | numpy.isnan(y_hi),axis=1)
+    x_index, y_index = numpy.flatnonzero(x_keep), numpy.flatnonzero(y_keep)
+    x_lo, x_hi, y_lo, y_hi = x_lo[x_keep], x_hi[x_keep], y_lo[y_keep], y_hi[y_keep]
+    sweeps = [sweep_ranges(x_lo[:,a],x_hi[:,a],y_lo[:,a],y_hi[:,a]) for a in range(d)]
+    axes = numpy.argsort([numpy.sum(a1-a0)+numpy.sum(b1-b0) for (a0,a1,b0,b1,_,_) in sweeps],kind='stable') # by number of candidates
+    axis = axes[0]
+    x_entry, y_entry = numpy.arange(len(x_lo)), numpy.arange(len(y_lo)) # the box of each entry of the sweep
+    cells = grid_cells(x_lo,x_hi,y_lo,y_hi,axes[1:])
+    if cells is None: a0,a1,b0,b1,x_order,y_order = sweeps[axis]
+    else: 
+        x_entry, x_cell, y_entry, y_cell = cells
+        values = numpy.concatenate((x_lo[:,axis],x_hi[:,axis],y_lo[:,axis],y_hi[:,axis]))
+        _, rank = numpy.unique(values,return_inverse=True) # exact and integer, so the cell can be added to it
+        x_rank_lo, x_rank_hi, y_rank_lo, y_rank_hi = numpy.split(rank,numpy.cumsum([len(x_lo),len(x_lo),len(y_lo)]))
+        n = len(values)
+        a0,a1,b0,b1,x_order,y_order = sweep_ranges(x_cell*n + x_rank_lo[x_entry], x_cell*n + x_rank_hi[x_entry], 
+                                                   y_cell*n + y_rank_lo[y_entry], y_cell*n + y_rank_hi[y_entry])
+    hits = numpy.zeros((m,),dtype=bool)
+    found = []
+    for rows,start,stop,order,y_rows in [(numpy.arange(len(y_entry)),a0,a1,x_order,True),(numpy.arange(len(x_entry)),b0,b1,y_order,False)]: 
+        for r,c in expand_ranges(rows,start,stop,SWEEP_BLOCK_SIZE): 
+            i, j = (x_entry[order[c]],y_entry[r]) if y_rows else (x_entry[r],y_entry[order[c]]) # candidates x[i], y[j]
+            ok = numpy.ones(len(i),dtype=bool)
+            for a in range(d):
+                if a != axis: ok &= (x_lo[i,a] <= y_hi[j,a]) & (y_lo[j,a] <= x_hi[i,a])
+            if pairs: found.append((y_index[j[ok]],x_index[i[ok]]))
+            else: hits[y_index[j[ok]]] = True
+    if not pairs: return hits
+    j,i = (numpy.concatenate(e) for e in zip(*found)) if found else (numpy.zeros(0,dtype=int),numpy.zeros(0,dtype=int))
+    order = numpy.lexsort((i,j))
+    j, i = j[order], i[order]
+    first = numpy.ones(len(j),dtype=bool)
+    first[1:] = (j[1:]!=j[:-1]) | (i[1:]!=i[:-1]) # a pair spanning several cells is found in each of them
+    return j[first], i[first]
+
+def grid_cells(x_lo:ndarray, x_hi:ndarray, y_lo:ndarray, y_hi:ndarray, axes:Sequence[int]):
+    """
+    Cut the given axes into strips about as wide as the median box, so the space is divided into a grid of cells, and 
+    replicate each box into the cells it overlaps. The strips are widened where needed so there are at most 
+    eight entries per box on average.
+
+    Returns the box and the cell of each entry of x and y, with the cells numbered from 0. 
+    Returns None if no axis has finite endpoints and more than one strip.
+    """
+    limit = 8*(len(x_lo) + len(y_lo))
+    x_entry, y_entry = numpy.arange(len(x_lo)), numpy.arange(len(y_lo))
+    x_cell, y_cell = numpy.zeros(len(x_lo),dtype=numpy.int64), numpy.zeros(len(y_lo),dtype=numpy.int64)
+    partitioned = False
+    for a in axes:
+        strip = strips(numpy.concatenate((x_lo[x_entry,a],y_lo[y_entry,a])),numpy.concatenate((x_hi[x_entry,a],y_hi[y_entry,a])),limit)
+        if strip is None: continue
+        x_r, x_k = next(expand_ranges(numpy.arange(len(x_entry)),strip(x_lo[x_entry,a]),strip(x_hi[x_entry,a])+1,numpy.inf)) if len(x_entry) > 0 else (x_entry,)*2
+        y_r, y_k = next(expand_ranges(numpy.arange(len(y_entry)),strip(y_lo[y_entry,a]),strip(y_hi[y_entry,a])+1,numpy.inf)) if len(y_entry) > 0 else (y_entry,)*2
+        k_max = int(numpy.max(numpy.concatenate((x_k,y_k)))) + 1
+        _, cell = numpy.unique(numpy.concatenate((x_cell[x_r]*k_max + x_k, y_cell[y_r]*k_max + y_k)),return_inverse=True)
+        x_entry, y_entry = x_entry[x_r], y_entry[y_r]
+        x_cell, y_cell = cell[:len(x_r)], cell[len(x_r):]
+        partitioned = True
+    if not partitioned: return None
+    return x_entry, x_cell, y_entry, y_cell
+
+def strips(lo_:ndarray, hi_:ndarray, limit:int):
+    """
+    Return the function giving the strip of a coordinate, for strips about as wide as the median interval [lo_,hi_], 
+    widened until the intervals overlap at most `limit` strips in total. 
+    Returns None if the endpoints are not finite or the intervals would all fit in one strip.
+    """
+    n = len(lo_)
+    if (n == 0) or not numpy.all(numpy.isfinite(lo_) & numpy.isfinite(hi_)): return None
+    origin, span = numpy.min(lo_), numpy.max(hi_)-numpy.min(lo_)
+    if not (span > 0): return None
+    width = numpy.fmax(numpy.median(hi_-lo_), span/n) # at most n strips
+    strip = lambda v: numpy.floor((v-origin)/width).astype(numpy.int64)
+    while (width < span) and (numpy.sum(strip(hi_)-strip(lo_)+1) > limit): width = 2*width
+    if not (width < span): return None
+    return strip
+
+def sweep_ranges(x_lo:ndarray, x_hi:ndarray, y_lo:ndarray, y_hi:ndarray) -> tuple:
+    """
+    Sweep and prune of two sets of intervals [x_lo,x_hi] and [y_lo,y_hi]. Two intervals intersect iff exactly one of the following holds:
+
+    A: x starts within y, y_lo <= x_lo <= y_hi, i.e. x is in positions a0[j]:a1[j] of x sorted by x_lo;
+    B: y starts within x after x, x_lo < y_lo <= x_hi, i.e. y is in positions b0[i]:b1[i] of y sorted by y_lo.
+
+    Returns a0, a1, b0, b1 and the sorting orders of x and y. 
+    The binary searches run on the sorted endpoints, whose accesses to memory are then nearly sequential.
+    """
+    x_order, y_order = numpy.argsort(x_lo), numpy.argsort(y_lo)
+    x_sorted, y_sorted = x_lo[x_order], y_lo[y_order]
+    a0, a1, b0, b1 = (numpy.empty(len(y_lo),dtype=numpy.intp), numpy.empty(len(y_lo),dtype=numpy.intp), 
+                      numpy.empty(len(x_lo),dtype=numpy.intp), numpy.empty(len(x_lo),dtype=numpy.intp))
+    a0[y_order], a1[y_order] = numpy.searchsorted(x_sorted,y_sorted,side='left'), numpy.searchsorted(x_sorted,y_hi[y_order],side='right')
+    b0[x_order], b1[x_order] = numpy.searchsorted(y_sorted,x_sorted,side='right'), numpy.searchsorted(y_sorted,x_hi[x_order],side='right')
+    return a0, numpy.maximum(a0,a1), b0, numpy.maximum(b0,b1), x_order, y_order
+
+def expand_ranges(rows:ndarray, start:ndarray, stop:ndarray, block:int):
+    """
+    Yield the pairs (row, k) for k in range(start[row],stop[row]), as two index arrays of at most about `block` pairs.
+    """
+    counts = stop - start
+    ends = numpy.cumsum(counts)
+    first = 0
+    while first < len(rows):
+        last = int(numpy.searchsorted(ends, ends[first]-counts[first]+block, side='right'))
+        last = last if last > first else first+1 # a single row can exceed the block
+        r, k = ranges(start[first:last], stop[first:last])
+        if len(r) > 0: yield rows[first:last][r], k
+        first = last
+
+def ranges(start:ndarray, stop:ndarray):
+    """
+    Return the pairs (row, k) for k in range(start[row],stop[row]) as two index arrays, row being the position in start.
+    """
+    n = stop - start
+    r = numpy.repeat(numpy.arange(len(n)),n)
+    k = numpy.arange(len(r)) - numpy.repeat(numpy.cumsum(n)-n,n) + numpy.repeat(start,n)
+    return r, k
+
 #####################################################################################
 # parser.py
 #####################################################################################
@@ -517,7 +669,7 @@ def intervalise(x_: Any, index = -1) -> Union[Interval,Any]:
     def treat_list(xx): 
         xi_lo,xi_hi = [],[]
         for xi in xx: # if each element in the list is an interval of homogeneus shape
-            if xi.__class__.__name__=='Interval':
+            if is_Interval(xi):
                 xi_lo.append(xi.lo)
                 xi_hi.append(xi.hi)
             else: 
@@ -528,19 +680,20 @@ def intervalise(x_: Any, index = -1) -> Union[Interval,Any]:
         except:
             print('!! Parsing an interval from list failed.') 
             return x_
-    if x_.__class__.__name__=='Interval': return x_
-    try: x = asarray(x_, dtype=float)
+    if is_Interval(x_): return x_
+    try: x = x_ if isinstance(x_,ndarray) and (x_.dtype.kind == 'f') else asarray(x_, dtype=float) # floating arrays keep their dtype, e.g. float32
     except ValueError: # ValueError: setting an array element with a sequence. The requested array has an inhomogeneous shape after 1 dimensions. The detected shape was (...) + inhomogeneous part.
-        if x_.__class__.__name__=='list': return treat_list(x_) # attempt to turn a n-list of intervals into a (n,...)-interval 
+        if isinstance(x_,list): return treat_list(x_) # attempt to turn a n-list of intervals into a (n,...)-interval 
     s = x.shape
     two=[si==2 for si in s]
-    if all(two): return Interval(lo=transpose(x)[0],hi=transpose(x)[1])
+    # the endpoints are views of x, which is not copied if it is already an ndarray of floats
+    if all(two): return Interval.frombuffer(x,layout='last')
     elif any(two):
-        if two[-1]: return Interval(lo=transpose(x)[0],hi=transpose(x)[1]) # the last dimension has size 2
-        elif two[0]: return Interval(lo=x[0],hi=x[1])
+        if two[-1]: return Interval.frombuffer(x,layout='last') # the last dimension has size 2
+        elif two[0]: return Interval.frombuffer(x,layout='first')
         elif (two[-1]) & (two[0]): # this is the ambiguous case (2,3,5,2)
-            if index == 0: return Interval(lo=x[0],hi=x[1]) # first dimension gets intervalised
-            elif index == -1: return Interval(lo=transpose(x)[0],hi=transpose(x)[1])
+            if index == 0: return Interval.frombuffer(x,layout='first') # first dimension gets intervalised
+            elif index == -1: return Interval.frombuffer(x,layout='last')
             # if (sum(two)==1) & (two[0]): return Interval(lo=x[0],hi=x[1])# there is only one dimension of size 2 and is the first one
         print('Array-like structure must have last dimension (or first) of size 2, for it to be coerced to Interval.')
         return Interval(lo=x) 
@@ -576,25 +729,203 @@ def tolist(x:Interval):
 #####################################################################################
 # subint.py
 #####################################################################################
-def subintervalise(x_:Interval, n:Union[int,tuple]=0):
+def subintervalise(x_:Interval, n:Union[int,tuple]=0, chunk:int=None):
+    """
+    Split a box into the regular grid of its subboxes, i.e. the cartesian product of the splits of each dimension.
+
+    x: An unsized interval, a d-box of shape (d,), or a batch of m d-boxes of shape (m,d).
+    n: The number of splits of each dimension, an int or a d-tuple. A dimension split 0 or 1 times is kept whole.
+
+    out: An Interval of shape (n,) for an unsized interval, (prod(n),d) for a d-box, (m,prod(n),d) for a batch.
+    The subboxes are in the order of `itertools.product`, i.e. the last dimension varies fastest.
+
+    The endpoints are written by broadcasting into preallocated arrays. With `chunk` a generator is returned instead,
+    which yields the subboxes `chunk` at a time as Intervals of shape (<=chunk,d), the boxes of a batch one after the other,
+    or (<=chunk,) for an unsized interval. A box split at most once is then yielded whole, as a chunk of one subbox.
+    """
     x = intervalise(x_)
-    d = len(x.shape) # dimension of the array
-    if n==0: return x
-    elif n==1: return x # should return a subtiling (sized interval)
-    if x.scalar:  # or x.scalar == True
-        xx = linspace(x.lo,x.hi,num=n+1)
-        return intervalise(vstack([xx[:-1], xx[1:]]))
-    elif d==1: ## x.shape = (m,)
-        m = x.shape[0] # size of 1d array
-        if type(n)==int: n=m*[n] # differential split number 
-        X_sub = []
-        for i,xi in enumerate(x):
-            xxi = subintervalise(xi,n=n[i]) # recursion
-            X_sub.append(sizeit(xxi).val)
-        return intervalise(asarray(list(product(*X_sub)),dtype=float))
-#     elif len(x.shape)>1: pass # TODO: implement space-product subintervalization with arrays of dimension greater than 2.
-    else: print('!! Subtiling not yet supported for interval arrays of dimension 2 or larger. Input will be returned.')
-    return x
+    x_lo, x_hi = numpy.asarray(lo(x)), numpy.asarray(hi(x))
+    if chunk is not None: chunk = int(chunk)
+    elif isinstance(n,int) and (n<=1): return x
+    if x_lo.ndim == 0:
+        xx = linspace(x_lo,x_hi,num=max(int(n),1)+1)
+        if chunk is None: return Interval(lo=xx[:-1],hi=xx[1:])
+        return (Interval(lo=xx[:-1][i:i+chunk],hi=xx[1:][i:i+chunk]) for i in range(0,len(xx)-1,chunk))
+    if x_lo.ndim > 2: raise ValueError(f'subintervalise takes a box of shape (d,) or a batch of boxes of shape (m,d), got {x_lo.shape}.')
+    batch = x_lo.ndim == 2
+    x_lo, x_hi = numpy.atleast_2d(x_lo), numpy.atleast_2d(x_hi)
+    m, d = x_lo.shape
+    edges, n = grid_edges(x_lo,x_hi,n)
+    if chunk is not None: return subintervalise_chunks(edges,n,chunk)
+    N = int(numpy.prod(n))
+    sub_lo, sub_hi = numpy.empty((m,)+n+(d,),dtype=x_lo.dtype), numpy.empty((m,)+n+(d,),dtype=x_lo.dtype)
+    for k,e in enumerate(edges):
+        shape = (m,)+(1,)*k+(n[k],)+(1,)*(d-k-1)
+        sub_lo[...,k], sub_hi[...,k] = e[:,:-1].reshape(shape), e[:,1:].reshape(shape)
+    sub_lo, sub_hi = sub_lo.reshape(m,N,d), sub_hi.reshape(m,N,d)
+    if batch: return Interval(lo=sub_lo,hi=sub_hi)
+    return Interval(lo=sub_lo[0],hi=sub_hi[0])
+
+def grid_edges(x_lo:ndarray, x_hi:ndarray, n:Union[int,tuple]):
+    """
+    The edges of the splits of each dimension of the boxes (x_lo,x_hi) of shape (m,d), a list of d arrays of shape (m,n[k]+1), 
+    and the numbers of splits as a d-tuple, see `subintervalise`.
+    """
+    d = x_lo.shape[1]
+    n = tuple(int(ni) if ni>1 else 1 for ni in (d*[n] if isinstance(n,int) else n)) # a dimension split 0 or 1 times is kept whole
+    if len(n) != d: raise ValueError(f'{len(n)} numbers of splits given for boxes of dimension {d}.')
+    return [linspace(x_lo[:,k],x_hi[:,k],num=nk+1,axis=1,dtype=x_lo.dtype) for k,nk in enumerate(n)], n
+
+def subintervalise_chunks(edges:list, n:tuple, chunk:int, first:int=0, last:int=None):
+    """
+    Yield the subboxes of the grids with the given edges, `chunk` at a time, see `subintervalise`.
+    Only the subboxes from `first` to `last` in the order of the product are yielded, e.g. a shard of a parallel evaluation.
+    """
+    m, d, N = len(edges[0]), len(n), int(numpy.prod(n))
+    if last is None: last = m*N
+    strides = [int(numpy.prod(n[k+1:])) for k in range(d)]
+    for start in range(first, last, chunk):
+        c = numpy.arange(start, min(start+chunk, last))
+        box, c = numpy.divmod(c, N)
+        sub_lo, sub_hi = numpy.empty((len(c),d),dtype=edges[0].dtype), numpy.empty((len(c),d),dtype=edges[0].dtype)
+        for k,e in enumerate(edges):
+            i = (c // strides[k]) % n[k]
+            sub_lo[:,k], sub_hi[:,k] = e[box,i], e[box,i+1]
+        yield Interval(lo=sub_lo,hi=sub_hi)
+
+EVALUATE_CHUNK_SIZE = 2**16 # number of subboxes evaluated at once by `evaluate_subpaving`
+EVALUATE_TEMPORARIES = 16 # endpoint arrays of shape (chunk,d) assumed alive at once when a chunk is sized from a memory budget
+
+def evaluate_subpaving(f, x_:Interval, n:Union[int,tuple], chunk:int=None, memory:int=None, report:bool=False):
+    """
+    Enclose the range of f over the box x with the hull of f on the subboxes of x, without holding the subpaving in memory.
+
+    f: A vectorised function taking an Interval of shape (k,d), k subboxes, and returning k enclosures, e.g. of shape (k,) or (k,p).
+    x: A d-box of shape (d,).
+    n: The number of splits of each dimension, as in `subintervalise`.
+    chunk: The number of subboxes evaluated at once, default is `EVALUATE_CHUNK_SIZE`.
+    memory: A budget in bytes for the evaluation of a chunk, which overrides `chunk`, 
+            assuming `EVALUATE_TEMPORARIES` endpoint arrays of the chunk are alive at once.
+
+    out: The hull of the enclosures, of the shape of f on one subbox. Empty (NaN) enclosures are skipped, as in `hull`.
+    If `report` is True, also a dict with the number of subboxes, the chunk size, the number of chunks, the time in seconds, 
+    and the peak resident set size of the process during the evaluation in bytes, None where the platform does not expose it.
+    """
+    x = intervalise(x_)
+    if numpy.ndim(lo(x)) != 1: raise ValueError(f'evaluate_subpaving takes a box of shape (d,), got {numpy.shape(lo(x))}.')
+    d, itemsize = len(lo(x)), numpy.asarray(lo(x)).dtype.itemsize
+    if memory is not None: chunk = memory // (EVALUATE_TEMPORARIES*d*itemsize)
+    elif chunk is None: chunk = EVALUATE_CHUNK_SIZE
+    chunk = int(chunk) if chunk >= 1 else 1
+    if report: reset_peak_rss() # the peak of the whole process, so only when it is reported
+    t0 = time.perf_counter()
+    y_lo, y_hi, chunks = None, None, 0
+    for sub in subintervalise(x,n,chunk=chunk):
+        y = f(sub)
+        c_lo, c_hi = numpy.fmin.reduce(lo(y),axis=0), numpy.fmax.reduce(hi(y),axis=0)
+        if y_lo is None: y_lo, y_hi = c_lo, c_hi
+        else: y_lo, y_hi = numpy.fmin(y_lo,c_lo), numpy.fmax(y_hi,c_hi)
+        chunks += 1
+        del sub, y # the next chunk is built without this one alive
+    out = Interval(lo=y_lo,hi=y_hi)
+    if not report: return out
+    boxes = int(numpy.prod([k if k>1 else 1 for k in (d*[n] if isinstance(n,int) else n)]))
+    return out, dict(boxes=boxes, chunk=chunk, chunks=chunks, seconds=time.perf_counter()-t0, peak_rss=peak_rss())
+
+def reset_peak_rss() -> None:
+    """
+    Reset the peak resident set size of the process, where the platform allows it (Linux).
+    """
+    try:
+        with open('/proc/self/clear_refs','w') as f: f.write('5')
+    except OSError: pass
+
+def peak_rss() -> Optional[int]:
+    """
+    The peak resident set size of the process in bytes, or None where the platform does not expose it.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'): return int(line.split()[1])*1024
+    except OSError: pass
+    try: import resource
+    except ImportError: return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss*1024 # kilobytes on Linux
+
+SUBINTERVALIZE_CACHE_BYTES = 2**26 # bytes of the grids of subboxes kept by `evaluate_subintervals`, the least recently used is dropped first
+GRID_CACHE = OrderedDict() # (lo bytes, hi bytes, dtype, n) -> read-only Interval of shape (N,d)
+
+def evaluate_subintervals(f, *args, n:Union[int,tuple]=20, chunk:int=None, cache:bool=True, **kwargs):
+    """
+    Enclose the range of f over its Interval arguments with the hull of f on the subboxes of their regular grid.
+
+    f: A vectorised function. Its Interval arguments, of shapes s1, s2, ..., are the d = size(s1)+size(s2)+... dimensions of a box,
+       split n times each as in `subintervalise`. Each is replaced by an Interval of shape (k,*s) of the k subboxes, 
+       the other arguments are passed as they are. f returns k enclosures of shape (k,*t), or a tuple of them.
+    chunk: The number of subboxes per evaluation of f. By default f is evaluated once on the whole grid.
+    cache: Keep the grids of the last boxes evaluated whole, read-only, up to `SUBINTERVALIZE_CACHE_BYTES` in all,
+           so that calls on the same box with the same n skip their generation. A larger grid is not kept.
+
+    out: The hull of the enclosures, an Interval of shape t, or a tuple of them. Empty (NaN) enclosures are skipped, as in `hull`.
+    """
+    intervals = [i for i,a in enumerate(args) if is_Interval(a)]
+    shapes = [numpy.shape(lo(args[i])) for i in intervals]
+    sizes = [int(numpy.prod(s)) for s in shapes]
+    if len(intervals) == 0: return f(*args, **kwargs)
+    dtype = numpy.result_type(*(args[i].dtype for i in intervals)) # e.g. float32 boxes give float32 subboxes
+    x_lo = numpy.concatenate([numpy.asarray(lo(args[i]),dtype=dtype).reshape(-1) for i in intervals])
+    x_hi = numpy.concatenate([numpy.asarray(hi(args[i]),dtype=dtype).reshape(-1) for i in intervals])
+    n = (n,)*len(x_lo) if isinstance(n,int) else tuple(n) # a tuple, so that a box split once is still a grid of shape (1,d)
+    if chunk is not None: grids = subintervalise(Interval(x_lo,x_hi), n, chunk=int(chunk))
+    else: grids = [subintervals_grid(x_lo, x_hi, n, cache)]
+    hull, single = None, True
+    for sub in grids:
+        argv, k, offset = list(args), len(sub.lo), 0
+        for i, shape, size in zip(intervals, shapes, sizes):
+            argv[i] = Interval(lo=sub.lo[:,offset:offset+size].reshape((k,)+shape), hi=sub.hi[:,offset:offset+size].reshape((k,)+shape))
+            offset += size
+        y = f(*argv, **kwargs)
+        single = not isinstance(y, tuple)
+        y = (y,) if single else y
+        part = [(numpy.fmin.reduce(numpy.asarray(lo(o)),axis=0), numpy.fmax.reduce(numpy.asarray(hi(o)),axis=0)) for o in y]
+        if hull is None: hull = part
+        else: hull = [(numpy.fmin(h_lo,p_lo), numpy.fmax(h_hi,p_hi)) for (h_lo,h_hi),(p_lo,p_hi) in zip(hull,part)]
+        del argv, sub, y # the next chunk is built without this one alive
+    out = tuple(Interval(lo=h_lo, hi=h_hi) for h_lo,h_hi in hull)
+    return out[0] if single else out
+
+def subintervals_grid(x_lo:ndarray, x_hi:ndarray, n:tuple, cache:bool=True) -> Interval:
+    """
+    The subboxes of the box (x_lo,x_hi) as an Interval of shape (N,d), from `GRID_CACHE` if there, see `evaluate_subintervals`.
+    """
+    key = (x_lo.tobytes(), x_hi.tobytes(), x_lo.dtype.str, n)
+    if cache and (key in GRID_CACHE):
+        GRID_CACHE.move_to_end(key)
+        return GRID_CACHE[key]
+    grid = subintervalise(Interval(x_lo,x_hi), n)
+    if (not cache) or (grid_bytes(grid) > SUBINTERVALIZE_CACHE_BYTES): return grid
+    grid.lo.setflags(write=False); grid.hi.setflags(write=False) # shared by the calls, so f must not update it in place
+    GRID_CACHE[key] = grid
+    total = numpy_sum([grid_bytes(g) for g in GRID_CACHE.values()])
+    while total > SUBINTERVALIZE_CACHE_BYTES: total -= grid_bytes(GRID_CACHE.popitem(last=False)[1])
+    return grid
+
+def grid_bytes(grid:Interval) -> int: return grid.lo.nbytes + grid.hi.nbytes
+
+def SUBINTERVALIZE(N:Union[int,tuple]=20, chunk:int=None, cache:bool=True): # DECORATOR for the subintervalisation of vectorised functions
+    """
+    Decorate a vectorised function so that called on Intervals it returns the hull of its values on their subboxes, see `evaluate_subintervals`.
+
+    @SUBINTERVALIZE(N=50)
+    def f(x, y): return x*y - x**2
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*argv, **kwargs): return evaluate_subintervals(fn, *argv, n=N, chunk=chunk, cache=cache, **kwargs)
+        return wrapper
+    return decorator
 
 def split_interval(x:Interval,y:float=None):
     if y is None: return Interval(lo(x),mid(x)), Interval(mid(x),hi(x))
@@ -610,38 +941,179 @@ def split_interval(x:Interval,y:float=None):
     return x1,x2
 
 def reconstitute(x_:Interval):
+    """
+    The box covering a subpaving, the inverse of `subintervalise`: (n,) -> (), (N,d) -> (d,), (m,N,d) -> (m,d).
+    """
     x = intervalise(x_)
-    d = len(x.shape) # dimension of the subtiling ==1 if scalar, ==2 if 1d array
+    d = len(x.shape) # dimension of the subtiling ==1 if scalar, ==2 if 1d array, ==3 if a batch
     if d==1: return Interval(lo=numpy.min(x.lo), hi=numpy.max(x.hi))
-    elif d==2: return Interval(lo=numpy.min(x.lo,axis=1), hi=numpy.max(x.hi,axis=1))
-    else: print('!! Subtiling not yet supported for interval arrays of dimension 2 or larger.')
+    elif d in (2,3): return Interval(lo=numpy.min(x.lo,axis=-2), hi=numpy.max(x.hi,axis=-2))
+    else: print('!! Subtiling not yet supported for interval arrays of dimension 4 or larger.')
     return x
 
 def space_product(x_:Union[ndarray,Interval],y_:Union[ndarray,Interval]): return asarray(tuple(product(x_,y_)))
 
-def bisect(x_:Interval,i:int=None):
+def bisect(x_:Interval,i:Union[int,ndarray]=None):
     """
-    :x_: Interval of shape (n,)
+    :x_: Interval of shape (d,), a d-box, or of shape (m,d), a batch of m d-boxes
 
-    Bisect the largest box if i is None.
+    Bisect each box along the dimension i, or along its widest dimension if i is None. 
+    Returns the two halves, of the shape of x, the lower halves first.
     """
     x = intervalise(x_)
     if x.scalar: 
         mid_x = mid(x)
         return Interval(lo(x),mid_x), Interval(mid_x,hi(x))
-    if i is not None: split_index = i
-    else: 
-        w = width(x)
-        split_index = argmax(w)
-    d=x.shape[0] 
-    n=[0]*d
-    n[split_index]=2 # ex: (0,0,2,0,0,0) if interval of dim 6 has third dimension bisected
-    x_bisect = subintervalise(x,n=tuple(n))
-    return x_bisect[0], x_bisect[1]
+    x_lo, x_hi = numpy.atleast_2d(lo(x)), numpy.atleast_2d(hi(x))
+    k = numpy.arange(x_lo.shape[0])
+    split_index = argmax(x_hi-x_lo,axis=1) if i is None else i # the halves of a batch are written without subintervalise
+    mid_x = (x_lo[k,split_index] + x_hi[k,split_index])/2
+    a_hi, b_lo = x_hi.copy(), x_lo.copy()
+    a_hi[k,split_index], b_lo[k,split_index] = mid_x, mid_x
+    shape = numpy.shape(lo(x))
+    return Interval(x_lo.reshape(shape).copy(),a_hi.reshape(shape)), Interval(b_lo.reshape(shape),x_hi.reshape(shape).copy())
+
+#####################################################################################
+# array.py
+#####################################################################################
+# Array manipulation and reductions, also reached through the numpy functions, e.g. numpy.concatenate([x,y]).
+@implements(numpy.concatenate)
+def concatenate(arrays:Sequence[Interval], axis:int=0) -> Interval:
+    if not(any([is_Interval(a) for a in arrays])): return numpy.concatenate(arrays,axis=axis)
+    return Interval(numpy.concatenate([lo(a) for a in arrays],axis=axis), numpy.concatenate([hi(a) for a in arrays],axis=axis))
+@implements(numpy.stack)
+def stack(arrays:Sequence[Interval], axis:int=0) -> Interval:
+    if not(any([is_Interval(a) for a in arrays])): return numpy.stack(arrays,axis=axis)
+    return Interval(numpy.stack([lo(a) for a in arrays],axis=axis), numpy.stack([hi(a) for a in arrays],axis=axis))
+@implements(numpy.reshape)
+def reshape(x:Interval, newshape:Union[int,tuple]) -> Interval:
+    if is_not_Interval(x): return numpy.reshape(x,newshape)
+    return Interval(numpy.reshape(lo(x),newshape), numpy.reshape(hi(x),newshape))
+@implements(numpy.transpose)
+def transpose(x:Interval, axes:tuple=None) -> Interval:
+    if is_not_Interval(x): return numpy.transpose(x,axes)
+    return Interval(numpy.transpose(lo(x),axes), numpy.transpose(hi(x),axes))
+@implements(numpy.where)
+def where(condition:ndarray, x:Interval, y:Interval) -> Interval:
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.where(condition,x,y)
+    return Interval(numpy.where(condition,lo(x),lo(y)), numpy.where(condition,hi(x),hi(y)))
+@implements(numpy.copy)
+def copy(x:Interval) -> Interval: 
+    if is_not_Interval(x): return numpy.copy(x)
+    return Interval(numpy.copy(lo(x)),numpy.copy(hi(x)))
+@implements(numpy.shape)
+def shape(x:Interval) -> tuple: return numpy.shape(lo(x))
+@implements(numpy.ndim)
+def ndim(x:Interval) -> int: return numpy.ndim(lo(x))
+# Reductions along an axis. If `chunk` is given the axis is reduced `chunk` slices at a time and the partial results 
+# are combined, so only one chunk of the input is in memory at once, e.g. when the endpoints are numpy.memmap arrays.
+# If `outward` is True, or None and `arithmetic.OUTWARD` is True, sums are widened by the bound of `arithmetic.verify_sum`.
+@implements(numpy.sum)
+def sum(x:Interval, axis:Union[int,tuple]=None, keepdims:bool=False, chunk:int=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x): return numpy.sum(x,axis=axis,keepdims=keepdims)
+    if chunk is not None: return reduce_chunked(functools.partial(sum,outward=outward),functools.partial(add,outward=outward),x,axis,keepdims,chunk)
+    l,h = numpy.sum(lo(x),axis=axis,keepdims=keepdims), numpy.sum(hi(x),axis=axis,keepdims=keepdims)
+    if outward is None: outward = arithmetic.OUTWARD
+    if outward: l,h = arithmetic.verify_sum(l,h,terms(x,axis),numpy.sum(magnitude(x),axis=axis,keepdims=keepdims),outward=True)
+    return Interval(l,h)
+@implements(numpy.mean)
+def mean(x:Interval, axis:Union[int,tuple]=None, keepdims:bool=False, chunk:int=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x): return numpy.mean(x,axis=axis,keepdims=keepdims)
+    if outward is None: outward = arithmetic.OUTWARD
+    if (chunk is None) & (not outward): return Interval(numpy.mean(lo(x),axis=axis,keepdims=keepdims), numpy.mean(hi(x),axis=axis,keepdims=keepdims))
+    return divide(sum(x,axis=axis,keepdims=keepdims,chunk=chunk,outward=outward),terms(x,axis),outward=outward)
+@implements(numpy.prod)
+def prod(x:Interval, axis:Union[int,tuple]=None, keepdims:bool=False, chunk:int=None) -> Interval:
+    """
+    Product along an axis, evaluated as a pairwise tree: each level multiplies the first half of the 
+    remaining factors by the second half in one vectorised step, so n factors take log2(n) steps.
+    """
+    if is_not_Interval(x): return numpy.prod(x,axis=axis,keepdims=keepdims)
+    if chunk is not None: return reduce_chunked(prod,multiply,x,axis,keepdims,chunk)
+    x_, axis_ = merge_axes(x,axis)
+    l,h = numpy.moveaxis(asarray(x_.lo),axis_,0), numpy.moveaxis(asarray(x_.hi),axis_,0)
+    if l.shape[0] == 0: l,h = numpy.ones((1,)+l.shape[1:],dtype=l.dtype), numpy.ones((1,)+h.shape[1:],dtype=h.dtype)
+    while l.shape[0] > 1:
+        n = l.shape[0]//2
+        a,b = arithmetic.verify(*arithmetic.multiply_endpoints(l[:n],h[:n],l[n:2*n],h[n:2*n]))
+        if l.shape[0]%2==1: a,b = numpy.concatenate((a,l[2*n:])), numpy.concatenate((b,h[2*n:])) # the odd factor goes to the next level
+        l,h = a,b
+    return reshape(Interval(numpy.moveaxis(l,0,axis_),numpy.moveaxis(h,0,axis_)),reduced_shape(numpy.shape(lo(x)),axis,keepdims))
+@implements(numpy.dot)
+def dot(x:Interval, y:Interval, chunk:int=None, outward:bool=None) -> Interval:
+    """
+    Dot product of vectors, or matrix product of 2-d arrays. The dot product of vectors is the sum of the element-wise products,
+    which are rounded outward, then summed with the error bound of `sum`, in the verified mode.
+    """
+    if is_not_Interval(x) & is_not_Interval(y): return numpy.dot(x,y)
+    if (numpy.ndim(lo(x))==0) | (numpy.ndim(lo(y))==0): return x*y
+    if (numpy.ndim(lo(x))==1) & (numpy.ndim(lo(y))==1): 
+        if chunk is None: return sum(multiply(x,y,outward=outward),outward=outward)
+        return functools.reduce(functools.partial(add,outward=outward),(sum(multiply(x[i:i+chunk],y[i:i+chunk],outward=outward),outward=outward) for i in range(0,numpy.size(lo(x)),chunk)))
+    return matmul(x,y,outward=outward)
+@implements(numpy.cumsum)
+def cumsum(x:Interval, axis:int=None, outward:bool=None) -> Interval:
+    if is_not_Interval(x): return numpy.cumsum(x,axis=axis)
+    l,h = numpy.cumsum(lo(x),axis=axis), numpy.cumsum(hi(x),axis=axis)
+    if outward is None: outward = arithmetic.OUTWARD
+    if outward: # the i-th partial sum has i+1 terms
+        axis_ = 0 if axis is None else axis % numpy.ndim(l)
+        k = numpy.arange(1,numpy.shape(l)[axis_]+1).reshape((-1,)+(1,)*(numpy.ndim(l)-1-axis_))
+        l,h = arithmetic.verify_sum(l,h,k,numpy.cumsum(magnitude(x),axis=axis),outward=True)
+    return Interval(l,h)
+@implements(numpy.min, numpy.amin)
+def amin(x:Interval, axis:Union[int,tuple]=None, keepdims:bool=False, chunk:int=None) -> Interval: # the binary minimum is `min`
+    if is_not_Interval(x): return numpy.min(x,axis=axis,keepdims=keepdims)
+    if chunk is not None: return reduce_chunked(amin,min,x,axis,keepdims,chunk)
+    return Interval(numpy.min(lo(x),axis=axis,keepdims=keepdims), numpy.min(hi(x),axis=axis,keepdims=keepdims))
+@implements(numpy.max, numpy.amax)
+def amax(x:Interval, axis:Union[int,tuple]=None, keepdims:bool=False, chunk:int=None) -> Interval: # the binary maximum is `max`
+    if is_not_Interval(x): return numpy.max(x,axis=axis,keepdims=keepdims)
+    if chunk is not None: return reduce_chunked(amax,max,x,axis,keepdims,chunk)
+    return Interval(numpy.max(lo(x),axis=axis,keepdims=keepdims), numpy.max(hi(x),axis=axis,keepdims=keepdims))
+
+def merge_axes(x:Interval, axis:Union[int,tuple]=None) -> Tuple[Interval,int]:
+    """
+    Return x with the axes to be reduced merged into one, and the position of this axis. 
+    
+    The merged axis is kept where the first of the axes was. With axis=None all axes are merged.
+    """
+    shape = numpy.shape(lo(x))
+    if axis is None: return reshape(x,(-1,)), 0
+    axes = sorted(a % len(shape) for a in numpy.atleast_1d(axis))
+    if len(axes) == 1: return x, axes[0]
+    others = [a for a in range(len(shape)) if a not in axes]
+    x = transpose(x,axes=others[:axes[0]]+axes+others[axes[0]:]) # others before the first axis, the axes, the remaining others
+    return reshape(x,tuple(shape[a] for a in others[:axes[0]])+(-1,)+tuple(shape[a] for a in others[axes[0]:])), axes[0]
+
+def reduce_chunked(reduction, combine, x:Interval, axis:Union[int,tuple], keepdims:bool, chunk:int) -> Interval:
+    """
+    Reduce x along `axis` with `reduction`, `chunk` slices at a time, and combine the partial results with `combine`.
+    """
+    x_, axis_ = merge_axes(x,axis)
+    n = numpy.shape(lo(x_))[axis_]
+    index = lambda i: (slice(None),)*axis_ + (slice(i,i+chunk),)
+    y = functools.reduce(combine,(reduction(x_[index(i)],axis=axis_,keepdims=True) for i in range(0,n if n>0 else 1,chunk)))
+    return reshape(y,reduced_shape(numpy.shape(lo(x)),axis,keepdims))
+
+def terms(x:Interval, axis:Union[int,tuple]=None) -> int:
+    """
+    The number of terms reduced along `axis`.
+    """
+    shape = numpy.shape(lo(x))
+    if axis is None: return int(numpy.prod(shape))
+    return int(numpy.prod([shape[a] for a in numpy.atleast_1d(axis)]))
+
+def magnitude(x:Interval) -> ndarray: return numpy.maximum(numpy.abs(lo(x)),numpy.abs(hi(x)))
+
+def reduced_shape(shape:tuple, axis:Union[int,tuple], keepdims:bool) -> tuple:
+    axes = range(len(shape)) if axis is None else [a % len(shape) for a in numpy.atleast_1d(axis)]
+    if keepdims: return tuple(1 if a in axes else k for a,k in enumerate(shape))
+    return tuple(k for a,k in enumerate(shape) if a not in axes)
 
 #####################################################################################
 # types.py
 #####################################################################################
 # Interval to bool methods, Unary.
-def is_Interval(x:Any) -> bool: return x.__class__.__name__ == 'Interval'
-def is_not_Interval(x:Any) -> bool: return x.__class__.__name__ != 'Interval' 
\ No newline at end of file
+def is_Interval(x:Any) -> bool: return isinstance(x, Interval)
+def is_not_Interval(x:Any) -> bool: return not isinstance(x, Interval)
\ No newline at end of file
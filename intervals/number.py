@@ -39,18 +39,62 @@ import numpy
 from numpy import (ndarray,asarray,stack,transpose,ascontiguousarray,zeros)
 # float32=numpy.float32
 
-from intervals.arithmetic import (multiply,divide)
+from intervals.arithmetic import (add,subtract,multiply,divide,matmul,power,verify)
 
 MACHINE_EPS = 7./3 - 4./3 - 1
 
-NUMERIC_TYPES =     {'int','float','complex',                   # Python numbers     
-                    'int8','int16','int32','int64','intp',      # Numpy integers
-                    'uint8','uint16','uint32','uint64','uintp', # Numpy unsigned integers
-                    'float16','float32','float64','float_',     # Numpy floats and doubles
-                    'complex64','complex128','complex_'}        # Numpy complex floats and doubles
+NUMERIC_TYPES =     (int,float,complex,numpy.number)     # Python numbers, numpy integers, floats and complex floats
+INTEGERS =          (int,numpy.integer)
+# FLOATS =            (float,numpy.floating)
 
-INTEGERS =          {'int','int8','int16','int32','int64','intp','uint8','uint16','uint32','uint64','uintp'}
-# FLOATS =            {'float','float16','float32','float64','float_'}
+# Kinds of operands, used by the operators to dispatch on the type of the other operand. 
+OTHER, INTEGER, NUMBER, ARRAY, INTERVAL = range(5)
+SCALARS = (INTEGER, NUMBER)
+
+KINDS = {} # cache of the kinds by type, filled on the first sight of each type
+
+def classify(t:type) -> int:
+    if issubclass(t, Interval): return INTERVAL
+    if issubclass(t, ndarray): return ARRAY
+    if issubclass(t, (bool,numpy.bool_)): return OTHER # booleans are not numbers here
+    if issubclass(t, INTEGERS): return INTEGER
+    if issubclass(t, NUMERIC_TYPES): return NUMBER
+    return OTHER # e.g. list, str, and the types of intervals.complex
+
+def integral(x:Any) -> bool: # a real number with an integer value, e.g. the exponent 2.0
+    return isinstance(x,(float,numpy.floating)) and bool(numpy.isfinite(x)) and float(x).is_integer() and (abs(x) < 2**53)
+
+def kind(x:Any) -> int:
+    """
+    Return the kind of x: one of OTHER, INTEGER, NUMBER, ARRAY, INTERVAL.
+
+    The kind is looked up by the type object of x, so subclasses of Interval and ndarray dispatch like their base class.
+    Types are classified once and cached in KINDS.
+    """
+    try: return KINDS[type(x)]
+    except KeyError: return KINDS.setdefault(type(x), classify(type(x)))
+
+def float_dtype(*arrays) -> numpy.dtype:
+    """
+    Return the floating dtype of the endpoints: the result type of the arrays by numpy's promotion rules, or float64 if that is not floating.
+    """
+    dtype = numpy.result_type(*arrays)
+    if dtype.kind == 'f': return dtype
+    return numpy.dtype(float)
+
+HANDLED_FUNCTIONS = {} # numpy ufuncs and functions with an interval implementation, e.g. numpy.exp -> intervals.methods.exp
+
+def implements(*numpy_functions):
+    """
+    Register the decorated function as the interval implementation of the given numpy ufuncs or functions.
+
+    Once registered, calls like `numpy.exp(x)` or `numpy.concatenate([x,y])` with Interval arguments are 
+    dispatched to the implementation via the protocols `__array_ufunc__` and `__array_function__`.
+    """
+    def decorator(fn):
+        for f in numpy_functions: HANDLED_FUNCTIONS[f] = fn
+        return fn
+    return decorator
 
 
 def show(x: Interval) -> str:
@@ -71,34 +115,116 @@ class Interval():
 
     Interval is the main class. 
 
+    An Interval constructed from Python numbers, e.g. Interval(1,2), is a ScalarInterval. 
+    Numpy scalars and arrays, including 0-d arrays, give array endpoints.
+
+    By default lo and hi are two separate arrays. With `layout` the endpoints are stored in one contiguous buffer, 
+    and lo, hi and val are views of it:
+
+    'first': buffer of shape (2,*shape), lo and hi are contiguous. This is the best layout for the arithmetic kernels.
+    'last':  buffer of shape val.shape, i.e. (*reversed(shape),2), so val is the buffer itself.
+
+    Use Interval.frombuffer to wrap an existing array without copying it.
+
+    The endpoints are floating arrays, of type `dtype` if given. Otherwise the type follows numpy's promotion rules,
+    e.g. float32 endpoints stay float32, while integer endpoints become float64.
+
     """
+    __slots__ = ('__lo','__hi','__shape','__buffer','__layout')
+    def __new__(cls, lo=None, hi=None, layout:str=None, dtype=None):
+        if (cls is Interval) and (layout is None) and (dtype is None) and (type(lo) in (int,float)) and ((hi is None) or (type(hi) in (int,float))): return object.__new__(ScalarInterval)
+        return object.__new__(cls)
     def __repr__(self): # return
         return show(self)
     def __str__(self): # print
         return show(self)
     def __init__(self,
                  lo: Union[float,ndarray], 
-                 hi: Optional[Union[float,ndarray]] = None) -> None:
-        self.__lo = asarray(lo, dtype=float)
-        if hi is None: hi = self.__lo.copy()
+                 hi: Optional[Union[float,ndarray]] = None,
+                 layout: Optional[str] = None,
+                 dtype: Optional[numpy.dtype] = None) -> None:
+        lo = asarray(lo, dtype=dtype)
+        hi = lo if hi is None else asarray(hi, dtype=dtype)
+        if (lo.dtype != hi.dtype) | (lo.dtype.kind != 'f'): 
+            dtype = float_dtype(lo,hi)
+            lo, hi = lo.astype(dtype,copy=False), hi.astype(dtype,copy=False)
+        if layout is not None:
+            shape = numpy.broadcast_shapes(lo.shape,hi.shape)
+            if layout == 'first': buffer = numpy.empty((2,)+shape,dtype=lo.dtype)
+            elif layout == 'last': buffer = numpy.empty(shape[::-1]+(2,),dtype=lo.dtype)
+            else: raise ValueError(f"Unknown layout '{layout}', choose between 'first' and 'last'.")
+            self.__attach(buffer,layout)
+            self.__lo[...], self.__hi[...] = lo, hi
+            return
+        self.__lo = lo
         # self.__unsized = True
-        self.__hi = asarray(hi, dtype=float) # check lo and hi have same shape
+        self.__hi = hi # check lo and hi have same shape
+        if self.__hi is self.__lo: self.__hi = self.__lo.copy() # lo and hi must not share the buffer, or in-place operators would update it twice
         # if (len(self.__hi.shape)>0) | (len(self.__hi.shape)>0): self.__unsized = False
         self.__shape = self.__lo.shape
+        self.__buffer, self.__layout = None, None
         # self.__scalar = (self.__shape==()) | (self.__shape==(1,))
+    def __attach(self, buffer:ndarray, layout:str) -> None: # lo and hi become views of the buffer
+        if layout == 'first': 
+            if buffer.shape[:1] != (2,): raise ValueError(f"A buffer with layout 'first' must have shape (2,...), got {buffer.shape}.")
+            lo, hi = buffer[0,...], buffer[1,...]
+        elif layout == 'last':
+            if buffer.shape[-1:] != (2,): raise ValueError(f"A buffer with layout 'last' must have shape (...,2), got {buffer.shape}.")
+            lo, hi = transpose(buffer)[0,...], transpose(buffer)[1,...]
+        else: raise ValueError(f"Unknown layout '{layout}', choose between 'first' and 'last'.")
+        self.__lo, self.__hi, self.__shape = lo, hi, lo.shape
+        self.__buffer, self.__layout = buffer, layout
+    @classmethod
+    def frombuffer(cls, buffer:ndarray, layout:str='last') -> Interval:
+        """
+        Return an Interval whose endpoints are views of `buffer`, with shape (...,2) for layout 'last' or (2,...) for layout 'first'.
+
+        The buffer is not copied if it is already an ndarray of floats. 
+        As for intervalise, an (n,2) buffer gives an Interval of shape (n,) and a (2,n) buffer, with layout 'first', too.
+        """
+        buffer = asarray(buffer)
+        if buffer.dtype.kind != 'f': buffer = buffer.astype(float)
+        x = object.__new__(cls)
+        x.__attach(buffer,layout)
+        return x
     def __len__(self):
         if self.unsized: return 0 # interval object is not sized, perhaps return an error: TypeError: len() of unsized object
         else: return self.__lo.shape[0] 
     def __iter__(self): # https://realpython.com/introduction-to-python-generators/
-        lo_iter, hi_iter = numpy.nditer(self.lo),numpy.nditer(self.hi)
-        while True:
-            try: yield Interval(lo=next(lo_iter),hi=next(hi_iter))
-            except StopIteration: break
-        pass
+        for l,h in zip(self.__lo.flat,self.__hi.flat): yield ScalarInterval(l,h)
     def __next__(self):
         pass
     def __getitem__(self, i: Union[int, slice]): # make class indexable
         return Interval(lo=self.__lo[i],hi=self.__hi[i])
+    # -------------- NUMPY PROTOCOLS -------------- #
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, where=True, **kwargs):
+        """
+        Dispatch numpy ufuncs, e.g. numpy.exp(x) or ndarray + x, to the registered interval implementations.
+
+        `out` can be an Interval (or an ndarray for the comparisons), and `where` selects the elements that are written.
+        Elements not selected by `where` are NaN when `out` is not given.
+        """
+        fn = HANDLED_FUNCTIONS.get(ufunc)
+        if (fn is None) | (method != '__call__') | (len(kwargs)>0): return NotImplemented
+        result = fn(*inputs)
+        if result is NotImplemented: return NotImplemented
+        if out is None:
+            if where is True: return result
+            out = Interval(numpy.full(result.shape,numpy.nan,dtype=result.dtype),numpy.full(result.shape,numpy.nan,dtype=result.dtype)) if is_Interval(result) else numpy.zeros(numpy.shape(result),dtype=bool)
+        else: out = out[0]
+        if is_Interval(result):
+            numpy.copyto(out.lo,result.lo,where=where)
+            numpy.copyto(out.hi,result.hi,where=where)
+        else: numpy.copyto(out,result,where=where)
+        return out
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Dispatch numpy functions, e.g. numpy.concatenate([x,y]) or numpy.sum(x,axis=0), to the registered interval implementations.
+        """
+        fn = HANDLED_FUNCTIONS.get(func)
+        if fn is None: return NotImplemented
+        if not all(issubclass(t,(Interval,ndarray)) for t in types): return NotImplemented
+        return fn(*args,**kwargs)
     # -------------- METHODS -------------- #
     @property
     def lo(self) -> Union[ndarray,float]: return self.__lo
@@ -114,7 +240,9 @@ class Interval():
         else: return True
     @property
     def val(self):
-        if self.unsized: return asarray([self.__lo,self.__hi],dtype=float)
+        if self.__layout == 'last': return self.__buffer
+        if self.__layout == 'first': return transpose(self.__buffer)
+        if self.unsized: return asarray([self.__lo,self.__hi],dtype=self.dtype)
         else: return transpose(stack((self.__lo,self.__hi)))
     @property
     def scalar(self):
@@ -122,100 +250,131 @@ class Interval():
     @property
     def shape(self):
         return self.__shape
+    @property
+    def dtype(self) -> numpy.dtype: return self.__lo.dtype
+    @property
+    def layout(self) -> Optional[str]: return self.__layout
+    @property
+    def buffer(self) -> Optional[ndarray]: return self.__buffer
     # -------------- ARITHMETIC -------------- #
     # unary operators #
     def __neg__(self): return Interval(-self.hi, -self.lo)
-    def __pos__(self): return self
+    def __pos__(self): # a copy, so that y = +x; y += 1 leaves x unchanged
+        if self.__layout is not None: return Interval.frombuffer(self.__buffer.copy(),layout=self.__layout)
+        return Interval(self.__lo.copy(), self.__hi.copy())
     # binary operators #
+    # The results go through `verify`, which rounds them outward when the verified mode `arithmetic.OUTWARD` is on.
     def __add__(self,other):
-        otherType = other.__class__.__name__
-        if (otherType == 'ndarray') | (otherType in NUMERIC_TYPES): lo, hi = self.lo + other, self.hi + other
-        elif otherType == 'Interval': lo,hi = self.lo + other.lo, self.hi + other.hi
+        k = kind(other)
+        if k == INTERVAL: lo,hi = self.lo + other.lo, self.hi + other.hi
+        elif k != OTHER: lo, hi = self.lo + other, self.hi + other
         else: return NotImplemented # TypeError: unsupported operand type(s) for +: 'int' and 'Interval' (for example)
-        return Interval(lo,hi)
+        return Interval(*verify(lo,hi))
     def __radd__(self, left):
-        leftType = left.__class__.__name__
-        if (leftType == 'ndarray') | (leftType in NUMERIC_TYPES): return self.__add__(left)
+        if kind(left) in (INTEGER,NUMBER,ARRAY): return self.__add__(left)
         else: return NotImplemented # TypeError: unsupported operand type(s) for +: 'int' and 'Interval' (for example)
     def __sub__(self, other):
-        otherType = other.__class__.__name__
-        if (otherType == 'ndarray') | (otherType in NUMERIC_TYPES): lo,hi = self.lo - other, self.hi - other
-        elif otherType == 'Interval': lo, hi = self.lo - other.hi, self.hi - other.lo
-        else: NotImplemented
-        return Interval(lo,hi)
+        k = kind(other)
+        if k == INTERVAL: lo, hi = self.lo - other.hi, self.hi - other.lo
+        elif k != OTHER: lo,hi = self.lo - other, self.hi - other
+        else: return NotImplemented
+        return Interval(*verify(lo,hi))
     def __rsub__(self, left):
-        leftType = left.__class__.__name__
-        if (leftType == 'ndarray') | (leftType in NUMERIC_TYPES): lo, hi = left - self.hi, left - self.lo
+        if kind(left) in (INTEGER,NUMBER,ARRAY): lo, hi = left - self.hi, left - self.lo
         else: return NotImplemented #print("Error: not among the allowed types.")
-        return Interval(lo,hi)
+        return Interval(*verify(lo,hi))
     def __mul__(self,other):
-        otherType = other.__class__.__name__
-        if otherType in NUMERIC_TYPES:
+        k = kind(other)
+        if k in SCALARS:
             if other >= 0: lo, hi = self.lo * other, self.hi * other
             else: lo, hi = self.hi * other, self.lo * other
-        elif otherType == 'ndarray': # check self and other have same shape
-            lo,hi = numpy.empty(self.__lo.shape),numpy.empty(self.__lo.shape)
-            if len(other.shape)==0: self.__mul__(float(other)) # safety net for ndarrays with no shape
-            other_positive = other >= 0
-            other_negative = other_positive==False
-            lo[other_positive]=self.lo[other_positive] * other[other_positive]
-            hi[other_positive]=self.hi[other_positive] * other[other_positive]
-            lo[other_negative]=self.hi[other_negative] * other[other_negative]
-            hi[other_negative]=self.lo[other_negative] * other[other_negative]
-        elif otherType == 'Interval':
-            lo,hi = multiply(self,other)
+        elif k == ARRAY: # shapes of self and other need only be broadcastable
+            a,b = self.lo * other, self.hi * other
+            lo,hi = numpy.fmin(a,b), numpy.fmax(a,b)
+        elif k == INTERVAL:
+            lo,hi = multiply(self,other,outward=False)
         else: return NotImplemented
-        return Interval(lo,hi)
+        return Interval(*verify(lo,hi))
     def __rmul__(self, left):
-        leftType = left.__class__.__name__
-        if (leftType == 'ndarray') | (leftType in NUMERIC_TYPES): return self.__mul__(left)
+        if kind(left) in (INTEGER,NUMBER,ARRAY): return self.__mul__(left)
         else: return NotImplemented
     def __truediv__(self,other):
-        otherType = other.__class__.__name__
-        if otherType in NUMERIC_TYPES:
+        k = kind(other)
+        if k in SCALARS:
             if other == 0: raise ZeroDivisionError
             if other > 0: lo, hi = self.lo / other, self.hi / other
             else: lo, hi = self.hi / other, self.lo / other
-        elif otherType == 'ndarray':
-            lo,hi = numpy.empty(self.__lo.shape),numpy.empty(self.__lo.shape)
-            if any(other.flatten()==0): raise ZeroDivisionError
-            other_positive = other > 0
-            other_negative = other_positive==False
-            lo[other_positive]=self.lo[other_positive] / other[other_positive]
-            hi[other_positive]=self.hi[other_positive] / other[other_positive]
-            lo[other_negative]=self.hi[other_negative] / other[other_negative]
-            hi[other_negative]=self.lo[other_negative] / other[other_negative]
-            pass
-        elif otherType == 'Interval':
-            lo,hi = divide(self,other)
-        else: NotImplemented
-        return Interval(lo,hi)
+        elif k == ARRAY: # shapes of self and other need only be broadcastable
+            if numpy.any(other==0): raise ZeroDivisionError
+            a,b = self.lo / other, self.hi / other
+            lo,hi = numpy.fmin(a,b), numpy.fmax(a,b)
+        elif k == INTERVAL:
+            lo,hi = divide(self,other,outward=False)
+        else: return NotImplemented
+        return Interval(*verify(lo,hi))
     def __rtruediv__(self, left):
-        leftType = left.__class__.__name__
+        if kind(left) not in (INTEGER,NUMBER,ARRAY): return NotImplemented
         # lo,hi = numpy.empty(self.__lo.shape),numpy.empty(self.__hi.shape)
         self_lo, self_hi = self.lo, self.hi
         self_straddle_zero = numpy.any((self_lo.flatten()<=0) & (self_hi.flatten()>=0))
         if self_straddle_zero: raise ZeroDivisionError
-        if (leftType == 'ndarray') | (leftType in NUMERIC_TYPES): 
-            if left >= 0: lo, hi = left / self_hi, left / self_lo
-            else: lo, hi = left / self_lo, left / self_hi
+        a,b = left / self_hi, left / self_lo # shapes of self and left need only be broadcastable
+        lo,hi = numpy.fmin(a,b), numpy.fmax(a,b)
+        return Interval(*verify(lo,hi))
+    def __matmul__(self,other):
+        if kind(other) in (ARRAY,INTERVAL): lo,hi = matmul(self,other)
         else: return NotImplemented
         return Interval(lo,hi)
-    def __pow__(self,other):
-        otherType = other.__class__.__name__
-        if otherType in INTEGERS:
-            a,b = numpy.asarray(self.lo**other), numpy.asarray(self.hi**other) # a2,b2 = a**2, b**2
-            if other%2==0: # even power
-                lo=zeros(a.shape) # numpy.max([numpy.min([a,b],axis=0),numpy.zeros(a.shape)],axis=0)
-                lo[self<0]=b[self<0]
-                lo[self>0]=a[self>0]
-                hi=numpy.max([a,b],axis=0)
-            else: # odd power
-                lo=numpy.min([a,b],axis=0)
-                hi=numpy.max([a,b],axis=0)
-        else: raise NotImplemented
+    def __rmatmul__(self, left):
+        if kind(left) == ARRAY: lo,hi = matmul(left,self)
+        else: return NotImplemented
         return Interval(lo,hi)
+    def __pow__(self,other):
+        """
+        Integer powers, including integer-valued floats such as 2.0, are computed from the endpoints. 
+        Real and interval exponents go to `arithmetic.power`, which needs a base in [0,inf).
+        """
+        k = kind(other)
+        if (k == NUMBER) and integral(other): other, k = int(other), INTEGER
+        if k == INTEGER:
+            if other < 0: return 1/self**(-other) # raises ZeroDivisionError if self contains zero
+            a,b = numpy.asarray(self.lo**other), numpy.asarray(self.hi**other)
+            if other == 0: return Interval(numpy.ones_like(a),numpy.ones_like(b))
+            if other%2==0: # even power, the minimum is zero if self contains zero
+                lo = numpy.where(self.lo>=0, a, numpy.where(self.hi<=0, b, 0))
+                hi = numpy.fmax(a,b)
+            else: lo,hi = a,b # odd power, monotonic
+        elif k != OTHER: lo,hi = power(self,other,outward=False)
+        else: return NotImplemented
+        return Interval(*verify(lo,hi))
+    def __rpow__(self,left):
+        if kind(left) in (INTEGER,NUMBER,ARRAY): return Interval(*power(left,self))
+        else: return NotImplemented
 
+    # in-place operators #
+    # The result is written into the endpoint arrays of self, so self must own writeable arrays with the shape of the result.
+    # These arrays can belong to the caller: the constructor keeps ndarray endpoints, and `frombuffer` and `intervalise` wrap 
+    # a buffer, without copying them. So x = Interval(a,b); x += 1 also updates a and b. Use +x or `methods.copy` to detach.
+    def __iadd__(self,other):
+        if kind(other) != OTHER: add(self,other,out=(self.__lo,self.__hi))
+        else: return NotImplemented
+        return self
+    def __isub__(self,other):
+        if kind(other) != OTHER: subtract(self,other,out=(self.__lo,self.__hi))
+        else: return NotImplemented
+        return self
+    def __imul__(self,other):
+        k = kind(other)
+        if k == INTERVAL: multiply(self,other,out=(self.__lo,self.__hi))
+        elif k != OTHER: multiply(self,other,engine='minmax',out=(self.__lo,self.__hi))
+        else: return NotImplemented
+        return self
+    def __itruediv__(self,other):
+        k = kind(other)
+        if k == INTERVAL: divide(self,other,out=(self.__lo,self.__hi))
+        elif k != OTHER: divide(self,other,engine='minmax',out=(self.__lo,self.__hi))
+        else: return NotImplemented
+        return self
 
     def __lt__(self, other): return hi(self) < lo(other)
     def __rlt__(self,left):  return hi(left) < lo(self)
@@ -228,14 +387,124 @@ class Interval():
     def __eq__(self, other): return (lo(self)==lo(other)) & (hi(self)==hi(other))
     def __ne__(self,other):  return not(self == other)
 
+class ScalarInterval(Interval):
+    """
+    Interval with two float endpoints. 
+    
+    Has the same public API of Interval, but the arithmetic between scalar intervals and numbers is done on Python floats, 
+    without going through numpy. When the other operand is an array-backed Interval or an ndarray, the operation is done by Interval.
+    """
+    __slots__ = ('__lo','__hi')
+    def __init__(self, lo: float, hi: Optional[float] = None, layout: Optional[str] = None, dtype: Optional[numpy.dtype] = None) -> None:
+        if (layout is not None) | (dtype is not None): raise ValueError('A ScalarInterval has float endpoints, use Interval for a layout or a dtype.')
+        self.__lo = float(lo)
+        self.__hi = self.__lo if hi is None else float(hi)
+    def __len__(self): return 0
+    def __iter__(self): yield self
+    def __getitem__(self, i): return Interval(asarray(self.__lo)[i],asarray(self.__hi)[i]) # raises IndexError unless i is () or ...
+    # -------------- METHODS -------------- #
+    @property
+    def lo(self) -> float: return self.__lo
+    @property
+    def hi(self) -> float: return self.__hi
+    @property
+    def unsized(self): return True
+    @property
+    def val(self): return asarray([self.__lo,self.__hi],dtype=float)
+    @property
+    def scalar(self): return True
+    @property
+    def shape(self): return ()
+    @property
+    def dtype(self): return numpy.dtype(float)
+    @property
+    def layout(self): return None
+    @property
+    def buffer(self): return None
+    # -------------- ARITHMETIC -------------- #
+    # Results that are NaN, e.g. from 0*inf, are left to Interval, which ignores the NaN products like the minmax engine.
+    def __neg__(self): return ScalarInterval(-self.__hi, -self.__lo)
+    def __pos__(self): return self # the endpoints are immutable
+    def __add__(self, other):
+        k = kind(other)
+        if k == INTERVAL and other.unsized: return ScalarInterval(*verify(self.__lo + other.lo, self.__hi + other.hi))
+        if k in SCALARS: return ScalarInterval(*verify(self.__lo + other, self.__hi + other))
+        return super().__add__(other)
+    def __radd__(self, left):
+        if kind(left) in SCALARS: return ScalarInterval(*verify(left + self.__lo, left + self.__hi))
+        return super().__radd__(left)
+    def __sub__(self, other):
+        k = kind(other)
+        if k == INTERVAL and other.unsized: return ScalarInterval(*verify(self.__lo - other.hi, self.__hi - other.lo))
+        if k in SCALARS: return ScalarInterval(*verify(self.__lo - other, self.__hi - other))
+        return super().__sub__(other)
+    def __rsub__(self, left):
+        if kind(left) in SCALARS: return ScalarInterval(*verify(left - self.__hi, left - self.__lo))
+        return super().__rsub__(left)
+    def __mul__(self, other):
+        k = kind(other)
+        if k == INTERVAL and other.unsized: 
+            a,b,c,d = self.__lo, self.__hi, other.lo, other.hi
+            if a >= 0:
+                if c >= 0: l,h = a*c, b*d
+                elif d <= 0: l,h = b*c, a*d
+                else: l,h = b*c, b*d
+            elif b <= 0:
+                if c >= 0: l,h = a*d, b*c
+                elif d <= 0: l,h = b*d, a*c
+                else: l,h = a*d, a*c
+            else:
+                if c >= 0: l,h = a*d, b*d
+                elif d <= 0: l,h = b*c, a*c
+                else: l,h = min(a*d,b*c), max(a*c,b*d)
+        elif k in SCALARS:
+            if other >= 0: l,h = self.__lo * other, self.__hi * other
+            else: l,h = self.__hi * other, self.__lo * other
+        else: return super().__mul__(other)
+        if (l != l) | (h != h): return super().__mul__(other)
+        return ScalarInterval(*verify(l,h))
+    def __rmul__(self, left):
+        if kind(left) in SCALARS: return self.__mul__(left)
+        return super().__rmul__(left)
+    def __truediv__(self, other):
+        k = kind(other)
+        if k == INTERVAL and other.unsized: 
+            a,b,c,d = self.__lo, self.__hi, other.lo, other.hi
+            if c > 0: l,h = (a/d if a >= 0 else a/c), (b/c if b >= 0 else b/d)
+            elif d < 0: l,h = (b/d if b >= 0 else b/c), (a/c if a >= 0 else a/d)
+            else: raise ZeroDivisionError
+        elif k in SCALARS:
+            if other == 0: raise ZeroDivisionError
+            if other > 0: l,h = self.__lo / other, self.__hi / other
+            else: l,h = self.__hi / other, self.__lo / other
+        else: return super().__truediv__(other)
+        if (l != l) | (h != h): return super().__truediv__(other)
+        return ScalarInterval(*verify(l,h))
+    def __rtruediv__(self, left):
+        if kind(left) in SCALARS: return ScalarInterval(left).__truediv__(self)
+        return super().__rtruediv__(left)
+    def __pow__(self, other):
+        if (kind(other) == NUMBER) and integral(other): other = int(other)
+        if (kind(other) != INTEGER) or (other < 0): return super().__pow__(other)
+        if other == 0: return ScalarInterval(1.,1.)
+        a,b = self.__lo**other, self.__hi**other
+        if other%2==1: return ScalarInterval(*verify(a,b))
+        if self.__lo >= 0: return ScalarInterval(*verify(a,b))
+        if self.__hi <= 0: return ScalarInterval(*verify(b,a))
+        return ScalarInterval(*verify(0.,max(a,b)))
+    # in-place operators #
+    # The endpoints are immutable floats, so x += y falls back to x = x + y.
+    def __iadd__(self, other): return NotImplemented
+    def __isub__(self, other): return NotImplemented
+    def __imul__(self, other): return NotImplemented
+    def __itruediv__(self, other): return NotImplemented
+
 # def iterator(x:Interval) -> Interval:
 #     lo_iter,hi_iter = numpy.nditer(x.lo()),numpy.nditer(x.hi())
 #     while True: yield Interval(lo=next(lo_iter),hi=next(hi_iter))
 
 
-def is_Interval(x:Any) -> bool:
-    x_class_name = x.__class__.__name__
-    return x_class_name == 'Interval'
+def is_Interval(x:Any) -> bool: return isinstance(x, Interval)
 
 
 def lo(x: Interval) -> Union[float, ndarray]:
@@ -256,4 +525,15 @@ def hi(x: Interval) -> Union[float, ndarray]:
     
     """
     if is_Interval(x): return x.hi
-    return x
\ No newline at end of file
+    return x
+
+
+# Comparisons and unary operators of numpy, the other ufuncs are registered in intervals.methods
+implements(numpy.negative)(lambda x: -x)
+implements(numpy.positive)(lambda x: +x)
+implements(numpy.less)(lambda x,y: hi(x) < lo(y))
+implements(numpy.less_equal)(lambda x,y: hi(x) <= lo(y))
+implements(numpy.greater)(lambda x,y: lo(x) > hi(y))
+implements(numpy.greater_equal)(lambda x,y: lo(x) >= hi(y))
+implements(numpy.equal)(lambda x,y: (lo(x)==lo(y)) & (hi(x)==hi(y)))
+implements(numpy.not_equal)(lambda x,y: (lo(x)!=lo(y)) | (hi(x)!=hi(y)))
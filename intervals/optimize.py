@@ -0,0 +1,187 @@
+"""
+Branch and bound enclosure of the global minimum, maximum and range of an interval function over a box.
+
+The boxes are kept in a priority queue ordered by the lower bound of f on them. Each iteration pops a batch of the most promising boxes,
+bisects them with `bisect`, and evaluates f on all the halves, and on their midpoints, in two vectorised calls.
+The smallest upper bound found so far is the incumbent, and the boxes whose lower bound exceeds it are pruned.
+"""
+from __future__ import annotations
+from typing import (Union, Optional, Callable)
+
+import time
+
+import numpy
+from numpy import ndarray
+
+from intervals.number import Interval
+from intervals.methods import (intervalise, lo, hi, bisect)
+
+OPTIMIZE_BATCH_SIZE = 2**10 # boxes bisected per iteration
+OPTIMIZE_TOL = 1e-4 # default width below which a box is not bisected, relative to the widest side of the search box
+
+class Boxes(object):
+    """
+    Growable storage of the endpoints of the boxes in the queue, whose slots are reused once a box is bisected or pruned.
+    """
+    def __init__(self, d:int, capacity:int=1024):
+        self.lo, self.hi = numpy.empty((capacity,d)), numpy.empty((capacity,d))
+        self.__free = numpy.arange(capacity)[::-1] # slots are taken from the end
+        self.__n_free = capacity
+    def add(self, lo:ndarray, hi:ndarray) -> ndarray:
+        m = len(lo)
+        if m > self.__n_free: self.__grow(m)
+        ids = self.__free[self.__n_free-m:self.__n_free].copy()
+        self.__n_free -= m
+        self.lo[ids], self.hi[ids] = lo, hi
+        return ids
+    def free(self, ids:ndarray) -> None:
+        self.__free[self.__n_free:self.__n_free+len(ids)] = ids
+        self.__n_free += len(ids)
+    def __grow(self, m:int):
+        capacity, d = self.lo.shape
+        new = max(2*capacity, capacity+m)
+        for name in ('lo', 'hi'):
+            grown = numpy.empty((new,d))
+            grown[:capacity] = getattr(self, name)
+            setattr(self, name, grown)
+        free = numpy.empty(new, dtype=numpy.intp)
+        free[:self.__n_free] = self.__free[:self.__n_free]
+        free[self.__n_free:self.__n_free+new-capacity] = numpy.arange(capacity, new)[::-1]
+        self.__free, self.__n_free = free, self.__n_free + new - capacity
+
+class SortedRuns(object):
+    """
+    Priority queue of (key, slot) pairs pushed in blocks, kept as a few sorted runs of geometrically increasing size, 
+    merged by numpy when a run is no longer at least twice as long as the next. A batch of the smallest keys is popped 
+    as a prefix of each run, so a pop costs a few array operations per run, and there are about log2 of the pairs runs.
+    """
+    def __init__(self): self.__runs = [] # [keys, slots, start] sorted by key from start
+    def __len__(self): return int(numpy.sum([len(k)-start for k,_,start in self.__runs]))
+    def push(self, keys:ndarray, slots:ndarray) -> None:
+        if len(keys) == 0: return
+        o = numpy.argsort(keys, kind='stable')
+        self.__runs.append([keys[o], slots[o], 0])
+        while (len(self.__runs) > 1) and (len(self.__runs[-2][0])-self.__runs[-2][2] < 2*(len(self.__runs[-1][0])-self.__runs[-1][2])):
+            (k1,v1,s1), (k2,v2,s2) = self.__runs.pop(), self.__runs.pop()
+            k, v = numpy.concatenate((k2[s2:],k1[s1:])), numpy.concatenate((v2[s2:],v1[s1:]))
+            o = numpy.argsort(k, kind='stable') # a merge of two sorted runs
+            self.__runs.append([k[o], v[o], 0])
+    def pop(self, m:int, limit:float=numpy.inf):
+        """
+        Pop about the m pairs with the smallest keys, among those not above `limit`: all the keys below the m-th smallest, and its ties.
+        """
+        heads = [k[start:start+m] for k,_,start in self.__runs]
+        candidates = numpy.concatenate([numpy.empty(0)]+heads)
+        if len(candidates) == 0: return numpy.empty(0), numpy.empty(0, dtype=numpy.intp)
+        tau = numpy.partition(candidates, m-1)[m-1] if len(candidates) > m else numpy.max(candidates)
+        tau = tau if tau < limit else limit
+        keys, slots = [numpy.empty(0)], [numpy.empty(0, dtype=numpy.intp)]
+        for run, head in zip(self.__runs, heads):
+            stop = int(numpy.searchsorted(head, tau, side='right'))
+            keys.append(head[:stop]); slots.append(run[1][run[2]:run[2]+stop])
+            run[2] += stop
+        self.__runs = [run for run in self.__runs if run[2] < len(run[0])]
+        return numpy.concatenate(keys), numpy.concatenate(slots)
+    def drain(self):
+        """
+        Pop all the pairs left, in no particular order.
+        """
+        keys = [numpy.empty(0)] + [k[start:] for k,_,start in self.__runs]
+        slots = [numpy.empty(0, dtype=numpy.intp)] + [v[start:] for _,v,start in self.__runs]
+        self.__runs = []
+        return numpy.concatenate(keys), numpy.concatenate(slots)
+
+def minimize(f:Callable, x_:Interval, tol:float=None, ftol:float=None, max_time:float=None, max_iter:int=None, batch:int=None, report:bool=False):
+    """
+    Enclose the global minimum of f over the box x, by branch and bound.
+
+    f: A vectorised interval function, taking an Interval of shape (k,d), k boxes, and returning k enclosures of shape (k,).
+    x: The search box, of shape (d,).
+    tol: Boxes whose sides are all narrower than `tol` are not bisected further, default is `OPTIMIZE_TOL` times the widest side of x.
+    ftol: Boxes whose lower bound is within `ftol` of the incumbent are not bisected further, default is 0.
+    max_time: A budget in seconds, checked after each iteration.
+    max_iter: A budget of iterations.
+    batch: The number of boxes bisected per iteration, default is `OPTIMIZE_BATCH_SIZE`.
+
+    out: An Interval enclosing min f(x), from the smallest lower bound of f on the boxes left to the incumbent.
+    If `report` is True, also a dict with the boxes left, an Interval of shape (k,d), their lower bounds,
+    the number of iterations and of evaluations of f (boxes and midpoints), the time in seconds,
+    and whether the search converged, i.e. ended with no box left to bisect rather than on a budget.
+
+    Where f is empty (NaN) on a box the box is dropped, where only its lower bound is NaN the box is kept with a lower bound of -inf.
+    """
+    x = intervalise(x_)
+    x_lo, x_hi = numpy.array(lo(x), dtype=float, ndmin=1), numpy.array(hi(x), dtype=float, ndmin=1)
+    if x_lo.ndim != 1: raise ValueError(f'minimize takes a search box of shape (d,), got {x_lo.shape}.')
+    d = len(x_lo)
+    if tol is None: tol = OPTIMIZE_TOL * numpy.max(x_hi - x_lo)
+    if ftol is None: ftol = 0.
+    if batch is None: batch = OPTIMIZE_BATCH_SIZE
+    t0 = time.perf_counter()
+    boxes = Boxes(d)
+    queue = SortedRuns() # of the slots of the boxes to bisect, by their lower bound
+    done_lower, done_ids = [], [] # the boxes narrower than tol, or within ftol of the incumbent, are not bisected
+    incumbent = numpy.inf
+    iterations, evaluations, converged = 0, 0, False
+    c_lo, c_hi, c_parent = x_lo[None,:], x_hi[None,:], numpy.array([-numpy.inf])
+    while True:
+        # evaluate the new boxes, update the incumbent, and keep the boxes that can still hold the minimum
+        if len(c_lo) > 0:
+            y, y_mid = f(Interval(c_lo,c_hi)), f(Interval((c_lo+c_hi)/2,(c_lo+c_hi)/2))
+            evaluations += 2*len(c_lo)
+            y_lo, y_hi = numpy.asarray(lo(y),dtype=float).reshape(-1), numpy.asarray(hi(y),dtype=float).reshape(-1)
+            incumbent = numpy.fmin(incumbent, numpy.fmin(numpy.fmin.reduce(y_hi), numpy.fmin.reduce(numpy.asarray(hi(y_mid),dtype=float).reshape(-1))))
+            empty = numpy.isnan(y_lo) & numpy.isnan(y_hi)
+            lower = numpy.maximum(numpy.where(numpy.isnan(y_lo), -numpy.inf, y_lo), c_parent) # a half is no better than its parent
+            keep = ~empty & ~(lower > incumbent)
+            c_lo, c_hi, lower = c_lo[keep], c_hi[keep], lower[keep]
+            ids = boxes.add(c_lo, c_hi)
+            small = numpy.all(c_hi - c_lo <= tol, axis=1)
+            done_lower.append(lower[small]); done_ids.append(ids[small])
+            queue.push(lower[~small], ids[~small])
+        # pop the most promising boxes
+        if (max_iter is not None) and (iterations >= max_iter): break
+        if (max_time is not None) and (time.perf_counter() - t0 >= max_time): break
+        p_lower, p_ids = queue.pop(batch, limit=incumbent)
+        if len(p_ids) < batch: boxes.free(queue.drain()[1]) # the boxes left are above the incumbent, or there are none
+        if len(p_ids) == 0:
+            converged = True
+            break
+        close = incumbent - p_lower <= ftol
+        done_lower.append(p_lower[close]); done_ids.append(p_ids[close])
+        p_lower, p_ids = p_lower[~close], p_ids[~close]
+        a, b = bisect(Interval(boxes.lo[p_ids],boxes.hi[p_ids]))
+        boxes.free(p_ids)
+        c_lo, c_hi = numpy.concatenate((a.lo,b.lo)), numpy.concatenate((a.hi,b.hi))
+        c_parent = numpy.concatenate((p_lower,p_lower))
+        iterations += 1
+    queue_lower, queue_ids = queue.drain()
+    left_lower, left_ids = numpy.concatenate([queue_lower] + done_lower), numpy.concatenate([queue_ids] + done_ids)
+    left = ~(left_lower > incumbent)
+    left_lower, left_ids = left_lower[left], left_ids[left]
+    if len(left_ids) > 0: out = Interval(lo=numpy.min(left_lower), hi=incumbent)
+    else: out = Interval(lo=numpy.nan, hi=numpy.nan) # f is empty on x
+    if not report: return out
+    return out, dict(boxes=Interval(lo=boxes.lo[left_ids],hi=boxes.hi[left_ids]), lower=left_lower,
+                     iterations=iterations, evaluations=evaluations, seconds=time.perf_counter()-t0, converged=converged)
+
+def maximize(f:Callable, x_:Interval, tol:float=None, ftol:float=None, max_time:float=None, max_iter:int=None, batch:int=None, report:bool=False):
+    """
+    Enclose the global maximum of f over the box x, by branch and bound on -f, see `minimize`.
+    The lower bounds in the report are the upper bounds of f.
+    """
+    out = minimize(lambda b: -f(b), x_, tol=tol, ftol=ftol, max_time=max_time, max_iter=max_iter, batch=batch, report=report)
+    if not report: return Interval(lo=-hi(out), hi=-lo(out))
+    out, r = out
+    r['upper'] = -r.pop('lower')
+    return Interval(lo=-hi(out), hi=-lo(out)), r
+
+def enclose_range(f:Callable, x_:Interval, tol:float=None, ftol:float=None, max_time:float=None, max_iter:int=None, batch:int=None, report:bool=False):
+    """
+    Enclose the range of f over the box x, from the lower bound of its minimum to the upper bound of its maximum, see `minimize`.
+    The budgets apply to each of the two searches. With `report` the dict holds the reports of both, under 'minimize' and 'maximize'.
+    """
+    kwargs = dict(tol=tol, ftol=ftol, max_time=max_time, max_iter=max_iter, batch=batch, report=report)
+    f_min, f_max = minimize(f, x_, **kwargs), maximize(f, x_, **kwargs)
+    if not report: return Interval(lo=lo(f_min), hi=hi(f_max))
+    return Interval(lo=lo(f_min[0]), hi=hi(f_max[0])), dict(minimize=f_min[1], maximize=f_max[1])
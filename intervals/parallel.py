@@ -0,0 +1,159 @@
+"""
+Parallel evaluation of interval functions over subpavings, on a pool of processes.
+
+The subpaving is cut into shards of consecutive boxes, each shard is evaluated by a worker with the vectorised Interval,
+and the partial hulls of the workers are merged. The endpoints of a subpaving are copied once into shared memory,
+which the workers map, so no box is pickled. A regular subpaving of a box is not even built: each worker generates
+the subboxes of its shard from the edges of the grid, see `subintervalise`.
+
+The function must be picklable by the pool, i.e. defined at the top level of a module, not a lambda.
+"""
+from __future__ import annotations
+from typing import (Union, Optional, Callable)
+
+import os
+import time
+from concurrent.futures import (ProcessPoolExecutor, Executor)
+from multiprocessing import shared_memory
+
+import numpy
+from numpy import ndarray
+
+from intervals.number import Interval
+from intervals.methods import (intervalise, lo, hi, grid_edges, subintervalise_chunks, EVALUATE_CHUNK_SIZE)
+
+SHARDS_PER_WORKER = 4 # shards per worker, so that a slow shard does not hold up the others
+
+class SharedInterval(object):
+    """
+    An interval array whose endpoints live in a block of shared memory, with layout 'first'.
+
+    `evaluate_parallel` maps the block in the workers without copying it, so a subpaving evaluated with several functions
+    is copied into shared memory once, or filled in place through `interval`. The block is released by `close`, 
+    or on exit when used as a context manager:
+
+    with SharedInterval(subintervalise(x,n)) as s:
+        evaluate_parallel(f,s)
+        evaluate_parallel(g,s)
+    """
+    def __init__(self, x_:Union[Interval,tuple], dtype=None):
+        x = x_ if isinstance(x_, tuple) else intervalise(x_)
+        shape = x if isinstance(x, tuple) else numpy.shape(lo(x))
+        if dtype is None: dtype = float if isinstance(x, tuple) else numpy.asarray(lo(x)).dtype
+        dtype = numpy.dtype(dtype)
+        self.__shm = shared_memory.SharedMemory(create=True, size=max(2*int(numpy.prod(shape))*dtype.itemsize, 1))
+        self.__buffer = numpy.ndarray((2,)+tuple(shape), dtype=dtype, buffer=self.__shm.buf)
+        if not isinstance(x, tuple): self.__buffer[0], self.__buffer[1] = lo(x), hi(x)
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
+    def __repr__(self): return f'SharedInterval({self.shape}, {self.dtype}, {self.name})'
+    @property
+    def interval(self) -> Interval: return Interval.frombuffer(self.__buffer, layout='first')
+    @property
+    def name(self) -> str: return self.__shm.name
+    @property
+    def shape(self) -> tuple: return self.__buffer.shape[1:]
+    @property
+    def dtype(self) -> numpy.dtype: return self.__buffer.dtype
+    def close(self) -> None:
+        """
+        Release the block. The intervals taken from `interval` must not be used afterwards.
+        """
+        if self.__buffer is None: return
+        self.__buffer = None
+        self.__shm.close()
+        self.__shm.unlink()
+
+def evaluate_parallel(f:Callable, x_:Interval, n:Union[int,tuple]=None, workers:int=None, chunk:int=None,
+                      executor:Executor=None, report:bool=False):
+    """
+    Enclose the range of f over a subpaving with the hull of f on its boxes, evaluated in parallel.
+
+    f: A vectorised function taking an Interval of shape (k,d), k boxes, and returning k enclosures, e.g. of shape (k,) or (k,p).
+    x: A subpaving of shape (N,d) if n is None, or a `SharedInterval` of shape (N,d), which is not copied. 
+       Otherwise a d-box of shape (d,), split n times in each dimension as in `subintervalise`.
+    n: The number of splits of each dimension of the box x.
+    workers: The number of processes, default is the number of CPUs. With one worker and no executor f is evaluated in this process.
+             With an executor, pass the number of its workers, which sizes the shards.
+    chunk: The number of boxes evaluated at once by a worker, default is `EVALUATE_CHUNK_SIZE`.
+    executor: A pool of processes to reuse across calls, instead of starting one for each call.
+
+    out: The hull of the enclosures, of the shape of f on one box. Empty (NaN) enclosures are skipped, as in `hull`.
+    If `report` is True, also a dict with the number of boxes, of workers and of shards, and the time in seconds.
+    """
+    if chunk is None: chunk = EVALUATE_CHUNK_SIZE
+    if workers is None: workers = os.cpu_count() or 1
+    shared = x_ if isinstance(x_, SharedInterval) else None
+    x = shared.interval if shared is not None else intervalise(x_)
+    x_lo, x_hi = numpy.asarray(lo(x)), numpy.asarray(hi(x))
+    t0 = time.perf_counter()
+    if n is None:
+        if x_lo.ndim != 2: raise ValueError(f'evaluate_parallel takes a subpaving of shape (N,d), got {x_lo.shape}.')
+        boxes = x_lo.shape[0]
+    else:
+        if x_lo.ndim != 1: raise ValueError(f'evaluate_parallel takes a box of shape (d,) with n, got {x_lo.shape}.')
+        edges, n = grid_edges(x_lo[None,:], x_hi[None,:], n)
+        boxes = int(numpy.prod(n))
+    bounds = numpy.linspace(0, boxes, min(workers*SHARDS_PER_WORKER, boxes)+1).astype(int) if boxes > 0 else numpy.zeros(1, dtype=int)
+    shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+    if workers == 1 and executor is None: # no pool
+        if n is None: parts = [evaluate_rows(f, x_lo, x_hi, a, b, chunk) for a,b in shards]
+        else: parts = [evaluate_grid(f, edges, n, a, b, chunk) for a,b in shards]
+        return merged(parts, boxes, workers, len(shards), t0, report)
+    del x, x_lo, x_hi # no view of a shared block is kept here
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+    copy = None
+    try:
+        if n is None:
+            if shared is None: shared = copy = SharedInterval(x_) # copied once, never pickled
+            futures = [pool.submit(evaluate_shared, f, shared.name, shared.shape, shared.dtype.str, a, b, chunk) for a,b in shards]
+        else: futures = [pool.submit(evaluate_grid, f, edges, n, a, b, chunk) for a,b in shards]
+        parts = [future.result() for future in futures]
+    finally:
+        if copy is not None: copy.close()
+        if executor is None: pool.shutdown()
+    return merged(parts, boxes, workers, len(shards), t0, report)
+
+def evaluate_rows(f:Callable, x_lo:ndarray, x_hi:ndarray, first:int, last:int, chunk:int):
+    """
+    The hull of f on the boxes from `first` to `last` of the subpaving (x_lo,x_hi), `chunk` boxes at a time.
+    """
+    h_lo, h_hi = None, None
+    for a in range(first, last, chunk):
+        b = min(a+chunk, last)
+        h_lo, h_hi = fold(h_lo, h_hi, f(Interval(lo=x_lo[a:b], hi=x_hi[a:b])))
+    return h_lo, h_hi
+
+def evaluate_grid(f:Callable, edges:list, n:tuple, first:int, last:int, chunk:int):
+    """
+    The hull of f on the subboxes from `first` to `last` of the grid with the given edges, see `subintervalise_chunks`.
+    """
+    h_lo, h_hi = None, None
+    for sub in subintervalise_chunks(edges, n, chunk, first, last): h_lo, h_hi = fold(h_lo, h_hi, f(sub))
+    return h_lo, h_hi
+
+def evaluate_shared(f:Callable, name:str, shape:tuple, dtype:str, first:int, last:int, chunk:int):
+    """
+    `evaluate_rows` on the subpaving in the shared memory block `name`, run by a worker.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buffer = numpy.ndarray((2,)+tuple(shape), dtype=numpy.dtype(dtype), buffer=shm.buf)
+        out = evaluate_rows(f, buffer[0], buffer[1], first, last, chunk)
+        del buffer # the views must be released before the block is closed
+        return out
+    finally: shm.close()
+
+def fold(h_lo:Optional[ndarray], h_hi:Optional[ndarray], y:Interval):
+    c_lo, c_hi = numpy.fmin.reduce(lo(y), axis=0), numpy.fmax.reduce(hi(y), axis=0)
+    if h_lo is None: return c_lo, c_hi
+    return numpy.fmin(h_lo, c_lo), numpy.fmax(h_hi, c_hi)
+
+def merged(parts:list, boxes:int, workers:int, shards:int, t0:float, report:bool):
+    parts = [p for p in parts if p[0] is not None]
+    if not parts: raise ValueError('cannot evaluate a function on an empty subpaving.')
+    h_lo, h_hi = parts[0]
+    for p_lo, p_hi in parts[1:]: h_lo, h_hi = numpy.fmin(h_lo, p_lo), numpy.fmax(h_hi, p_hi)
+    out = Interval(lo=h_lo, hi=h_hi)
+    if not report: return out
+    return out, dict(boxes=boxes, workers=workers, shards=shards, seconds=time.perf_counter()-t0)
@@ -7,10 +7,12 @@ from intervals.methods import intervalise
 LEFT_BOUND = -1_000
 RIGHT_BOUND= 1_000
 
-def uniform_endpoints(n:int=2, left_bound:float=None, right_bound:float=None, kind:type=float, shape:tuple=None): # when N=2 generates two intervals
+def uniform_endpoints(n:int=2, left_bound:float=None, right_bound:float=None, kind:type=float, shape:tuple=None, dtype=None): # when N=2 generates two intervals
     '''
     Draws endpoints from a uniform distribution.
     It was created as an interval random generator.
+
+    The endpoints are stored with the floating type `dtype`, e.g. numpy.float32. Default is float64.
     '''
     if left_bound is None: left_bound=LEFT_BOUND
     if right_bound is None: right_bound=RIGHT_BOUND
@@ -19,8 +21,8 @@ def uniform_endpoints(n:int=2, left_bound:float=None, right_bound:float=None, ki
             if kind == float: improper = left_bound + rand(2,) * (right_bound-left_bound)
             elif kind == int: improper = randint(left_bound,high=right_bound,size=(2,))
             else: return NotImplemented
-            if improper[0] <= improper[1]: return Interval(lo=improper[0], hi=improper[1])
-            else: return Interval(lo=improper[1], hi=improper[0])
+            if improper[0] <= improper[1]: return Interval(lo=improper[0], hi=improper[1], dtype=dtype)
+            else: return Interval(lo=improper[1], hi=improper[0], dtype=dtype)
         else:
             if kind == float: improper = left_bound + rand(n,2) * (right_bound-left_bound)
             elif kind == int: improper = randint(left_bound,high=right_bound,size=(n,2))
@@ -37,10 +39,10 @@ def uniform_endpoints(n:int=2, left_bound:float=None, right_bound:float=None, ki
     swap = improper_lo >= improper_hi
     proper_lo, proper_hi = improper_lo.copy(), improper_hi.copy()
     if numpy.sum(swap)>0: proper_lo[swap],proper_hi[swap]=proper_hi[swap],proper_lo[swap]
-    return Interval(lo=proper_lo, hi=proper_hi)
+    return Interval(lo=proper_lo, hi=proper_hi, dtype=dtype)
 
-def create_two_large_interval_matrices(shape,left_bound=0,right_bound=1):
+def create_two_large_interval_matrices(shape,left_bound=0,right_bound=1,dtype=None):
     # shape=(100000,100000)
-    x = uniform_endpoints(shape=shape,left_bound=left_bound,right_bound=right_bound)
-    y = uniform_endpoints(shape=shape,left_bound=left_bound,right_bound=right_bound)
+    x = uniform_endpoints(shape=shape,left_bound=left_bound,right_bound=right_bound,dtype=dtype)
+    y = uniform_endpoints(shape=shape,left_bound=left_bound,right_bound=right_bound,dtype=dtype)
     return x,y
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Propagation of interval arrays through a function by sampling, the vectorised successor of `complex.BRUTEFORCE`.
+
+The inputs are sampled jointly, N points per input of shape s as one ndarray of shape (N,*s), and the function is evaluated
+once per chunk of samples. The range is the minimum and maximum of the outputs along the sample axis. It is an inner
+estimate of the range: unlike the interval extension of the function, it never overestimates, but it can miss the extrema.
+
+The samples are 'uniform', a Latin hypercube 'lhs', or the quasi-random sequences 'halton', or 'sobol' if scipy is installed,
+which cover the inputs more evenly for the same number of samples.
+"""
+from __future__ import annotations
+from typing import (Union, Optional, Callable)
+
+from functools import wraps
+
+import numpy
+from numpy import ndarray
+
+from intervals.number import (Interval, lo, hi)
+
+SAMPLE_CHUNK_SIZE = 2**20 # sampled values, i.e. samples times the size of the inputs, evaluated at once
+SAMPLING_METHODS = ('uniform', 'lhs', 'halton', 'sobol')
+
+def sample_range(f:Callable, *args, n:int=1000, method:str='uniform', chunk:int=None, seed=None, **kwargs):
+    """
+    Estimate the range of f over its interval arguments from n samples.
+
+    f: A vectorised function. Each Interval argument of shape s is replaced by an ndarray of shape (k,*s), k samples,
+       the other arguments are passed as they are. f returns an array of shape (k,*t), or a tuple of them,
+       or Intervals, whose hull is taken.
+    n: The number of samples.
+    method: 'uniform', 'lhs', 'halton' or 'sobol', see `unit_samples`.
+    chunk: The number of samples per evaluation of f. Default is `SAMPLE_CHUNK_SIZE` over the total size of the Interval arguments.
+    seed: The seed of the random generator, or a numpy.random.Generator.
+
+    out: An Interval of shape t, the minimum and maximum of f over the samples, or a tuple of Intervals. NaN outputs are skipped.
+    """
+    intervals = [i for i,a in enumerate(args) if isinstance(a, Interval)]
+    shapes = [numpy.shape(lo(args[i])) for i in intervals]
+    sizes = [int(numpy.prod(s)) for s in shapes]
+    d = int(numpy.sum(sizes))
+    if chunk is None: chunk = max(SAMPLE_CHUNK_SIZE // max(d,1), 1)
+    rng = numpy.random.default_rng(seed)
+    stream = unit_samples(n, d, method=method, chunk=chunk, rng=rng)
+    hull, single = None, True
+    for u in stream:
+        argv, k, offset = list(args), len(u), 0
+        for i, shape, size in zip(intervals, shapes, sizes):
+            x_lo, x_hi = numpy.asarray(lo(args[i])), numpy.asarray(hi(args[i]))
+            dtype = x_lo.dtype if x_lo.dtype.kind == 'f' else float
+            argv[i] = x_lo + u[:,offset:offset+size].reshape((k,)+shape).astype(dtype,copy=False) * (x_hi - x_lo)
+            offset += size
+        y = f(*argv, **kwargs)
+        single = not isinstance(y, tuple)
+        y = (y,) if single else y
+        part = [(numpy.fmin.reduce(numpy.asarray(lo(o)),axis=0), numpy.fmax.reduce(numpy.asarray(hi(o)),axis=0)) for o in y]
+        if hull is None: hull = part
+        else: hull = [(numpy.fmin(h_lo,p_lo), numpy.fmax(h_hi,p_hi)) for (h_lo,h_hi),(p_lo,p_hi) in zip(hull,part)]
+        del argv, y, part # the samples of this chunk are released before the next is drawn
+    if hull is None: raise ValueError('sample_range needs at least one sample.')
+    out = tuple(Interval(lo=h_lo, hi=h_hi) for h_lo,h_hi in hull)
+    return out[0] if single else out
+
+def BRUTEFORCE(N:int=1000, method:str='uniform', chunk:int=None, seed=None): # DECORATOR for sampling propagation of intervals
+    """
+    Decorate a vectorised function so that called on Intervals it returns the estimate of its range by `sample_range`.
+
+    @BRUTEFORCE(N=10_000, method='lhs')
+    def f(x, y): return x[:,0]*y - x[:,1]
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*argv, **kwargs): return sample_range(fn, *argv, n=N, method=method, chunk=chunk, seed=seed, **kwargs)
+        return wrapper
+    return decorator
+
+def samples(x_:Interval, n:int, method:str='uniform', seed=None) -> ndarray:
+    """
+    n samples of the Interval x, an ndarray of shape (n,*x.shape).
+    """
+    x_lo, x_hi = numpy.asarray(lo(x_)), numpy.asarray(hi(x_))
+    u = next(unit_samples(n, x_lo.size, method=method, chunk=max(n,1), rng=numpy.random.default_rng(seed)))
+    return x_lo + u.reshape((n,)+x_lo.shape) * (x_hi - x_lo)
+
+def unit_samples(n:int, d:int, method:str='uniform', chunk:int=None, rng:numpy.random.Generator=None):
+    """
+    Generate n samples of the unit hypercube of dimension d, in chunks of (at most chunk, d) arrays.
+
+    'uniform': independent uniform samples.
+    'lhs': a Latin hypercube, i.e. each of the n strata of width 1/n of each dimension holds one sample.
+           Its design is drawn whole, an integer per sampled value.
+    'halton': the Halton sequence, one prime base per dimension, randomised by a shift modulo 1. Best in a few dimensions.
+    'sobol': the scrambled Sobol sequence of scipy.stats.qmc, best for n a power of two.
+    """
+    if rng is None: rng = numpy.random.default_rng()
+    if chunk is None: chunk = n
+    if method not in SAMPLING_METHODS: raise ValueError(f"Unknown sampling method '{method}', choose among {', '.join(SAMPLING_METHODS)}.")
+    if method == 'lhs': strata = rng.permuted(numpy.broadcast_to(numpy.arange(n), (d,n)), axis=1).T
+    if method == 'halton': shift = rng.random(d)
+    if method == 'sobol':
+        try: from scipy.stats import qmc
+        except ImportError: raise ImportError("The method 'sobol' needs scipy, use 'halton' or 'lhs' instead.") from None
+        sobol = qmc.Sobol(d=d, scramble=True, seed=rng)
+    for a in range(0, n, chunk):
+        b = min(a+chunk, n)
+        if method == 'uniform': yield rng.random((b-a,d))
+        elif method == 'lhs': yield (strata[a:b] + rng.random((b-a,d))) / n
+        elif method == 'halton': yield (halton(a, b, d) + shift) % 1.
+        else: yield sobol.random(b-a)
+
+def halton(start:int, stop:int, d:int) -> ndarray:
+    """
+    The points from `start` to `stop` of the Halton sequence in dimension d, an array of shape (stop-start,d).
+    """
+    out = numpy.zeros((stop-start,d))
+    index = numpy.arange(start, stop)
+    for j, base in enumerate(primes(d)):
+        i, f = index.copy(), 1.
+        while numpy.any(i > 0): # radical inverse, one digit of i in the base at a time
+            f /= base
+            out[:,j] += f * (i % base)
+            i //= base
+    return out
+
+def primes(d:int) -> list:
+    """
+    The first d primes.
+    """
+    out, k = [], 2
+    while len(out) < d:
+        if all(k % p for p in out if p*p <= k): out.append(k)
+        k += 1
+    return out
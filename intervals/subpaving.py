@@ -0,0 +1,246 @@
+"""
+A persistent spatial index over a subpaving, i.e. an array of n boxes of dimension d.
+
+The index is a packed R-tree: the boxes are sorted along a Morton (Z-order) curve through their midpoints,
+grouped into leaves of LEAF_SIZE consecutive boxes, and each level above holds the bounding boxes of FANOUT
+consecutive nodes of the level below. The tree is built once in O(n log n), then batches of queries descend
+it level by level with array operations, so each query only visits the nodes whose bounding box it meets.
+
+Bisecting a box keeps the tree valid without rebuilding it: both halves lie in the parent box, hence in the
+bounding box of its leaf. The second halves are appended to the leaf of their parent and the tree is rebuilt
+only when the appended boxes outnumber the indexed ones.
+"""
+from __future__ import annotations
+from typing import (Union, Optional)
+
+import numpy
+from numpy import ndarray
+
+from intervals.number import Interval
+from intervals.methods import (intervalise, ranges)
+
+LEAF_SIZE = 8 # boxes per leaf
+FANOUT = 8 # nodes per node of the level above
+QUERY_BLOCK_SIZE = 2**12 # queries that descend the tree together
+
+class Subpaving(object):
+    """
+    Spatial index over the boxes of an interval array of shape (n,d), or (n,) for d=1.
+
+    sp = Subpaving(x)
+    sp.query_intersect(y)   # which boxes of y intersect the subpaving
+    sp.query_contain(y)     # which boxes of y are contained in a box of the subpaving
+    sp.query_point(p)       # the box containing each point of p
+    sp.bisect([0,3])        # split the boxes 0 and 3 in place, returns the indices of the new halves
+    """
+    def __init__(self, x:Interval, leaf_size:int=None, fanout:int=None):
+        if leaf_size is None: leaf_size = LEAF_SIZE
+        if fanout is None: fanout = FANOUT
+        x = intervalise(x)
+        lo, hi = numpy.asarray(x.lo), numpy.asarray(x.hi)
+        if lo.ndim < 2: lo, hi = lo.reshape(-1,1), hi.reshape(-1,1) # boxes of dimension 1
+        if lo.ndim > 2: raise ValueError(f'the boxes of a subpaving must be given as an array of shape (n,d), got {lo.shape}.')
+        if not numpy.issubdtype(lo.dtype, numpy.floating): lo, hi = lo.astype(float), hi.astype(float) # bisect needs midpoints
+        self.__leaf_size, self.__fanout = int(leaf_size), int(fanout)
+        self.__lo, self.__hi = numpy.array(lo), numpy.array(hi) # own copies, bisect writes in place
+        self.__n = lo.shape[0]
+        self.__build()
+
+    def __len__(self): return self.__n
+    def __repr__(self): return f'Subpaving({self.__n} boxes of dimension {self.__lo.shape[1]}, {len(self.__levels)} levels)'
+
+    @property
+    def boxes(self) -> Interval: return Interval(self.__lo[:self.__n], self.__hi[:self.__n])
+    @property
+    def lo(self) -> ndarray: return self.__lo[:self.__n]
+    @property
+    def hi(self) -> ndarray: return self.__hi[:self.__n]
+    @property
+    def shape(self) -> tuple: return (self.__n, self.__lo.shape[1])
+
+    def rebuild(self) -> None:
+        """
+        Sort the boxes again and recompute the bounding boxes of the tree, tightening them after many bisections.
+        """
+        self.__build()
+
+    def __build(self):
+        n, L, F = self.__n, self.__leaf_size, self.__fanout
+        lo, hi = self.__lo[:n], self.__hi[:n]
+        self.__order = morton_order(lo, hi)
+        self.__indexed = n
+        self.__leaf_of = numpy.empty(self.__lo.shape[0], dtype=numpy.intp)
+        self.__leaf_of[self.__order] = numpy.arange(n) // L
+        self.__levels = []
+        if n == 0: return self.__pending()
+        starts = numpy.arange(0, n, L)
+        # fmin and fmax skip the empty (NaN) boxes, which then never reach a query
+        node_lo, node_hi = numpy.fmin.reduceat(lo[self.__order].T, starts, axis=1), numpy.fmax.reduceat(hi[self.__order].T, starts, axis=1)
+        self.__levels.append((node_lo, node_hi))
+        while node_lo.shape[1] > F:
+            starts = numpy.arange(0, node_lo.shape[1], F)
+            node_lo, node_hi = numpy.fmin.reduceat(node_lo, starts, axis=1), numpy.fmax.reduceat(node_hi, starts, axis=1)
+            self.__levels.append((node_lo, node_hi))
+        self.__pending()
+
+    def __pending(self):
+        # CSR of the appended boxes by leaf
+        leaves = self.__leaf_of[self.__indexed:self.__n]
+        self.__pending_order = self.__indexed + numpy.argsort(leaves, kind='stable')
+        n_leaves = self.__levels[0][0].shape[1] if self.__levels else 0
+        self.__pending_start = numpy.searchsorted(leaves[self.__pending_order-self.__indexed], numpy.arange(n_leaves+1))
+        self.__dirty = False
+
+    def __candidates(self, q_lo:ndarray, q_hi:ndarray, contain:bool):
+        """
+        Pairs (query, box) whose box may intersect (or contain) the query box, from a descent of the tree.
+        The arrays of bounds are stored by axis, of shape (d,·).
+        """
+        F, L = self.__fanout, self.__leaf_size
+        top = len(self.__levels) - 1
+        m = q_lo.shape[1]
+        n_top = self.__levels[top][0].shape[1]
+        j, node = numpy.repeat(numpy.arange(m), n_top), numpy.tile(numpy.arange(n_top), m)
+        for level in range(top, -1, -1):
+            node_lo, node_hi = self.__levels[level]
+            keep = overlap(node_lo, node_hi, node, q_lo, q_hi, j, contain)
+            j, node = j[keep], node[keep]
+            if level == 0: break
+            n_below = self.__levels[level-1][0].shape[1]
+            r, node = ranges(node*F, numpy.minimum(node*F+F, n_below))
+            j = j[r]
+        r, k = ranges(node*L, numpy.minimum(node*L+L, self.__indexed))
+        s, t = ranges(self.__pending_start[node], self.__pending_start[node+1])
+        return numpy.concatenate((j[r], j[s])), numpy.concatenate((self.__order[k], self.__pending_order[t]))
+
+    def __query(self, y:Union[Interval,ndarray], contain:bool, block:int=None):
+        if block is None: block = QUERY_BLOCK_SIZE
+        if isinstance(y, Interval): y_lo, y_hi = numpy.asarray(y.lo), numpy.asarray(y.hi)
+        else: y_lo = y_hi = numpy.asarray(y) # points
+        d = self.__lo.shape[1]
+        if y_lo.ndim < 2: y_lo, y_hi = y_lo.reshape(-1,d), y_hi.reshape(-1,d)
+        if y_lo.shape[1] != d: raise ValueError(f'queries of dimension {y_lo.shape[1]} on a subpaving of dimension {d}.')
+        if self.__dirty: self.__pending()
+        J, I = [], []
+        if self.__n > 0:
+            y_order = morton_order(y_lo, y_hi) # neighbouring queries descend the same nodes
+            for first in range(0, len(y_lo), block):
+                q = y_order[first:first+block]
+                q_lo, q_hi = y_lo[q].T, y_hi[q].T
+                j, i = self.__candidates(q_lo, q_hi, contain)
+                hit = overlap(self.__lo.T, self.__hi.T, i, q_lo, q_hi, j, contain)
+                J.append(q[j[hit]]); I.append(i[hit])
+        if not J: return numpy.empty(0, dtype=numpy.intp), numpy.empty(0, dtype=numpy.intp), len(y_lo)
+        j, i = numpy.concatenate(J), numpy.concatenate(I)
+        o = numpy.lexsort((i, j))
+        return j[o], i[o], len(y_lo)
+
+    def query_intersect(self, y:Interval, pairs:bool=False, block:int=None):
+        """
+        Which boxes of y, an interval array of shape (m,d), intersect a box of the subpaving.
+
+        If pairs=False returns a boolean array of shape (m,).
+        If pairs=True returns the index arrays (j, i), sorted by j then i, such that y[j] intersects box i, as `intersect_vector`.
+        """
+        j, i, m = self.__query(y, False, block)
+        if pairs: return j, i
+        hits = numpy.zeros(m, dtype=bool)
+        hits[j] = True
+        return hits
+
+    def query_contain(self, y:Interval, pairs:bool=False, block:int=None):
+        """
+        Which boxes of y, an interval array of shape (m,d), are contained in a box of the subpaving.
+
+        If pairs=False returns a boolean array of shape (m,).
+        If pairs=True returns the index arrays (j, i), sorted by j then i, such that y[j] is contained in box i.
+        """
+        j, i, m = self.__query(y, True, block)
+        if pairs: return j, i
+        hits = numpy.zeros(m, dtype=bool)
+        hits[j] = True
+        return hits
+
+    def query_point(self, p:ndarray, block:int=None) -> ndarray:
+        """
+        The index of the box containing each point of p, an array of shape (m,d), or -1 if no box does.
+
+        Where boxes share a face the point is given to the box with the smallest index.
+        """
+        j, i, m = self.__query(p, True, block)
+        first = numpy.ones(len(j), dtype=bool)
+        first[1:] = j[1:] != j[:-1]
+        out = numpy.full(m, -1, dtype=numpy.intp)
+        out[j[first]] = i[first]
+        return out
+
+    def bisect(self, index:Union[int,ndarray], axis:Optional[Union[int,ndarray]]=None) -> ndarray:
+        """
+        Bisect the boxes with the given indices along `axis`, by default the widest axis of each box.
+
+        Each box keeps its index for its lower half, while the upper halves are appended to the subpaving.
+        Returns the indices of the upper halves.
+        """
+        index = numpy.atleast_1d(numpy.asarray(index, dtype=numpy.intp))
+        if numpy.any((index < 0) | (index >= self.__n)): raise IndexError(f'box index out of range for a subpaving of {self.__n} boxes.')
+        if len(numpy.unique(index)) < len(index): raise ValueError('cannot bisect the same box twice in one call.')
+        lo, hi = self.__lo[index], self.__hi[index]
+        if axis is None: axis = numpy.argmax(hi - lo, axis=1)
+        axis = numpy.broadcast_to(numpy.asarray(axis, dtype=numpy.intp), index.shape)
+        k = numpy.arange(len(index))
+        mid = (lo[k,axis] + hi[k,axis]) / 2
+        new_lo, new_hi = lo, hi # fancy indexing copied them
+        new_lo[k,axis] = mid
+        self.__hi[index, axis] = mid
+        new = self.__append(new_lo, new_hi, self.__leaf_of[index])
+        if self.__n - self.__indexed > self.__indexed: self.__build()
+        return new
+
+    def __append(self, lo:ndarray, hi:ndarray, leaf:ndarray) -> ndarray:
+        n, m = self.__n, len(lo)
+        capacity = self.__lo.shape[0]
+        if n + m > capacity: # grow geometrically
+            capacity = max(2*capacity, n+m)
+            for name in ('lo', 'hi', 'leaf_of'):
+                old = getattr(self, f'_Subpaving__{name}')
+                grown = numpy.empty((capacity,)+old.shape[1:], dtype=old.dtype)
+                grown[:n] = old[:n]
+                setattr(self, f'_Subpaving__{name}', grown)
+        self.__lo[n:n+m], self.__hi[n:n+m], self.__leaf_of[n:n+m] = lo, hi, leaf
+        self.__n = n + m
+        self.__dirty = True
+        return numpy.arange(n, n+m)
+
+def overlap(a_lo:ndarray, a_hi:ndarray, a:ndarray, b_lo:ndarray, b_hi:ndarray, b:ndarray, contain:bool=False) -> ndarray:
+    """
+    Whether the boxes a of (a_lo,a_hi) intersect, or contain, the boxes b of (b_lo,b_hi), with the bounds of shape (d,·).
+    The pairs still in play are compressed after each axis.
+    """
+    keep = numpy.arange(len(a))
+    for axis in range(a_lo.shape[0]):
+        aa, bb = a[keep], b[keep]
+        if contain: ok = (a_lo[axis][aa] <= b_lo[axis][bb]) & (b_hi[axis][bb] <= a_hi[axis][aa])
+        else: ok = (a_lo[axis][aa] <= b_hi[axis][bb]) & (b_lo[axis][bb] <= a_hi[axis][aa])
+        keep = keep[ok]
+    out = numpy.zeros(len(a), dtype=bool)
+    out[keep] = True
+    return out
+
+def morton_order(lo:ndarray, hi:ndarray, bits:int=None) -> ndarray:
+    """
+    Permutation sorting the boxes along a Z-order curve through their midpoints.
+    """
+    n, d = lo.shape
+    with numpy.errstate(invalid='ignore'): c = (lo + hi) / 2
+    c = numpy.where(numpy.isfinite(c), c, numpy.nan)
+    if d == 1: return numpy.argsort(numpy.nan_to_num(c[:,0]), kind='stable')
+    if bits is None: bits = 63 // d if d > 3 else 21 # 64-bit codes
+    c_min, c_max = numpy.nanmin(c, axis=0, initial=numpy.inf, where=~numpy.isnan(c)), numpy.nanmax(c, axis=0, initial=-numpy.inf, where=~numpy.isnan(c))
+    span = numpy.where(c_max > c_min, c_max - c_min, 1.)
+    u = numpy.nan_to_num((c - c_min) / span, nan=0., posinf=1., neginf=0.)
+    q = numpy.clip(u * (2**bits - 1), 0, 2**bits - 1).astype(numpy.uint64)
+    code = numpy.zeros(n, dtype=numpy.uint64)
+    one = numpy.uint64(1)
+    for b in range(bits-1, -1, -1):
+        for a in range(d): code = (code << one) | ((q[:,a] >> numpy.uint64(b)) & one)
+    return numpy.argsort(code, kind='stable')
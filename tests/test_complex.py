@@ -0,0 +1,136 @@
+'''
+Tests the arrays of complex intervals against the scalar ComplexInterval and against sampled points.
+'''
+import unittest
+
+import numpy
+
+from intervals.number import Interval as I
+from intervals.complex import (ComplexInterval,ComplexIntervalArray,divide_parts,IntervalArray)
+from intervals.complex import Interval as ScalarInterval
+from intervals import arithmetic
+
+def random_complex_intervals(n, w=1., positive=False):
+    lo_ = numpy.random.rand(n) + 1j*numpy.random.rand(n)
+    if not positive: lo_ = 4*lo_ - 2 - 2j
+    else: lo_ = lo_ + 0.5 + 0.5j
+    return ComplexIntervalArray(lo_, lo_ + w*(numpy.random.rand(n) + 1j*numpy.random.rand(n)))
+
+def samples(x, m=50): # m points in each rectangle, corners included
+    u, v = numpy.random.rand(2,len(x),m)
+    u[:,:2], v[:,:2] = [0,1], [0,1]
+    return (x.real.lo[:,None] + u*(x.real.hi-x.real.lo)[:,None]) + 1j*(x.imag.lo[:,None] + v*(x.imag.hi-x.imag.lo)[:,None])
+
+class TestComplexIntervalArray(unittest.TestCase):
+    def assert_encloses(self, z, points):
+        self.assertTrue(numpy.all((z.real.lo[:,None] <= points.real+1e-12) & (points.real <= z.real.hi[:,None]+1e-12)))
+        self.assertTrue(numpy.all((z.imag.lo[:,None] <= points.imag+1e-12) & (points.imag <= z.imag.hi[:,None]+1e-12)))
+    def test_against_scalar(self):
+        x, y = random_complex_intervals(200), random_complex_intervals(200,positive=True)
+        for op in ('__add__','__sub__','__mul__','__truediv__'):
+            with self.subTest(op=op):
+                z = getattr(x,op)(y) if op != '__truediv__' else ComplexIntervalArray.fromparts(*divide_parts(x.real,x.imag,y.real,y.imag,mode='naive'))
+                z_ = [getattr(a,op)(b) for a,b in zip(x.tolist(),y.tolist())]
+                self.assertTrue(numpy.allclose(z.lo,[zi.lo() for zi in z_]) & numpy.allclose(z.hi,[zi.hi() for zi in z_]))
+        self.assertTrue(numpy.allclose(x.absolute().hi,[xi.absolute().hi() for xi in x.tolist()]))
+    def test_enclosure(self):
+        x, y = random_complex_intervals(100), random_complex_intervals(100,positive=True)
+        p, q = samples(x), samples(y)
+        self.assert_encloses(x*y, p*q)
+        self.assert_encloses(x/y, p/q)
+        self.assert_encloses(x-y, p-q)
+        self.assert_encloses(2j/y, 2j/q)
+        self.assert_encloses(x.conjugate(), numpy.conjugate(p))
+        z = x.absolute()
+        self.assertTrue(numpy.all((z.lo[:,None] <= numpy.abs(p)+1e-12) & (numpy.abs(p) <= z.hi[:,None]+1e-12)))
+        c = numpy.array([1,-1,1j]) # the corners of the product are attained, as each part appears once
+        self.assertTrue(numpy.allclose((ComplexIntervalArray(-1-1j,1+1j)*c).lo,[-1-1j,-1-1j,-1-1j]))
+    def test_tight_division(self): # inside the naive division and the subinterval division of ComplexInterval
+        x, y = random_complex_intervals(20), random_complex_intervals(20,positive=True)
+        z = x/y
+        for xi, yi, zi in zip(x.tolist(), y.tolist(), z.tolist()):
+            naive = xi/yi
+            xi.set_N_subi(10)
+            for q in (naive, xi/yi):
+                self.assertTrue((q.lo().real <= zi.lo().real) & (q.lo().imag <= zi.lo().imag) & (zi.hi().real <= q.hi().real) & (zi.hi().imag <= q.hi().imag))
+        # the hull of the quotients of the corners of x by the edges of y, which hold the extrema, sampled densely
+        y = ComplexIntervalArray(numpy.random.rand(20)+0.2-1j*numpy.random.rand(20), 1.5+1j*numpy.random.rand(20)) # straddles the real axis
+        t = numpy.linspace(0,1,10001)
+        c_lo, c_hi, d_lo, d_hi = [e[:,None] for e in (y.real.lo,y.real.hi,y.imag.lo,y.imag.hi)]
+        edges = numpy.concatenate((c_lo+1j*(d_lo+t*(d_hi-d_lo)), c_hi+1j*(d_lo+t*(d_hi-d_lo)), c_lo+t*(c_hi-c_lo)+1j*d_lo, c_lo+t*(c_hi-c_lo)+1j*d_hi), axis=1)
+        q = numpy.concatenate([p[:,None]/edges for p in (x.lo, x.hi, x.real.lo+1j*x.imag.hi, x.real.hi+1j*x.imag.lo)], axis=1)
+        z = x/y
+        for part, sampled in ((z.real,q.real),(z.imag,q.imag)):
+            width = part.hi - part.lo
+            self.assertTrue(numpy.all((part.lo <= numpy.min(sampled,axis=1)+1e-12*width) & (numpy.max(sampled,axis=1) <= part.hi+1e-12*width))) # up to rounding
+            self.assertTrue(numpy.all((numpy.min(sampled,axis=1)-part.lo < 1e-4*width) & (part.hi-numpy.max(sampled,axis=1) < 1e-4*width)))
+        arithmetic.OUTWARD = True
+        try: z_ = x/y
+        finally: arithmetic.OUTWARD = False
+        self.assertTrue(numpy.all((z_.real.lo < z.real.lo) & (z.imag.hi < z_.imag.hi)))
+    def test_operands(self):
+        x = ComplexIntervalArray([1+1j,-1-2j],[2+3j,0+1j])
+        self.assertTrue(numpy.array_equal((x+1j).lo,[1+2j,-1-1j]))
+        self.assertTrue(numpy.array_equal((2-x).hi,[1-1j,3+2j]))
+        self.assertTrue(numpy.array_equal((x*I([1.,-1],[2.,1])).hi,[4+6j,1+2j]))
+        self.assertTrue(numpy.array_equal((numpy.array([2.,4])*x).lo,[2+2j,-4-8j]))
+        self.assertTrue(numpy.array_equal((x+ComplexInterval(1+1j,2+2j)).lo,[2+2j,-1j]))
+        self.assertEqual((x[:,None]+x[None,:]).shape,(2,2))
+        self.assertEqual((len(x),x[1].shape),(2,()))
+        z = ComplexIntervalArray.fromparts(I([0.,1],[1.,2]))
+        self.assertTrue(numpy.array_equal(z.imag.hi,[0.,0]))
+        self.assertRaises(ZeroDivisionError, x.__truediv__, ComplexIntervalArray(-1-1j,1+1j))
+        self.assertRaises(TypeError, lambda: x + 'a')
+
+class TestIntervalArray(unittest.TestCase):
+    def test_constructors(self): # as the list-based class
+        for x in (IntervalArray([1.,3],[2.,4]), IntervalArray([[1.,3],[2.,4]]), IntervalArray([[1,2],[3,4]],axis=1),
+                  IntervalArray((ScalarInterval(1,2),ScalarInterval(3,4))), IntervalArray((1,2),(3,4)), IntervalArray(ScalarInterval(1,2),ScalarInterval(3,4))):
+            self.assertEqual((x.lo(),x.hi()),([1.,3.],[2.,4.]))
+        self.assertEqual(IntervalArray([1.,2]).hi(),[1.,2.])
+        self.assertEqual((len(IntervalArray()),len(IntervalArray([]))),(1,0))
+        self.assertRaises(ValueError, IntervalArray, [[1.,2],[3.,4],[5.,6]]) # neither [lo,hi] nor [values]
+        self.assertEqual(IntervalArray([[1.,2]]).hi(),[1.,2.])
+        self.assertRaises(TypeError, IntervalArray, ['a','b'])
+        self.assertRaises(TypeError, IntervalArray, [None])
+        self.assertRaises(ValueError, IntervalArray, [[1,2],[3,4]], axis=2)
+    def test_complex(self): # a list of ComplexIntervals, as in the former class
+        z = IntervalArray([ComplexInterval(1+1j,2+2j),ComplexInterval(-1j,1)])
+        self.assertIsInstance(z.interval, ComplexIntervalArray)
+        self.assertEqual((len(z),z.lo(),z.hi()),(2,[1+1j,-1j],[2+2j,1]))
+        self.assertEqual([str(zi) for zi in z], [str(ComplexInterval(1+1j,2+2j)),str(ComplexInterval(-1j,1))])
+        self.assertIsInstance(z[1], ComplexInterval)
+        self.assertEqual(z.slider(0.5), [1.5+1.5j,0.5-0.5j])
+        self.assertEqual((z+IntervalArray([1.,0],[2.,1])).hi(), [4+2j,2])
+        self.assertEqual((z*z).lo(), [(ComplexInterval(1+1j,2+2j)*ComplexInterval(1+1j,2+2j)).lo(),-1-2j])
+    def test_zero_copy(self):
+        x = I(numpy.zeros(1000),numpy.ones(1000))
+        a = IntervalArray(x)
+        self.assertIs(a.interval, x)
+        self.assertIs(a.interval.lo, x.lo)
+        self.assertEqual(len(a), 1000)
+        b = IntervalArray([1.,3],[2.,4])
+        self.assertIs(b.toarray(), b.interval.buffer)
+        self.assertEqual(b.toarray(order='C').tolist(),[[1.,2.],[3.,4.]])
+        self.assertTrue(numpy.shares_memory(b[0:1].interval.lo,b.interval.lo))
+    def test_methods(self):
+        a, b = IntervalArray([1.,3],[2.,4]), IntervalArray([-1.,1],[1.,2])
+        self.assertEqual([(x.lo(),x.hi()) for x in a], [(1.,2.),(3.,4.)])
+        self.assertEqual(str(a[1]), str(ScalarInterval(3.,4.)))
+        self.assertEqual(a[[1]].lo(), [3.])
+        self.assertEqual(str(a.tolist()), str([ScalarInterval(1.,2.),ScalarInterval(3.,4.)]))
+        self.assertEqual(a.slider(0.5), [1.5,3.5])
+        self.assertIsInstance(a.lo(), list)
+        self.assertEqual(a.slider([0,1]), [1.,4.])
+        for op in ('__add__','__sub__','__mul__'):
+            with self.subTest(op=op):
+                c = getattr(a,op)(b)
+                c_ = [getattr(x,op)(y) for x,y in zip(a,b)]
+                self.assertEqual((c.lo(),c.hi()),([x.lo() for x in c_],[x.hi() for x in c_]))
+        self.assertEqual((a/b[[1]]).hi(), [2.,4.])
+        self.assertEqual((a+1).lo(), [2.,4.])
+        self.assertEqual((a*ScalarInterval(-1,1)).lo(), [-2.,-4.])
+        self.assertEqual(len(repr(IntervalArray(list(range(20)))).splitlines()), 11)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ import unittest
 
 import logging
 import sys
+import operator
+from fractions import Fraction
 
 import numpy
 from numpy import ndarray
@@ -12,6 +14,10 @@ from numpy import ndarray
 from intervals.number import Interval as I
 from intervals.methods import (intervalise,lo,hi)
 from intervals.random import uniform_endpoints
+from intervals.arithmetic import (multiply,matmul)
+from intervals import arithmetic
+from intervals.number import (kind,OTHER,INTEGER,NUMBER,ARRAY,INTERVAL)
+from intervals.number import ScalarInterval
 
 
 class TestIntervalGenerator(unittest.TestCase):
@@ -271,6 +277,58 @@ class TestArithmetic(unittest.TestCase):
             self.assertAlmostEqual(hi(z3), hi(yi_mul_ai), places=7)
             self.assertAlmostEqual(lo(z4), lo(yi_div_ai), places=7)
             self.assertAlmostEqual(hi(z4), hi(yi_div_ai), places=7)
+    def test_multiplication_engines_agree(self):
+        """
+        Test that the minmax and mask engines return the same endpoints in all four shape cases.
+        """
+        a = uniform_endpoints(n=1,left_bound=-1,right_bound=1)
+        b = uniform_endpoints(n=1,left_bound=-1,right_bound=1)
+        x = uniform_endpoints(shape=(10,3,3),left_bound=-1,right_bound=1)
+        y = uniform_endpoints(shape=(10,3,3),left_bound=-1,right_bound=1)
+        for s,o in [(a,b),(x,y),(a,y),(x,b)]:
+            l1,h1 = multiply(s,o,engine='minmax')
+            l2,h2 = multiply(s,o,engine='mask')
+            self.assertTrue(numpy.all(l1==l2))
+            self.assertTrue(numpy.all(h1==h2))
+    def test_multiplication_with_infinite_endpoints(self):
+        x = I(0,1)*I(-numpy.inf,numpy.inf)
+        self.assertEqual(lo(x),-numpy.inf)
+        self.assertEqual(hi(x),numpy.inf)
+    def test_four_operations_between_broadcastable_arrays(self):
+        """
+        Test element-wise operations between intervals of shape (n,1) and (1,m), with both multiplication engines.
+        """
+        x = uniform_endpoints(shape=(7,1))
+        y = uniform_endpoints(shape=(1,5),left_bound=0.001)
+        for engine in ('minmax','mask'):
+            with self.subTest(engine=engine):
+                z_mul = I(*multiply(x,y,engine=engine))
+                self.assertEqual(z_mul.shape,(7,5))
+                for i in range(7):
+                    for j in range(5):
+                        xi_mul_yj = x[i,0]*y[0,j]
+                        self.assertAlmostEqual(lo(z_mul[i,j]), lo(xi_mul_yj), places=7)
+                        self.assertAlmostEqual(hi(z_mul[i,j]), hi(xi_mul_yj), places=7)
+        for z in [x+y, x-y, x/y, y/x.lo, x.lo/y, x.lo-y]:
+            self.assertEqual(z.shape,(7,5))
+        z = x/y
+        for i in range(7):
+            for j in range(5):
+                xi_div_yj = x[i,0]/y[0,j]
+                self.assertAlmostEqual(lo(z[i,j]), lo(xi_div_yj), places=7)
+                self.assertAlmostEqual(hi(z[i,j]), hi(xi_div_yj), places=7)
+    def test_operations_between_interval_and_broadcastable_ndarray(self):
+        """
+        Test multiplication and division between an interval of shape (n,1) and an ndarray of shape (m,).
+        """
+        x = uniform_endpoints(shape=(6,1))
+        a = -10 + numpy.random.rand(4) * 20
+        for z,zi in [(x*a, lambda i,j: x[i,0]*float(a[j])), (x/a, lambda i,j: x[i,0]/float(a[j])), (a*x, lambda i,j: float(a[j])*x[i,0])]:
+            self.assertEqual(z.shape,(6,4))
+            for i in range(6):
+                for j in range(4):
+                    self.assertAlmostEqual(lo(z[i,j]), lo(zi(i,j)), places=7)
+                    self.assertAlmostEqual(hi(z[i,j]), hi(zi(i,j)), places=7)
     def parsing_degenerate_intervals(self):
         a = numpy.random.rand()
         x = I(a)
@@ -278,6 +336,333 @@ class TestArithmetic(unittest.TestCase):
         self.assertEqual(hi(x), a)
 
 
+class TestInplace(unittest.TestCase):
+    def test_inplace_operators_reuse_buffers(self):
+        x = uniform_endpoints(shape=(10,3),left_bound=-1,right_bound=1)
+        y = uniform_endpoints(shape=(10,3),left_bound=0.001,right_bound=1)
+        a = -10 + numpy.random.rand() * 20
+        for op,iop in [(I.__add__,I.__iadd__),(I.__sub__,I.__isub__),(I.__mul__,I.__imul__),(I.__truediv__,I.__itruediv__)]:
+            for other in (y,a,y.lo):
+                z = I(x.lo.copy(),x.hi.copy())
+                z_lo,z_hi = z.lo,z.hi
+                expected = op(x,other)
+                z = iop(z,other)
+                self.assertIs(z.lo,z_lo)
+                self.assertIs(z.hi,z_hi)
+                self.assertTrue(numpy.allclose(z.lo,expected.lo))
+                self.assertTrue(numpy.allclose(z.hi,expected.hi))
+    def test_inplace_operators_with_self(self):
+        x = uniform_endpoints(shape=(10,),left_bound=-1,right_bound=1)
+        expected = x-x
+        x -= x
+        self.assertTrue(numpy.allclose(x.lo,expected.lo))
+        self.assertTrue(numpy.allclose(x.hi,expected.hi))
+        x = uniform_endpoints(shape=(10,),left_bound=-1,right_bound=1)
+        expected = x*x
+        x *= x
+        self.assertTrue(numpy.allclose(x.lo,expected.lo))
+        self.assertTrue(numpy.allclose(x.hi,expected.hi))
+    def test_inplace_operators_unsized(self):
+        x = I(1,2)
+        x += I(-1,1)
+        x *= 2
+        self.assertEqual(lo(x),0)
+        self.assertEqual(hi(x),6)
+    def test_degenerate_interval_does_not_share_buffer(self):
+        a = numpy.random.rand(5)
+        x = I(a,a)
+        x += I(0,1)
+        self.assertTrue(numpy.allclose(x.hi-x.lo,1))
+    def test_pos_is_a_copy(self):
+        a, b = numpy.zeros(5), numpy.ones(5)
+        x = I(a,b)
+        y = +x
+        y += 1
+        self.assertTrue(numpy.all(x.lo==0) & numpy.all(b==1))
+        x += 1 # the constructor does not copy, so in-place operators update the caller's arrays
+        self.assertTrue(numpy.all(a==1))
+        data = numpy.random.rand(5,2)
+        z = I.frombuffer(data)
+        w = +z
+        self.assertEqual(w.layout,'last')
+        self.assertFalse(numpy.shares_memory(w.val,data))
+        w *= 0
+        self.assertTrue(numpy.all(data>0))
+        s = I(1.,2.)
+        self.assertIs(+s,s)
+
+
+class TestMatmul(unittest.TestCase):
+    def matmul_by_loop(self,x,y):
+        n,k = x.shape
+        m = y.shape[1]
+        z_lo,z_hi = numpy.empty((n,m)),numpy.empty((n,m))
+        for i in range(n):
+            for j in range(m):
+                zij = I(0)
+                for h in range(k): zij = zij + x[i,h]*y[h,j]
+                z_lo[i,j],z_hi[i,j] = lo(zij),hi(zij)
+        return z_lo,z_hi
+    def test_matmul_exact(self):
+        x = uniform_endpoints(shape=(5,4),left_bound=-1,right_bound=1)
+        y = uniform_endpoints(shape=(4,3),left_bound=-1,right_bound=1)
+        z_lo,z_hi = self.matmul_by_loop(x,y)
+        for block in (None,1,3):
+            z = I(*matmul(x,y,mode='exact',block=block))
+            self.assertTrue(numpy.allclose(z.lo,z_lo))
+            self.assertTrue(numpy.allclose(z.hi,z_hi))
+        z = x @ y
+        self.assertTrue(numpy.allclose(z.lo,z_lo))
+        self.assertTrue(numpy.allclose(z.hi,z_hi))
+    def test_matmul_midrad_encloses_exact(self):
+        x = uniform_endpoints(shape=(5,4),left_bound=-1,right_bound=1)
+        y = uniform_endpoints(shape=(4,3),left_bound=-1,right_bound=1)
+        z_exact = I(*matmul(x,y,mode='exact'))
+        z_midrad = I(*matmul(x,y,mode='midrad'))
+        self.assertTrue(numpy.all(z_midrad.lo <= z_exact.lo + 1e-12))
+        self.assertTrue(numpy.all(z_midrad.hi >= z_exact.hi - 1e-12))
+        self.assertTrue(numpy.all(z_midrad.hi-z_midrad.lo <= 1.5*(z_exact.hi-z_exact.lo) + 1e-12))
+    def test_matmul_between_interval_and_ndarray(self):
+        x = uniform_endpoints(shape=(5,4),left_bound=-1,right_bound=1)
+        a = numpy.random.rand(4,3)*2-1
+        b = numpy.random.rand(2,5)*2-1
+        z_lo,z_hi = self.matmul_by_loop(x,I(a))
+        z = x @ a
+        self.assertTrue(numpy.allclose(z.lo,z_lo))
+        self.assertTrue(numpy.allclose(z.hi,z_hi))
+        z_lo,z_hi = self.matmul_by_loop(I(b),x)
+        z = b @ x
+        self.assertTrue(numpy.allclose(z.lo,z_lo))
+        self.assertTrue(numpy.allclose(z.hi,z_hi))
+        z = I(*matmul(b,x,mode='midrad'))
+        self.assertTrue(numpy.allclose(z.lo,z_lo))
+        self.assertTrue(numpy.allclose(z.hi,z_hi))
+    def test_matmul_vectors(self):
+        x = uniform_endpoints(shape=(5,4),left_bound=-1,right_bound=1)
+        v = uniform_endpoints(shape=(4,),left_bound=-1,right_bound=1)
+        self.assertEqual((x @ v).shape,(5,))
+        self.assertEqual((v @ v).shape,())
+        with self.assertRaises(ValueError): x @ x
+
+class TestDispatch(unittest.TestCase):
+    def test_kinds(self):
+        class J(I): pass
+        for x,k in [(1,INTEGER),(numpy.uint8(1),INTEGER),(1.5,NUMBER),(numpy.float32(1),NUMBER),(1j,NUMBER),
+                    (numpy.ones(3),ARRAY),(I(1,2),INTERVAL),(J(1,2),INTERVAL),(True,OTHER),([1,2],OTHER),('1',OTHER)]:
+            with self.subTest(x=x): self.assertEqual(kind(x),k)
+    def test_numpy_scalars(self):
+        x = I(1,2)
+        for y in [numpy.int8(3),numpy.int64(3),numpy.float32(3),numpy.float64(3)]:
+            with self.subTest(y=type(y)):
+                self.assertTrue(numpy.allclose((x*y).val,[3,6]))
+                self.assertTrue(numpy.allclose((y-x).val,[1,2]))
+        self.assertTrue(numpy.allclose((x**numpy.int64(2)).val,[1,4]))
+    def test_subclass(self):
+        class J(I): pass
+        z = I(1,2) + J(-1,1)
+        self.assertTrue(numpy.allclose(z.val,[0,3]))
+    def test_unsupported(self):
+        x = I(1,2)
+        with self.assertRaises(TypeError): x + True
+        with self.assertRaises(TypeError): x - 'a'
+        with self.assertRaises(TypeError): x / [1,2]
+        with self.assertRaises(TypeError): x ** 'a'
+
+class TestScalarInterval(unittest.TestCase):
+    def test_constructor(self):
+        x = I(1,2)
+        self.assertIsInstance(x,ScalarInterval)
+        self.assertIsInstance(x,I)
+        self.assertIsInstance(x.lo,float)
+        self.assertEqual((x.shape,x.scalar,x.unsized,len(x)),((),True,True,0))
+        self.assertTrue(numpy.array_equal(x.val,[1,2]))
+        self.assertFalse(hasattr(x,'__dict__'))
+        self.assertNotIsInstance(I(numpy.float64(1)),ScalarInterval)
+        self.assertNotIsInstance(I(numpy.asarray(1.)),ScalarInterval)
+        for kwargs in (dict(layout=None),dict(dtype=None),dict(layout=None,dtype=None)): # the default keywords, e.g. forwarded by a caller
+            y = I(1,2,**kwargs)
+            self.assertIs(type(y),ScalarInterval)
+            self.assertEqual((y.lo,y.hi),(1.,2.))
+        self.assertEqual(I(1,2,dtype=numpy.float32).dtype,numpy.float32)
+        self.assertEqual(I(1,2,layout='first').buffer.tolist(),[1.,2.])
+    def test_arithmetic_agrees_with_arrays(self):
+        x = uniform_endpoints(shape=(200,),left_bound=-5,right_bound=5)
+        y = uniform_endpoints(shape=(200,),left_bound=-5,right_bound=5)
+        y = I(numpy.where(y.lo>0,y.lo,y.lo-5),numpy.where(y.lo>0,y.hi,-y.hi*0-0.5)) # no zero in y
+        for op in [operator.add,operator.sub,operator.mul,operator.truediv,lambda a,b: 1.5-a,lambda a,b: -2/b,lambda a,b: a**2,lambda a,b: b**3]:
+            z = op(x,y)
+            for i in range(200):
+                zi = op(I(float(x.lo[i]),float(x.hi[i])),I(float(y.lo[i]),float(y.hi[i])))
+                self.assertIsInstance(zi,ScalarInterval)
+                self.assertTrue(numpy.allclose([zi.lo,zi.hi],[z.lo[i],z.hi[i]],rtol=1e-15,atol=0)) # ** may differ by one ulp from numpy
+    def test_mixed_operands(self):
+        x = uniform_endpoints(shape=(4,3),left_bound=-1,right_bound=1)
+        s = I(-2,1)
+        a = numpy.random.rand(4,3)
+        for z,w in [(s*x, I(numpy.full((4,3),-2.),numpy.ones((4,3)))*x),(x-s, x-I(numpy.full((4,3),-2.),numpy.ones((4,3)))),(s+a, a+s)]:
+            self.assertNotIsInstance(z,ScalarInterval)
+            self.assertEqual(z.shape,(4,3))
+            self.assertTrue(numpy.allclose(z.lo,w.lo))
+            self.assertTrue(numpy.allclose(z.hi,w.hi))
+    def test_inplace_and_iteration(self):
+        x = I(1,2)
+        y = x
+        x += 1
+        self.assertEqual((x.lo,x.hi,y.lo,y.hi),(2,3,1,2))
+        v = uniform_endpoints(n=5)
+        for vi,l in zip(v,v.lo):
+            self.assertIsInstance(vi,ScalarInterval)
+            self.assertEqual(vi.lo,l)
+        with self.assertRaises(ZeroDivisionError): x / I(-1,1)
+
+class TestLayout(unittest.TestCase):
+    def test_frombuffer_is_zero_copy(self):
+        data = numpy.random.rand(6,4,2)
+        x = I.frombuffer(data)
+        self.assertIs(x.val,data)
+        self.assertEqual(x.shape,(4,6))
+        self.assertTrue(numpy.shares_memory(x.lo,data))
+        y = intervalise(data)
+        self.assertIs(y.val,data)
+        z = I.frombuffer(data.T,layout='first')
+        self.assertTrue(numpy.shares_memory(z.val,data))
+    def test_layouts_agree(self):
+        x = uniform_endpoints(shape=(5,3),left_bound=-1,right_bound=1)
+        for layout in ('first','last'):
+            with self.subTest(layout=layout):
+                y = I(x.lo,x.hi,layout=layout)
+                self.assertEqual(y.layout,layout)
+                self.assertEqual(y.shape,x.shape)
+                self.assertTrue(numpy.array_equal(y.val,x.val))
+                self.assertTrue(numpy.shares_memory(y.lo,y.buffer))
+                self.assertTrue(numpy.shares_memory(y.hi,y.buffer))
+                self.assertTrue(numpy.shares_memory(y.val,y.buffer))
+                y *= x
+                z = x*x
+                self.assertTrue(numpy.array_equal(y.val,z.val))
+        self.assertTrue(I(x.lo,x.hi,layout='first').lo.flags['C_CONTIGUOUS'])
+    def test_bad_layout(self):
+        with self.assertRaises(ValueError): I(numpy.zeros(3),layout='middle')
+        with self.assertRaises(ValueError): I.frombuffer(numpy.zeros((3,4)))
+        with self.assertRaises(ValueError): I.frombuffer(numpy.zeros((3,4)),layout='first')
+
+class TestDtype(unittest.TestCase):
+    def test_float32_is_kept(self):
+        x = uniform_endpoints(shape=(6,5),left_bound=-1,right_bound=1,dtype=numpy.float32)
+        y = uniform_endpoints(shape=(6,5),left_bound=1,right_bound=2,dtype=numpy.float32)
+        self.assertEqual(x.dtype,numpy.float32)
+        for z in [x+y, x-y, x*y, x/y, 2.5*x, x-1, 1/y, x**2, x @ numpy.transpose(y), multiply(x,y,engine='mask')]:
+            self.assertEqual(numpy.asarray(lo(z)).dtype,numpy.float32)
+        w = x*y
+        w64 = I(x.lo.astype(float),x.hi.astype(float)) * I(y.lo.astype(float),y.hi.astype(float))
+        self.assertTrue(numpy.allclose(w.lo,w64.lo,rtol=1e-6))
+    def test_promotion(self):
+        x32 = I(numpy.zeros(3,dtype=numpy.float32),numpy.ones(3,dtype=numpy.float32))
+        x64 = I(numpy.zeros(3),numpy.ones(3))
+        self.assertEqual((x32+x64).dtype,numpy.float64)
+        self.assertEqual(I([1,2],[3,4]).dtype,numpy.float64)
+        self.assertEqual(I(numpy.zeros(3,dtype=numpy.float16)).dtype,numpy.float16)
+        self.assertEqual(I(numpy.zeros(3),dtype=numpy.float32).dtype,numpy.float32)
+        self.assertEqual(I(numpy.zeros(3,dtype=numpy.float32),numpy.ones(3)).dtype,numpy.float64)
+        self.assertEqual(intervalise(numpy.zeros((4,2),dtype=numpy.float32)).dtype,numpy.float32)
+        self.assertEqual(I(x32.lo,x32.hi,layout='first').buffer.dtype,numpy.float32)
+
+class TestOutward(unittest.TestCase):
+    def setUp(self): arithmetic.OUTWARD = True
+    def tearDown(self): arithmetic.OUTWARD = False
+    def test_one_ulp_outward(self):
+        x = uniform_endpoints(shape=(50,),left_bound=-2,right_bound=2)
+        y = uniform_endpoints(shape=(50,),left_bound=0.5,right_bound=2)
+        for op in [operator.add,operator.sub,operator.mul,operator.truediv]:
+            v = op(x,y)
+            arithmetic.OUTWARD = False
+            e = op(x,y)
+            arithmetic.OUTWARD = True
+            self.assertTrue(numpy.array_equal(v.lo,numpy.nextafter(e.lo,-numpy.inf)))
+            self.assertTrue(numpy.array_equal(v.hi,numpy.nextafter(e.hi,numpy.inf)))
+    def test_scalar_and_inplace(self):
+        z = I(0.1,0.2) + I(0.2,0.3)
+        self.assertIsInstance(z,ScalarInterval)
+        self.assertLess(z.lo,0.1+0.2)
+        self.assertGreater(z.hi,0.2+0.3)
+        self.assertIs(type(z.lo),float)
+        self.assertEqual((z.lo,z.hi),(numpy.nextafter(0.1+0.2,-numpy.inf),numpy.nextafter(0.2+0.3,numpy.inf))) # one ulp, without math.nextafter
+        x = uniform_endpoints(shape=(10,),left_bound=-1,right_bound=1)
+        y = I(x.lo.copy(),x.hi.copy())
+        y *= x
+        arithmetic.OUTWARD = False
+        e = x*x
+        self.assertTrue(numpy.all(y.lo<e.lo) & numpy.all(y.hi>e.hi))
+    def test_per_call_switch(self):
+        x = uniform_endpoints(shape=(10,),left_bound=-1,right_bound=1)
+        l,h = arithmetic.add(x,x,outward=False)
+        self.assertTrue(numpy.array_equal(l,x.lo+x.lo))
+        arithmetic.OUTWARD = False
+        l,h = arithmetic.multiply(x,x,outward=True)
+        self.assertTrue(numpy.all(l<(x*x).lo))
+    def test_matmul_encloses_exact_sum(self):
+        a = uniform_endpoints(shape=(3,40),left_bound=-1,right_bound=1)
+        b = numpy.random.rand(40,2) - 0.5
+        z = a @ b
+        for i in range(3):
+            for j in range(2):
+                products = [(Fraction(float(a.lo[i,k]))*Fraction(float(b[k,j])),Fraction(float(a.hi[i,k]))*Fraction(float(b[k,j]))) for k in range(40)]
+                self.assertLessEqual(Fraction(float(z.lo[i,j])),sum(min(p) for p in products))
+                self.assertGreaterEqual(Fraction(float(z.hi[i,j])),sum(max(p) for p in products))
+
+
+class TestPower(unittest.TestCase):
+    def sample(self, x, n=101): # points of each interval of x, along a new first axis
+        t = numpy.linspace(0,1,n).reshape((n,)+(1,)*len(x.shape))
+        return numpy.minimum(x.lo + t*(x.hi-x.lo), x.hi) # lo+(hi-lo) can exceed hi by one ulp
+    def test_integer(self):
+        x = I([-2.,-1,1,-3,0],[1.,2,3,-1,0])
+        self.assertEqual((x**0).val.tolist(),[[1.,1.]]*5) # also when x straddles zero
+        self.assertEqual((x**2).val.tolist(),[[0,4],[0,4],[1,9],[1,9],[0,0]])
+        self.assertEqual((x**3).val.tolist(),[[-8,1],[-1,8],[1,27],[-27,-1],[0,0]])
+        for xi in [I(-2.,1.),I(1.,3.),I(-3.,-1.)]:
+            for n in [0,1,2,3,4]: 
+                with self.subTest(x=xi,n=n): 
+                    self.assertIs(type(xi**n),ScalarInterval)
+                    self.assertTrue(numpy.allclose((xi**n).val,(I(numpy.float64(xi.lo),numpy.float64(xi.hi))**n).val))
+    def test_integer_valued_float(self): # the exponent 2.0 is the integer power, also for a base below zero
+        self.assertEqual((I(-3,2)**2.0).val.tolist(),[0.,9.])
+        self.assertIs(type(I(-3,2)**2.0),ScalarInterval)
+        x = I([-2.,-1,1,-3,0],[1.,2,3,-1,0])
+        for p in (2.0,3.0,numpy.float64(2),numpy.float32(3),0.0):
+            with self.subTest(p=p): self.assertEqual((x**p).val.tolist(),(x**int(p)).val.tolist())
+        self.assertEqual((I(-2.,-1.)**-1.0).val.tolist(),[-1.,-0.5])
+    def test_negative_integer(self):
+        x = uniform_endpoints(shape=(50,),left_bound=0.1,right_bound=3)
+        for n in [-1,-2,-3]:
+            y, y_ = x**n, self.sample(x)**n
+            self.assertTrue(numpy.all((y.lo<=y_.min(axis=0)*(1+1e-15)) & (y.hi>=y_.max(axis=0)*(1-1e-15))))
+        with self.assertRaises(ZeroDivisionError): I(-1.,1.)**-2
+    def test_real(self):
+        x = uniform_endpoints(shape=(50,),left_bound=0,right_bound=3)
+        for p in [0.5,-0.5,1.5,numpy.float32(2.5)]:
+            y, y_ = x**p, self.sample(x)**p
+            self.assertTrue(numpy.allclose(y.lo,y_.min(axis=0),rtol=1e-12) & numpy.allclose(y.hi,y_.max(axis=0),rtol=1e-12))
+        for x in (I(-4.,4.),I(-4.,-1.),I([1.,-1.],[2.,1.])): # the power of a negative base is not real
+            with self.subTest(x=x): self.assertRaises(ValueError, x.__pow__, 0.5)
+        self.assertRaises(ValueError, I(-1.,1.).__pow__, I(1.,2.))
+        self.assertEqual((I(0.,1.)**-0.5).val.tolist(),[1.,numpy.inf])
+        with self.assertRaises(ZeroDivisionError): I(0.,1.)**-1. # the integer power, as I(0.,1.)**-1
+    def test_interval_exponent(self):
+        x = uniform_endpoints(shape=(20,),left_bound=0,right_bound=3)
+        y = uniform_endpoints(shape=(20,),left_bound=-2,right_bound=2)
+        z = x**y
+        t = numpy.linspace(0,1,41)
+        x_ = numpy.minimum(x.lo + t[:,None,None]*(x.hi-x.lo), x.hi)
+        y_ = numpy.minimum(y.lo + t[None,:,None]*(y.hi-y.lo), y.hi)
+        with numpy.errstate(divide='ignore'): z_ = x_**y_
+        self.assertTrue(numpy.all((z.lo<=z_.min(axis=(0,1))) & (z.hi>=z_.max(axis=(0,1)))))
+        self.assertTrue(numpy.allclose(z.lo,z_.min(axis=(0,1))) & numpy.allclose(z.hi,z_.max(axis=(0,1)))) # endpoints are attained at the corners
+        self.assertEqual((I(0.,1.)**I(-1.,1.)).val.tolist(),[0.,numpy.inf])
+        self.assertEqual((2**I(1.,3.)).val.tolist(),[2.,8.])
+        self.assertEqual((numpy.array([2.,4.])**I(0.5,1.)).val.tolist(),[[2**0.5,2.],[2.,4.]])
+
+
 if __name__ == '__main__':
     # logging.basicConfig(stream=sys.stderr,level=logging.DEBUG)
     # unittest.TextTestRunner().run(TestIntervalArithmetic())
@@ -0,0 +1,94 @@
+'''
+Tests the branch and bound enclosures of the minimum, maximum and range of interval functions.
+'''
+import unittest
+
+import numpy
+
+from intervals.number import Interval as I
+from intervals.methods import (sin,sqrt,subintervalise)
+from intervals.optimize import (minimize,maximize,enclose_range,SortedRuns)
+
+def camel(b): # six-hump camel, min -1.0316284535 at (0.0898,-0.7126) and (-0.0898,0.7126)
+    x, y = b[:,0], b[:,1]
+    return (4-2.1*x**2+x**4/3)*x**2 + x*y + (-4+4*y**2)*y**2
+
+CAMEL_MIN = -1.0316284534898774
+BOX = I([-3.,-2],[3.,2])
+
+def sampled_range(f, x, n=400):
+    g = subintervalise(x,n)
+    y = f(I(g.lo,g.lo))
+    return numpy.min(y.lo), numpy.max(y.hi)
+
+class TestOptimize(unittest.TestCase):
+    def test_minimize_1d(self):
+        m = minimize(lambda b: b[:,0]**2 - b[:,0], I([-1.],[2.]), tol=1e-8)
+        self.assertTrue(m.lo <= -0.25 <= m.hi)
+        self.assertLess(m.hi-m.lo, 1e-6)
+    def test_minimize(self):
+        m, r = minimize(camel, BOX, report=True)
+        self.assertTrue(m.lo <= CAMEL_MIN <= m.hi)
+        self.assertLess(m.hi-m.lo, 1e-2)
+        self.assertTrue(r['converged'])
+        self.assertEqual(r['boxes'].shape, (len(r['lower']),2))
+        self.assertTrue(numpy.all(r['lower'] <= m.hi))
+        for p in ([0.0898,-0.7126],[-0.0898,0.7126]): # both minimisers are kept
+            self.assertTrue(numpy.any(numpy.all((r['boxes'].lo <= p+numpy.array([1e-3,1e-3])) & (numpy.array(p)-1e-3 <= r['boxes'].hi),axis=1)))
+    def test_maximize_and_range(self):
+        f = lambda b: sin(b[:,0])*b[:,1] + b[:,1]**2
+        x = I([-2.,-1],[3.,2])
+        lo_, hi_ = sampled_range(f, x)
+        M = maximize(f, x)
+        self.assertTrue(M.lo <= 6. <= M.hi) # at (pi/2,2)
+        R = enclose_range(f, x)
+        self.assertTrue((R.lo <= lo_) & (hi_ <= R.hi))
+        self.assertLess((-0.25-R.lo) + (R.hi-6.), 1e-2) # the min is -1/4 where y = -sin(x)/2
+        R, r = enclose_range(f, x, report=True)
+        self.assertEqual(set(r), {'minimize','maximize'})
+        self.assertTrue(numpy.all(r['maximize']['upper'] >= R.hi - 1) and numpy.all(r['maximize']['upper'] <= R.hi))
+    def test_budgets(self): # the enclosure is valid whatever the budget
+        for kwargs in (dict(max_iter=0),dict(max_iter=3),dict(max_time=0.),dict(ftol=1e-2),dict(batch=1,max_iter=50)):
+            with self.subTest(**kwargs):
+                m, r = minimize(camel, BOX, report=True, **kwargs)
+                self.assertTrue(m.lo <= CAMEL_MIN <= m.hi)
+                if 'ftol' in kwargs: self.assertLessEqual(m.hi-m.lo, 1e-2)
+                else: self.assertFalse(r['converged'])
+        m0, m1 = minimize(camel, BOX, max_iter=5), minimize(camel, BOX, max_iter=50)
+        self.assertTrue((m0.lo <= m1.lo) & (m1.hi <= m0.hi))
+    def test_batch(self): # the batch changes the path, not the enclosure
+        for batch in (1,7,4096):
+            m = minimize(camel, BOX, batch=batch, tol=1e-2)
+            self.assertTrue(m.lo <= CAMEL_MIN <= m.hi)
+            self.assertLess(m.hi-m.lo, 1e-1)
+    def test_empty(self):
+        with numpy.errstate(invalid='ignore'):
+            m = minimize(lambda b: sqrt(b[:,0]), I([-2.],[-1.]))
+            self.assertTrue(numpy.isnan(m.lo) & numpy.isnan(m.hi))
+            m = minimize(lambda b: sqrt(b[:,0]-1), I([-2.],[3.]))
+            self.assertTrue(m.lo <= 0 <= m.hi)
+        self.assertRaises(ValueError, minimize, camel, I(numpy.zeros((2,2)),numpy.ones((2,2))))
+
+class TestSortedRuns(unittest.TestCase):
+    def test_order(self):
+        q = SortedRuns()
+        keys = numpy.random.rand(5000)
+        for k in numpy.split(numpy.arange(5000),[10,100,1000,1500,4000]): q.push(keys[k], k)
+        out = []
+        while len(q) > 0:
+            k, v = q.pop(37)
+            self.assertTrue(numpy.array_equal(keys[v], k))
+            out.append(numpy.sort(k)) # a batch is sorted against the others, not within
+        out = numpy.concatenate(out)
+        self.assertTrue(numpy.array_equal(out, numpy.sort(keys)))
+    def test_limit(self):
+        q = SortedRuns()
+        q.push(numpy.array([3.,1,2,5]), numpy.arange(4))
+        k, v = q.pop(10, limit=2.5)
+        self.assertEqual(v.tolist(), [1,2])
+        k, v = q.drain()
+        self.assertEqual(sorted(v.tolist()), [0,3])
+        self.assertEqual(len(q), 0)
+
+if __name__ == '__main__':
+    unittest.main()
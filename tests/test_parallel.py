@@ -0,0 +1,70 @@
+'''
+Tests the parallel evaluation of interval functions over subpavings against the sequential one.
+'''
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from intervals.number import Interval as I
+from intervals.methods import (subintervalise,evaluate_subpaving)
+from intervals.parallel import (evaluate_parallel,SharedInterval)
+
+def f(b): return b[:,0]*b[:,1] - b[:,2]*b[:,0] # picklable by the pool
+
+def g(b): return b[:,:2] # vector valued
+
+X = I([-1.,0,1],[2.,1,3])
+
+class TestParallel(unittest.TestCase):
+    def test_grid(self):
+        h = evaluate_subpaving(f,X,(6,5,7))
+        for workers in (1,2):
+            with self.subTest(workers=workers):
+                p, r = evaluate_parallel(f,X,(6,5,7),workers=workers,chunk=13,report=True)
+                self.assertEqual((p.lo,p.hi),(h.lo,h.hi))
+                self.assertEqual((r['boxes'],r['workers']),(210,workers))
+    def test_subpaving(self): # shared memory
+        s = subintervalise(X,(6,5,7))
+        y = f(s)
+        for workers in (1,2):
+            with self.subTest(workers=workers):
+                p = evaluate_parallel(f,s,workers=workers,chunk=13)
+                self.assertEqual((p.lo,p.hi),(numpy.min(y.lo),numpy.max(y.hi)))
+        s32 = I(s.lo.astype(numpy.float32),s.hi.astype(numpy.float32))
+        p = evaluate_parallel(g,s32,workers=2)
+        self.assertTrue(numpy.array_equal(p.lo,[-1.,0.]) & numpy.array_equal(p.hi,[2.,1.]))
+    def test_unsplit(self): # n of 0 or 1 evaluates the box itself
+        y = f(I(X.lo[None,:],X.hi[None,:]))
+        for n in (0,1,(0,1,1)):
+            with self.subTest(n=n):
+                p, r = evaluate_parallel(f,X,n,workers=1,report=True)
+                self.assertEqual((p.lo,p.hi,r['boxes']),(y.lo[0],y.hi[0],1))
+    def test_executor(self): # a pool reused across calls
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            a = evaluate_parallel(f,X,4,executor=pool,workers=2)
+            b = evaluate_parallel(f,subintervalise(X,4),executor=pool,workers=2)
+            c, r = evaluate_parallel(f,X,4,executor=pool,workers=1,report=True) # one worker, still on the pool
+        self.assertEqual((a.lo,a.hi),(b.lo,b.hi))
+        self.assertEqual((a.lo,a.hi),(c.lo,c.hi))
+        self.assertEqual((r['workers'],r['shards']),(1,4))
+    def test_shared(self): # a subpaving in shared memory, evaluated with two functions and not copied
+        s = subintervalise(X,(6,5,7))
+        with SharedInterval(s) as sh:
+            self.assertEqual((sh.shape,sh.dtype),((210,3),numpy.float64))
+            self.assertTrue(numpy.array_equal(sh.interval.lo,s.lo) & numpy.array_equal(sh.interval.hi,s.hi))
+            for workers in (1,2):
+                with self.subTest(workers=workers):
+                    p = evaluate_parallel(f,sh,workers=workers)
+                    self.assertEqual((p.lo,p.hi),(numpy.min(f(s).lo),numpy.max(f(s).hi)))
+                    self.assertTrue(numpy.array_equal(evaluate_parallel(g,sh,workers=workers).hi,[2.,1.]))
+        with SharedInterval((4,2)) as sh: # filled in place
+            sh.interval.lo[:], sh.interval.hi[:] = 0., numpy.arange(8).reshape(4,2)
+            p = evaluate_parallel(g,sh,workers=2)
+            self.assertTrue(numpy.array_equal(p.lo,[0.,0.]) & numpy.array_equal(p.hi,[6.,7.]))
+    def test_errors(self):
+        self.assertRaises(ValueError, evaluate_parallel, f, I(numpy.zeros((0,3)),numpy.zeros((0,3))), None, 1)
+        self.assertRaises(ValueError, evaluate_parallel, f, X, None, 1)
+
+if __name__ == '__main__':
+    unittest.main()
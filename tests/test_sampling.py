@@ -0,0 +1,59 @@
+'''
+Tests the propagation of intervals by sampling, and the coverage of the sampling methods.
+'''
+import unittest
+
+import numpy
+
+from intervals.number import Interval as I
+from intervals.methods import sin
+from intervals.sampling import (sample_range,BRUTEFORCE,samples,unit_samples,halton)
+
+def f(x, y): return x[:,0]*y - x[:,1] # x of shape (2,), y scalar
+
+X, Y = I([0.,1],[1.,2]), I(-1.,1.)
+F_RANGE = (-3.,0.) # at x=(1,2), y=-1 and at x=(1,1), y=1
+
+try: import scipy
+except ImportError: scipy = None
+
+class TestSampling(unittest.TestCase):
+    def test_range(self):
+        exact = X[0]*Y - X[1] # the interval extension, which encloses the range
+        for method in ('uniform','lhs','halton'):
+            with self.subTest(method=method):
+                r = sample_range(f, X, Y, n=20000, method=method, seed=1)
+                self.assertTrue((exact.lo <= r.lo) & (r.hi <= exact.hi))
+                self.assertTrue((F_RANGE[0] <= r.lo < F_RANGE[0]+0.25) & (F_RANGE[1]-0.25 < r.hi <= F_RANGE[1])) # the corners are seldom sampled
+    def test_chunks(self): # the chunks change the memory, not the samples
+        for method in ('uniform','lhs','halton'):
+            with self.subTest(method=method):
+                a = sample_range(f, X, Y, n=1000, method=method, seed=3)
+                b = sample_range(f, X, Y, n=1000, method=method, seed=3, chunk=77)
+                self.assertEqual((a.lo,a.hi),(b.lo,b.hi))
+    def test_shapes_and_outputs(self):
+        x = I(-numpy.ones((3,4)), numpy.ones((3,4)))
+        @BRUTEFORCE(N=500, method='lhs', seed=0)
+        def g(x, c, scale=1.): return scale*numpy.sum(x,axis=2)*c, sin(I(x[:,0,0],x[:,0,0]+0.1)) # a tuple, with an Interval output
+        s, t = g(x, numpy.arange(3.), scale=2.)
+        self.assertEqual(s.shape, (3,))
+        self.assertTrue(numpy.all(s.lo[1:] < 0) & numpy.all(s.hi[1:] > 0) & (s.lo[0] == 0) & (s.hi[0] == 0))
+        self.assertTrue(numpy.all(numpy.abs(s.hi[1:]) <= 8*numpy.arange(1,3)))
+        self.assertTrue((-1 <= t.lo) & (t.hi <= numpy.sin(1.1)))
+        p = samples(x, 7, seed=0)
+        self.assertEqual(p.shape, (7,3,4))
+        self.assertTrue(numpy.all((-1 <= p) & (p <= 1)))
+    def test_methods(self):
+        u = next(unit_samples(16, 3, method='lhs', rng=numpy.random.default_rng(0)))
+        self.assertTrue(numpy.all(numpy.sort(numpy.floor(16*u),axis=0) == numpy.arange(16)[:,None])) # one sample per stratum
+        self.assertTrue(numpy.allclose(halton(0,5,2), [[0,0],[1/2,1/3],[1/4,2/3],[3/4,1/9],[1/8,4/9]]))
+        self.assertTrue(numpy.allclose(halton(3,5,2), halton(0,5,2)[3:]))
+        self.assertRaises(ValueError, sample_range, f, X, Y, n=10, method='grid')
+        self.assertRaises(ValueError, sample_range, f, X, Y, n=0)
+    @unittest.skipIf(scipy is None, 'scipy is not installed')
+    def test_sobol(self):
+        r = sample_range(f, X, Y, n=2**12, method='sobol', seed=0)
+        self.assertTrue((F_RANGE[0] <= r.lo < F_RANGE[0]+0.25) & (F_RANGE[1]-0.25 < r.hi <= F_RANGE[1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+'''
+Tests the spatial index over subpavings against brute force.
+'''
+import unittest
+
+import numpy
+
+from intervals.number import Interval as I
+from intervals.subpaving import Subpaving
+
+def brute_force(x_lo, x_hi, y_lo, y_hi, contain=False): # the (m,n) matrix of y[j] against x[i]
+    if contain: return numpy.all((x_lo[None,:,:]<=y_lo[:,None,:]) & (y_hi[:,None,:]<=x_hi[None,:,:]),axis=2)
+    return numpy.all((x_lo[None,:,:]<=y_hi[:,None,:]) & (y_lo[:,None,:]<=x_hi[None,:,:]),axis=2)
+
+def random_boxes(n, d, w):
+    lo_ = numpy.random.rand(n,d)
+    return I(lo_,lo_+w*numpy.random.rand(n,d))
+
+class TestSubpaving(unittest.TestCase):
+    def assert_queries(self, sp, y, points):
+        x_lo, x_hi = sp.lo, sp.hi
+        for contain, query in ((False,sp.query_intersect),(True,sp.query_contain)):
+            M = brute_force(x_lo,x_hi,y.lo,y.hi,contain)
+            j,i = query(y,pairs=True)
+            j_,i_ = numpy.nonzero(M)
+            self.assertTrue(numpy.array_equal(j,j_) and numpy.array_equal(i,i_))
+            self.assertTrue(numpy.array_equal(query(y),numpy.any(M,axis=1)))
+        M = brute_force(x_lo,x_hi,points,points,True)
+        self.assertTrue(numpy.array_equal(sp.query_point(points),numpy.where(numpy.any(M,axis=1),numpy.argmax(M,axis=1),-1)))
+    def test_random(self):
+        for d in (1,2,3,5):
+            for n,m,w in [(1000,300,0.1),(1,20,1.),(40,300,0.5)]:
+                sp = Subpaving(random_boxes(n,d,w),leaf_size=4,fanout=4)
+                with self.subTest(d=d,n=n,m=m): self.assert_queries(sp,random_boxes(m,d,w),numpy.random.rand(m,d))
+    def test_one_dimension(self): # a 1-d array of intervals is a subpaving of dimension 1
+        x = I(numpy.linspace(0,1,11)[:-1],numpy.linspace(0,1,11)[1:])
+        sp = Subpaving(x)
+        self.assertEqual(sp.shape,(10,1))
+        self.assertEqual(sp.query_point(numpy.array([0.05,0.95,1.5])).tolist(),[0,9,-1])
+        self.assertEqual(sp.query_point(numpy.array([0.1])).tolist(),[0]) # on a shared face, the smallest index
+    def test_bisect(self):
+        for d in (1,2,3):
+            sp = Subpaving(random_boxes(500,d,0.2),leaf_size=8,fanout=4)
+            x0 = sp.boxes
+            volume = numpy.sum(numpy.prod(sp.hi-sp.lo,axis=1))
+            new = sp.bisect(numpy.arange(0,500,3))
+            self.assertEqual(new.tolist(),list(range(500,667)))
+            new = sp.bisect(numpy.concatenate((new[:50],[1,2])),axis=0)
+            self.assertEqual(len(sp),719)
+            self.assertTrue(numpy.isclose(numpy.sum(numpy.prod(sp.hi-sp.lo,axis=1)),volume))
+            self.assertTrue(numpy.all(sp.lo[1:3,0]==x0.lo[1:3,0]) and numpy.allclose(sp.hi[1:3,0],(x0.lo[1:3,0]+x0.hi[1:3,0])/2))
+            with self.subTest(d=d): self.assert_queries(sp,random_boxes(200,d,0.2),numpy.random.rand(200,d))
+    def test_rebuild(self): # more appended boxes than indexed ones
+        sp = Subpaving(I(numpy.zeros((1,2)),numpy.ones((1,2))),leaf_size=2,fanout=2)
+        for _ in range(8): sp.bisect(numpy.arange(len(sp)))
+        self.assertEqual(len(sp),256)
+        self.assertTrue(numpy.allclose(numpy.prod(sp.hi-sp.lo,axis=1),1/256))
+        self.assert_queries(sp,random_boxes(100,2,0.1),numpy.random.rand(100,2))
+        sp.rebuild()
+        self.assert_queries(sp,random_boxes(100,2,0.1),numpy.random.rand(100,2))
+    def test_empty_and_infinite(self):
+        sp = Subpaving(I([[0.,0],[numpy.nan,0],[-numpy.inf,2]],[[1.,1],[1,1],[0,numpy.inf]]),leaf_size=2,fanout=2)
+        y = I([[1.,1],[2,2],[-5,5],[numpy.nan,numpy.nan]],[[2.,2],[3,3],[-4,6],[numpy.nan,numpy.nan]])
+        j,i = sp.query_intersect(y,pairs=True)
+        self.assertEqual(list(zip(j.tolist(),i.tolist())),[(0,0),(2,2)])
+        self.assertEqual(sp.query_contain(y).tolist(),[False,False,True,False])
+        self.assertEqual(len(Subpaving(I(numpy.zeros((0,2)),numpy.zeros((0,2)))).query_point(numpy.zeros((3,2)))),3)
+    def test_blocks(self): # queries descending the tree a few at a time
+        sp = Subpaving(random_boxes(300,2,0.2),leaf_size=4,fanout=3)
+        y = random_boxes(100,2,0.2)
+        j,i = sp.query_intersect(y,pairs=True)
+        j_,i_ = sp.query_intersect(y,pairs=True,block=7)
+        self.assertTrue(numpy.array_equal(j,j_) and numpy.array_equal(i,i_))
+    def test_errors(self):
+        sp = Subpaving(random_boxes(10,2,0.1))
+        self.assertRaises(ValueError, sp.query_intersect, random_boxes(5,3,0.1))
+        self.assertRaises(IndexError, sp.bisect, 10)
+        self.assertRaises(ValueError, sp.bisect, [1,1])
+
+if __name__ == '__main__':
+    unittest.main()